@@ -728,6 +728,118 @@ class MultiWorld():
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+class RuleDependencies:
+    """
+    Item names and regions the access rules of a world's Entrances and Locations read while they were evaluated during
+    CollectionState.update_reachable_regions and CollectionState.sweep_for_advancements. It is learned as rules get
+    evaluated, as a single evaluation only shows what the rule read up to its result, so it is only ever added to.
+    See World.track_rule_dependencies.
+    """
+    items: Dict[str, Set[Union[Entrance, Location]]]
+    """entrances and locations by the item names their access rules read"""
+    regions: Dict[Region, Set[Union[Entrance, Location]]]
+    """entrances and locations by the regions their access rules checked reachability of"""
+    current: Optional[Union[Entrance, Location]]
+    """entrance or location whose access rule is currently being evaluated"""
+    written: Optional[Set[str]]
+    """item names written to any state of this world, while a sweep for advancements is running"""
+    reached: Optional[Set[Region]]
+    """regions that became reachable in any state of this world, while a sweep for advancements is running"""
+
+    def __init__(self) -> None:
+        self.items = {}
+        self.regions = {}
+        self.current = None
+        self.written = None
+        self.reached = None
+
+    def new_prog_items(self) -> DependencyCounter:
+        return DependencyCounter(self)
+
+    def new_reachable_regions(self) -> DependencyRegionSet:
+        return DependencyRegionSet(dependencies=self)
+
+
+class DependencyCounter(Counter):
+    """prog_items of a player that records reads into RuleDependencies and keeps track of changed item names"""
+    dependencies: RuleDependencies
+    changed: Set[str]
+    """item names written since the last update of reachable regions"""
+
+    def __init__(self, dependencies: RuleDependencies, *args, **kwargs) -> None:
+        self.dependencies = dependencies
+        self.changed = set()
+        super().__init__(*args, **kwargs)
+
+    def _read(self, item: object) -> None:
+        current = self.dependencies.current
+        if current:
+            self.dependencies.items.setdefault(item, set()).add(current)
+
+    def _write(self, item: str) -> None:
+        self.changed.add(item)
+        written = self.dependencies.written
+        if written is not None:
+            written.add(item)
+
+    def __getitem__(self, item: str) -> int:
+        current = self.dependencies.current
+        if current:
+            self.dependencies.items.setdefault(item, set()).add(current)
+        return super().__getitem__(item)
+
+    def get(self, item: str, default: Any = None) -> Any:
+        self._read(item)
+        return super().get(item, default)
+
+    def __contains__(self, item: object) -> bool:
+        self._read(item)
+        return super().__contains__(item)
+
+    def __setitem__(self, item: str, count: int) -> None:
+        self._write(item)
+        super().__setitem__(item, count)
+
+    def __delitem__(self, item: str) -> None:
+        self._write(item)
+        super().__delitem__(item)
+
+    def __reduce__(self):
+        return self.__class__, (self.dependencies, dict(self)), {"changed": self.changed}
+
+    def copy(self) -> DependencyCounter:
+        ret = self.__class__(self.dependencies, self)
+        ret.changed = self.changed.copy()
+        return ret
+
+
+class DependencyRegionSet(set):
+    """reachable_regions of a player that records reachability checks into RuleDependencies"""
+    dependencies: RuleDependencies
+
+    def __init__(self, *args, dependencies: RuleDependencies) -> None:
+        self.dependencies = dependencies
+        super().__init__(*args)
+
+    def __contains__(self, region: object) -> bool:
+        current = self.dependencies.current
+        if current:
+            self.dependencies.regions.setdefault(region, set()).add(current)
+        return super().__contains__(region)
+
+    def add(self, region: Region) -> None:
+        reached = self.dependencies.reached
+        if reached is not None:
+            reached.add(region)
+        super().add(region)
+
+    def __reduce__(self):
+        return functools.partial(self.__class__, dependencies=self.dependencies), (list(self),)
+
+    def copy(self) -> DependencyRegionSet:
+        return self.__class__(self, dependencies=self.dependencies)
+
+
 class CollectionState():
     prog_items: Dict[int, Counter[str]]
     multiworld: MultiWorld
@@ -738,32 +850,59 @@ class CollectionState():
     locations_checked: Set[Location]
     stale: Dict[int, bool]
     allow_partial_entrances: bool
+    shared_prog_items: Set[int]
+    """players whose prog_items may still be shared with another state through copy()"""
+    shared_regions: Set[int]
+    """players whose reachable_regions and blocked_connections may still be shared with another state through copy()"""
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
 
-    def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False):
+    def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False,
+                 precollected_items: Optional[Iterable[Item]] = None):
+        """
+        :param precollected_items: items to start with instead of all of parent.precollected_items
+        """
         assert parent.worlds, "CollectionState created without worlds initialized in parent"
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
+        self.prog_items = {}
         self.multiworld = parent
-        self.reachable_regions = {player: set() for player in parent.get_all_ids()}
+        self.reachable_regions = {}
+        for player in parent.get_all_ids():
+            dependencies = parent.worlds[player].rule_dependencies
+            self.prog_items[player] = dependencies.new_prog_items() if dependencies else Counter()
+            self.reachable_regions[player] = dependencies.new_reachable_regions() if dependencies else set()
         self.blocked_connections = {player: set() for player in parent.get_all_ids()}
         self.advancements = set()
         self.path = {}
         self.locations_checked = set()
         self.stale = {player: True for player in parent.get_all_ids()}
         self.allow_partial_entrances = allow_partial_entrances
+        self.shared_prog_items = set()
+        self.shared_regions = set()
         for function in self.additional_init_functions:
             function(self, parent)
-        for items in parent.precollected_items.values():
-            for item in items:
-                self.collect(item, True)
+        if precollected_items is None:
+            precollected_items = (item for items in parent.precollected_items.values() for item in items)
+        for item in precollected_items:
+            self.collect(item, True)
 
     def update_reachable_regions(self, player: int):
         self.stale[player] = False
         world: AutoWorld.World = self.multiworld.worlds[player]
+        dependencies = world.rule_dependencies
+        self._unshare_regions(player)
+        if dependencies:
+            # the changed item names get cleared below
+            self._unshare_prog_items(player)
         reachable_regions = self.reachable_regions[player]
-        queue = deque(self.blocked_connections[player])
         start: Region = world.get_region(world.origin_region_name)
+        if dependencies and start in reachable_regions:
+            # only retry the connections whose rules read an item that changed since they were last checked
+            blocked_connections = self.blocked_connections[player]
+            changed = self.prog_items[player].changed
+            queue = deque({connection for item in changed for connection in dependencies.items.get(item, ())
+                           if connection in blocked_connections})
+        else:
+            queue = deque(self.blocked_connections[player])
 
         # init on first call - this can't be done on construction since the regions don't exist yet
         if start not in reachable_regions:
@@ -771,7 +910,10 @@ class CollectionState():
             self.blocked_connections[player].update(start.exits)
             queue.extend(start.exits)
 
-        if world.explicit_indirect_conditions:
+        if dependencies:
+            self.prog_items[player].changed.clear()
+            self._update_reachable_regions_rule_dependencies(player, queue, dependencies)
+        elif world.explicit_indirect_conditions:
             self._update_reachable_regions_explicit_indirect_conditions(player, queue)
         else:
             self._update_reachable_regions_auto_indirect_conditions(player, queue)
@@ -825,21 +967,81 @@ class CollectionState():
             # sweep for indirect connections, mostly Entrance.can_reach(unrelated_Region)
             queue.extend(blocked_connections)
 
+    def _update_reachable_regions_rule_dependencies(self, player: int, queue: deque,
+                                                    dependencies: RuleDependencies):
+        reachable_regions = self.reachable_regions[player]
+        blocked_connections = self.blocked_connections[player]
+        # run BFS on all connections, and keep track of those blocked by missing items
+        while queue:
+            connection = queue.popleft()
+            new_region = connection.connected_region
+            if new_region in reachable_regions:
+                blocked_connections.remove(connection)
+                continue
+            # record what the rule reads, restoring the outer rule if this is nested in another rule
+            outer_rule = dependencies.current
+            dependencies.current = connection
+            try:
+                reachable = connection.can_reach(self)
+            finally:
+                dependencies.current = outer_rule
+            if reachable:
+                if self.allow_partial_entrances and not new_region:
+                    continue
+                assert new_region, f"tried to search through an Entrance \"{connection}\" with no connected Region"
+                reachable_regions.add(new_region)
+                blocked_connections.remove(connection)
+                blocked_connections.update(new_region.exits)
+                queue.extend(new_region.exits)
+                self.path[new_region] = (new_region.name, self.path.get(connection, None))
+
+                # Retry connections whose rules checked if the new region can be reached
+                for new_entrance in dependencies.regions.get(new_region, ()):
+                    if new_entrance in blocked_connections and new_entrance not in queue:
+                        queue.append(new_entrance)
+
     def copy(self) -> CollectionState:
-        ret = CollectionState(self.multiworld)
-        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
+        # the per player structures are shared between both states, until either of them changes a player's
+        ret.prog_items = self.prog_items.copy()
+        ret.reachable_regions = self.reachable_regions.copy()
+        ret.blocked_connections = self.blocked_connections.copy()
+        ret.shared_prog_items = set(self.prog_items)
+        ret.shared_regions = set(self.reachable_regions)
+        self.shared_prog_items.update(ret.shared_prog_items)
+        self.shared_regions.update(ret.shared_regions)
         ret.advancements = self.advancements.copy()
         ret.path = self.path.copy()
         ret.locations_checked = self.locations_checked.copy()
+        ret.stale = {player: True for player in self.stale}
         ret.allow_partial_entrances = self.allow_partial_entrances
+        for function in self.additional_init_functions:
+            function(ret, self.multiworld)
         for function in self.additional_copy_functions:
             ret = function(self, ret)
         return ret
 
+    def unshare(self, player: int) -> None:
+        """
+        Give this state its own prog_items, reachable_regions and blocked_connections of player, if they may still be
+        shared with another state through copy(). collect(), remove(), add_item() and remove_item() already do this,
+        it is only needed before changing them directly.
+        """
+        self._unshare_prog_items(player)
+        self._unshare_regions(player)
+
+    def _unshare_prog_items(self, player: int) -> None:
+        if player in self.shared_prog_items:
+            self.shared_prog_items.remove(player)
+            self.prog_items[player] = self.prog_items[player].copy()
+
+    def _unshare_regions(self, player: int) -> None:
+        if player in self.shared_regions:
+            self.shared_regions.remove(player)
+            self.reachable_regions[player] = self.reachable_regions[player].copy()
+            self.blocked_connections[player] = self.blocked_connections[player].copy()
+
     def can_reach(self,
                   spot: Union[Location, Entrance, Region, str],
                   resolution_hint: Optional[str] = None,
@@ -876,6 +1078,11 @@ class CollectionState():
         reachable_advancements = True
         # since the loop has a good chance to run more than once, only filter the advancements once
         locations = {location for location in locations if location.advancement and location not in self.advancements}
+        tracked = {player: world.rule_dependencies for player, world in self.multiworld.worlds.items()
+                   if world.rule_dependencies}
+        if tracked:
+            self._sweep_for_advancements_rule_dependencies(locations, tracked)
+            return
 
         while reachable_advancements:
             reachable_advancements = {location for location in locations if location.can_reach(self)}
@@ -885,6 +1092,52 @@ class CollectionState():
                 assert isinstance(advancement.item, Item), "tried to collect Event with no Item"
                 self.collect(advancement.item, True, advancement)
 
+    def _sweep_for_advancements_rule_dependencies(self, locations: Set[Location],
+                                                  tracked: Dict[int, RuleDependencies]) -> None:
+        # the first round checks every location, later ones only the locations of tracked players whose rules read an
+        # item name that was written or a region that became reachable in the round before
+        outer = {player: (dependencies.written, dependencies.reached) for player, dependencies in tracked.items()}
+        for dependencies in tracked.values():
+            dependencies.written = set()
+            dependencies.reached = set()
+        try:
+            checked = locations
+            while checked:
+                reachable_advancements = {location for location in checked
+                                          if self._can_reach_tracked(location, tracked.get(location.player))}
+                if not reachable_advancements:
+                    break
+                locations -= reachable_advancements
+                for advancement in reachable_advancements:
+                    self.advancements.add(advancement)
+                    assert isinstance(advancement.item, Item), "tried to collect Event with no Item"
+                    self.collect(advancement.item, True, advancement)
+
+                checked = {location for location in locations if location.player not in tracked}
+                for player, dependencies in tracked.items():
+                    if self.stale[player]:
+                        self.update_reachable_regions(player)
+                    affected = {rule for item in dependencies.written for rule in dependencies.items.get(item, ())}
+                    affected.update(rule for region in dependencies.reached
+                                    for rule in dependencies.regions.get(region, ()))
+                    dependencies.written.clear()
+                    dependencies.reached.clear()
+                    checked.update(location for location in affected if location in locations)
+        finally:
+            for player, dependencies in tracked.items():
+                dependencies.written, dependencies.reached = outer[player]
+
+    def _can_reach_tracked(self, location: Location, dependencies: Optional[RuleDependencies]) -> bool:
+        """location.can_reach(self), recording what its rule reads if its player is tracked"""
+        if not dependencies:
+            return location.can_reach(self)
+        outer_rule = dependencies.current
+        dependencies.current = location
+        try:
+            return location.can_reach(self)
+        finally:
+            dependencies.current = outer_rule
+
     # item name related
     def has(self, item: str, player: int, count: int = 1) -> bool:
         return self.prog_items[player][item] >= count
@@ -1010,6 +1263,7 @@ class CollectionState():
         if location:
             self.locations_checked.add(location)
 
+        self._unshare_prog_items(item.player)
         changed = self.multiworld.worlds[item.player].collect(self, item)
 
         self.stale[item.player] = True
@@ -1028,15 +1282,20 @@ class CollectionState():
         :param count: How many of the item to add.
         """
         assert count > 0
+        self._unshare_prog_items(player)
         self.prog_items[player][item] += count
 
-    def remove(self, item: Item):
+    def remove(self, item: Item) -> bool:
+        self._unshare_prog_items(item.player)
         changed = self.multiworld.worlds[item.player].remove(self, item)
         if changed:
             # invalidate caches, nothing can be trusted anymore now
-            self.reachable_regions[item.player] = set()
+            dependencies = self.multiworld.worlds[item.player].rule_dependencies
+            self.reachable_regions[item.player] = dependencies.new_reachable_regions() if dependencies else set()
             self.blocked_connections[item.player] = set()
+            self.shared_regions.discard(item.player)
             self.stale[item.player] = True
+        return changed
 
     def remove_item(self, item: str, player: int, count: int = 1) -> None:
         """
@@ -1047,6 +1306,7 @@ class CollectionState():
         :param count: How many of the item to remove.
         """
         assert count > 0
+        self._unshare_prog_items(player)
         self.prog_items[player][item] -= count
         if self.prog_items[player][item] < 1:
             del (self.prog_items[player][item])
@@ -1060,6 +1320,7 @@ class CollectionState():
         :param count: How many of the item to now have.
         """
         assert count >= 0
+        self._unshare_prog_items(player)
         if count == 0:
             del (self.prog_items[player][item])
         else:
@@ -1568,10 +1829,14 @@ class Spoiler:
                 {"player": player, "entrance": entrance, "exit": exit_, "direction": direction}
 
     def create_playthrough(self, create_paths: bool = True) -> None:
-        """Destructive to the multiworld while it is run, damage gets repaired afterwards."""
+        """
+        Does not modify the multiworld, so it can run alongside output generation.
+        Precollected items are culled on a copy of multiworld.state instead of being removed from the multiworld.
+        """
         from itertools import chain
         # get locations containing progress items
         multiworld = self.multiworld
+        start_state = multiworld.state.copy()
         prog_locations = {location for location in multiworld.get_filled_locations() if location.item.advancement}
         state_cache: List[Optional[CollectionState]] = [None]
         collection_spheres: List[Set[Location]] = []
@@ -1626,22 +1891,18 @@ class Spoiler:
             sphere -= to_delete
 
         # second phase, sphere 0
-        removed_precollected: List[Item] = []
+        required_precollected: List[Item] = []
 
-        for precollected_items in multiworld.precollected_items.values():
-            # The list of items is mutated by removing one item at a time to determine if each item is required to beat
-            # the game, and re-adding that item if it was required, so a copy needs to be made before iterating.
-            for item in precollected_items.copy():
-                if not item.advancement:
-                    continue
-                logging.debug('Checking if %s (Player %d) is required to beat the game.', item.name, item.player)
-                precollected_items.remove(item)
-                multiworld.state.remove(item)
-                if not multiworld.can_beat_game(multiworld.state, required_locations):
-                    # Add the item back into `precollected_items` and collect it into `multiworld.state`.
-                    multiworld.push_precollected(item)
-                else:
-                    removed_precollected.append(item)
+        for item in chain.from_iterable(multiworld.precollected_items.values()):
+            if not item.advancement:
+                required_precollected.append(item)
+                continue
+            logging.debug('Checking if %s (Player %d) is required to beat the game.', item.name, item.player)
+            start_state.remove(item)
+            if not multiworld.can_beat_game(start_state, required_locations):
+                # still required, collect it again
+                start_state.collect(item, True)
+                required_precollected.append(item)
 
         # we are now down to just the required progress items in collection_spheres. Unfortunately
         # the previous pruning stage could potentially have made certain items dependant on others
@@ -1650,7 +1911,7 @@ class Spoiler:
         # to build up the correct spheres
 
         required_locations = {item for sphere in collection_spheres for item in sphere}
-        state = CollectionState(multiworld)
+        state = CollectionState(multiworld, precollected_items=required_precollected)
         collection_spheres = []
         while required_locations:
             sphere = set(filter(state.can_reach, required_locations))
@@ -1669,8 +1930,7 @@ class Spoiler:
 
         # we can finally output our playthrough
         self.playthrough = {"0": sorted([self.multiworld.get_name_string_for_object(item) for item in
-                                         chain.from_iterable(multiworld.precollected_items.values())
-                                         if item.advancement])}
+                                         required_precollected if item.advancement])}
 
         for i, sphere in enumerate(collection_spheres):
             self.playthrough[str(i + 1)] = {
@@ -1678,10 +1938,6 @@ class Spoiler:
         if create_paths:
             self.create_paths(state, collection_spheres)
 
-        # repair the multiworld again
-        for item in removed_precollected:
-            multiworld.push_precollected(item)
-
     def create_paths(self, state: CollectionState, collection_spheres: List[Set[Location]]) -> None:
         from itertools import zip_longest
         multiworld = self.multiworld
@@ -1691,21 +1947,31 @@ class Spoiler:
                 region_or_entrance, path_value = path_value
                 yield region_or_entrance
 
+        region_paths: Dict[Region, List[Union[Tuple[str, str], Tuple[str, None]]]] = {}
+
         def get_path(state: CollectionState, region: Region) -> List[Union[Tuple[str, str], Tuple[str, None]]]:
+            # locations in the same region share their path
+            if region in region_paths:
+                return region_paths[region]
             reversed_path_as_flist: PathValue = state.path.get(region, (str(region), None))
             string_path_flat = reversed(list(map(str, flist_to_iter(reversed_path_as_flist))))
             # Now we combine the flat string list into (region, exit) pairs
             pathsiter = iter(string_path_flat)
             pathpairs = zip_longest(pathsiter, pathsiter)
-            return list(pathpairs)
+            region_paths[region] = path = list(pathpairs)
+            return path
+
+        locations_by_player: Dict[int, List[Location]] = collections.defaultdict(list)
+        for sphere in collection_spheres:
+            for location in sphere:
+                locations_by_player[location.player].append(location)
 
         self.paths = {}
         topology_worlds = (player for player in multiworld.player_ids if multiworld.worlds[player].topology_present)
         for player in topology_worlds:
             self.paths.update(
                 {str(location): get_path(state, location.parent_region)
-                 for sphere in collection_spheres for location in sphere
-                 if location.player == player})
+                 for location in locations_by_player[player]})
             if player in multiworld.get_game_players("A Link to the Past"):
                 # If Pyramid Fairy Entrance needs to be reached, also path to Big Bomb Shop
                 # Maybe move the big bomb over to the Event system instead?
@@ -247,6 +247,15 @@ class CommonContext:
                 self._archipelago_lookup.clear()
                 self._archipelago_lookup.update(id_to_name_lookup_table)
 
+        def update_game_from_table(self, game: str, id_to_name_lookup_table: typing.Mapping[int, str]) -> None:
+            """Overrides existing lookup tables for a particular game with an id -> name mapping, which is used as is,
+            so names of a cached data package are only decoded when they are looked up."""
+            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table,
+                                                          Utils.KeyedDefaultDict(self._unknown_item))
+            if game == "Archipelago":
+                self._archipelago_lookup.clear()
+                self._archipelago_lookup.update(id_to_name_lookup_table)
+
     # defaults
     starting_reconnect_delay: int = 5
     current_reconnect_delay: int = starting_reconnect_delay
@@ -317,6 +326,8 @@ class CommonContext:
     """Container of Locations that exist per server state; a combination between missing and checked locations"""
     locations_info: dict[int, NetworkItem]
     """Dict of location id: NetworkItem info from LocationScouts request"""
+    name_matchers: dict[int, Utils.FuzzyMatcher]
+    """FuzzyMatchers by id of the name collection they match against, managed by ctx.get_name_matcher"""
 
     # data storage
     stored_data: dict[str, typing.Any]
@@ -361,6 +372,7 @@ class CommonContext:
         self.checked_locations = set()  # server state
         self.server_locations = set()  # all locations the server knows of, missing_location | checked_locations
         self.locations_info = {}
+        self.name_matchers = {}
 
         self.stored_data = {}
         self.stored_data_notification_keys = set()
@@ -596,6 +608,7 @@ class CommonContext:
         relevant_games.add("Archipelago")
 
         needed_updates: typing.Set[str] = set()
+        migrated_games: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
         for game in relevant_games:
             if game not in remote_data_package_checksums:
                 continue
@@ -612,6 +625,8 @@ class CommonContext:
                 local_checksum: typing.Optional[str] = network_data_package["games"].get(game, {}).get("checksum")
                 if remote_checksum == local_checksum:
                     self.update_game(network_data_package["games"][game], game)
+                elif cached_package := Utils.load_cached_data_package(game, remote_checksum):
+                    self.update_game_from_cache(cached_package)
                 else:
                     cached_game = Utils.load_data_package_for_checksum(game, remote_checksum)
                     cache_checksum: typing.Optional[str] = cached_game.get("checksum")
@@ -620,6 +635,10 @@ class CommonContext:
                         needed_updates.add(game)
                     else:
                         self.update_game(cached_game, game)
+                        # found in the json cache of older versions
+                        migrated_games[game] = cached_game
+        if migrated_games:
+            Utils.store_data_packages_for_checksums(migrated_games)
         if needed_updates:
             await self.send_msgs([{"cmd": "GetDataPackage", "games": [game_name]} for game_name in needed_updates])
 
@@ -628,6 +647,11 @@ class CommonContext:
         self.location_names.update_game(game, game_package["location_name_to_id"])
         self.checksums[game] = game_package.get("checksum")
 
+    def update_game_from_cache(self, cached_package: Utils.CachedDataPackage):
+        self.item_names.update_game_from_table(cached_package.game, cached_package.item_names)
+        self.location_names.update_game_from_table(cached_package.game, cached_package.location_names)
+        self.checksums[cached_package.game] = cached_package.checksum
+
     def update_data_package(self, data_package: dict):
         for game, game_data in data_package["games"].items():
             self.update_game(game_data, game)
@@ -635,8 +659,15 @@ class CommonContext:
     def consume_network_data_package(self, data_package: dict):
         self.update_data_package(data_package)
         logger.info(f"Got new ID/Name DataPackage for {', '.join(data_package['games'])}")
-        for game, game_data in data_package["games"].items():
-            Utils.store_data_package_for_checksum(game, game_data)
+        Utils.store_data_packages_for_checksums(data_package["games"])
+
+    def get_name_matcher(self, names: typing.Collection[str]) -> Utils.FuzzyMatcher:
+        """Get a FuzzyMatcher for a collection of names that does not change, to look up names typed by the user in
+        repeatedly with Utils.get_intended_text."""
+        matcher = self.name_matchers.get(id(names))
+        if matcher is None or matcher.names is not names:
+            matcher = self.name_matchers[id(names)] = Utils.FuzzyMatcher(names)
+        return matcher
 
     # data storage
 
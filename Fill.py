@@ -1,4 +1,5 @@
 import collections
+import heapq
 import itertools
 import logging
 import typing
@@ -6,6 +7,7 @@ from collections import Counter, deque
 
 from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld, PlandoItemBlock
 from Options import Accessibility
+from Profiling import profiled
 
 from worlds.AutoWorld import call_all
 from worlds.generic.Rules import add_item_rule
@@ -33,6 +35,192 @@ def sweep_from_pool(base_state: CollectionState, itempool: typing.Sequence[Item]
     return new_state
 
 
+class AssumedFillState:
+    """
+    Maximum exploration state of a fill step, kept up to date across placements instead of being rebuilt from the base
+    state every time. It is the base state with the item pool collected and the filled locations swept.
+
+    Changes to the pool and to the filled locations are queued and only applied by :meth:`update`, so the state handed
+    out by the previous update stays unchanged until then. When a player loses an item, their swept locations are
+    checked again in the order they were swept, each with only the items the player had received before it. Locations
+    that fail are un-collected and the players receiving their items are checked in turn, the rest is kept as is. Like
+    the reachable region cache of CollectionState, this assumes access rules only look at their own player.
+    If an item of a world without World.incremental_fill has to be un-collected, the state is rebuilt instead.
+    """
+    base_state: CollectionState
+    state: CollectionState
+    player: typing.Optional[int]
+    pool: typing.Dict[int, Item]
+    """items assumed to be collectable, by id as items compare equal by name and player"""
+    swept: typing.Dict[int, typing.Dict[Location, Item]]
+    """advancements collected by this sweep by location player, with the item that was collected from them"""
+    received: typing.Dict[int, typing.Dict[Location, Item]]
+    """the same advancements by item player"""
+    sequence: typing.Dict[Location, int]
+    """order in which the swept advancements were collected"""
+    counter: typing.Iterator[int]
+    unswept: typing.Set[Location]
+    """filled advancement locations that could not be reached yet"""
+    pending: typing.List[typing.Tuple[typing.Callable[..., bool], typing.Tuple[typing.Any, ...]]]
+    """queued changes, as unbound methods so they can be carried over into a copy"""
+
+    def __init__(self, base_state: CollectionState, item_pool: typing.Iterable[Item] = tuple(),
+                 player: typing.Optional[int] = None):
+        """
+        :param base_state: State assumed before fill, is not modified.
+        :param item_pool: Items assumed to be collectable.
+        :param player: if set, only locations of this player are swept, see single_player_placement
+        """
+        self.base_state = base_state
+        self.player = player
+        self.pool = {id(item): item for item in item_pool}
+        self.pending = []
+        self.counter = itertools.count()
+        self._build()
+
+    def copy(self) -> "AssumedFillState":
+        ret = self.__class__.__new__(self.__class__)
+        ret.base_state = self.base_state
+        ret.state = self.state.copy()
+        ret.player = self.player
+        ret.pool = self.pool.copy()
+        ret.swept = {player: locations.copy() for player, locations in self.swept.items()}
+        ret.received = {player: locations.copy() for player, locations in self.received.items()}
+        ret.sequence = self.sequence.copy()
+        ret.counter = self.counter
+        ret.unswept = self.unswept.copy()
+        ret.pending = self.pending.copy()
+        return ret
+
+    def collect(self, item: Item) -> None:
+        """Queue an item being added to the pool."""
+        self.pool[id(item)] = item
+        self.pending.append((AssumedFillState._collect, (item,)))
+
+    def remove(self, item: Item) -> None:
+        """Queue an item being taken out of the pool."""
+        del self.pool[id(item)]
+        self.pending.append((AssumedFillState._remove, (item,)))
+
+    def place(self, location: Location) -> None:
+        """Queue a location having been filled."""
+        self.pending.append((AssumedFillState._place, (location,)))
+
+    def unplace(self, location: Location, item: Item) -> None:
+        """Queue item having been taken out of location."""
+        self.pending.append((AssumedFillState._unplace, (location, item)))
+
+    def update(self) -> CollectionState:
+        """Apply all queued changes and sweep, returns the resulting state."""
+        for function, args in self.pending:
+            if not function(self, *args):
+                self._build()
+                break
+        else:
+            self._sweep()
+        self.pending.clear()
+        return self.state
+
+    def _build(self) -> None:
+        self.state = self.base_state.copy()
+        self.swept = {}
+        self.received = {}
+        self.sequence = {}
+        for item in self.pool.values():
+            self.state.collect(item, True)
+        self.unswept = {location for location in self.base_state.multiworld.get_filled_locations(self.player)
+                        if location.advancement and location not in self.state.advancements}
+        self._sweep()
+
+    # the following return False if the state can't be updated incrementally and has to be rebuilt instead
+    def _collect(self, item: Item) -> bool:
+        self.state.collect(item, True)
+        return True
+
+    def _remove(self, item: Item) -> bool:
+        return self._uncollect(item)
+
+    def _place(self, location: Location) -> bool:
+        if location.advancement and (self.player is None or location.player == self.player) \
+                and location not in self.state.advancements:
+            self.unswept.add(location)
+        return True
+
+    def _unplace(self, location: Location, item: Item) -> bool:
+        self.unswept.discard(location)
+        swept = self.swept.get(location.player)
+        if swept and location in swept:
+            del swept[location]
+            del self.received[item.player][location]
+            del self.sequence[location]
+            self.state.advancements.discard(location)
+            self.state.locations_checked.discard(location)
+            return self._uncollect(item)
+        return True
+
+    def _uncollect(self, item: Item) -> bool:
+        """Remove item from state, and everything swept that can no longer be reached because of that."""
+        state = self.state
+        worlds = state.multiworld.worlds
+        players = [item.player] if state.remove(item) else []
+        while players:
+            player = players.pop()
+            if not worlds[player].incremental_fill:
+                return False
+            for location in self._unreachable(player):
+                swept_item = self.swept[player].pop(location)
+                del self.received[swept_item.player][location]
+                del self.sequence[location]
+                state.advancements.discard(location)
+                state.locations_checked.discard(location)
+                if location.item is swept_item:
+                    self.unswept.add(location)
+                # items for player itself are already left out by _unreachable
+                if swept_item.player != player and state.remove(swept_item):
+                    players.append(swept_item.player)
+        return True
+
+    def _unreachable(self, player: int) -> typing.List[Location]:
+        """
+        Re-check the swept locations of player in the order they were swept, each with only the items player received
+        from sweeping before it. Returns the ones that can't be reached anymore, items player received from those stay
+        removed from state.
+        """
+        state = self.state
+        swept = self.swept.get(player)
+        if not swept:
+            return []
+        received = self.received.get(player, {})
+        for item in received.values():
+            state.remove(item)
+        unreachable: typing.List[Location] = []
+        sequence = self.sequence
+        # locations and items of the same sweep step sort location first, so it is checked without its own item
+        for _, is_item, location in heapq.merge(((sequence[location], False, location) for location in swept),
+                                                ((sequence[location], True, location) for location in received)):
+            if not is_item:
+                if not location.can_reach(state):
+                    unreachable.append(location)
+            elif not unreachable or unreachable[-1] is not location:
+                state.collect(received[location], True, location)
+        return unreachable
+
+    def _sweep(self) -> None:
+        state = self.state
+        locations = self.unswept
+        reachable_advancements = True
+        while reachable_advancements:
+            reachable_advancements = {location for location in locations if location.can_reach(state)}
+            locations -= reachable_advancements
+            for advancement in reachable_advancements:
+                state.advancements.add(advancement)
+                self.swept.setdefault(advancement.player, {})[advancement] = advancement.item
+                self.received.setdefault(advancement.item.player, {})[advancement] = advancement.item
+                self.sequence[advancement] = next(self.counter)
+                state.collect(advancement.item, True, advancement)
+
+
+@profiled
 def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locations: typing.List[Location],
                      item_pool: typing.List[Item], single_player_placement: bool = False, lock: bool = False,
                      swap: bool = True, on_place: typing.Optional[typing.Callable[[Location], None]] = None,
@@ -63,6 +251,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     total = min(len(item_pool), len(locations))
     placed = 0
 
+    fill_state: typing.Optional[AssumedFillState] = None
+
     while any(reachable_items.values()) and locations:
         if one_item_per_player:
             # grab one item per player
@@ -81,10 +271,13 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                 if pool_item is item:
                     del item_pool[-p]
                     break
+            if fill_state:
+                fill_state.remove(item)
 
-        maximum_exploration_state = sweep_from_pool(
-            base_state, item_pool + unplaced_items, multiworld.get_filled_locations(item.player)
-            if single_player_placement else None)
+        sweep_player = item.player if single_player_placement else None
+        if not fill_state or fill_state.player != sweep_player:
+            fill_state = AssumedFillState(base_state, item_pool + unplaced_items, sweep_player)
+        maximum_exploration_state = fill_state.update()
 
         has_beaten_game = multiworld.has_beaten_game(maximum_exploration_state)
 
@@ -92,6 +285,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             # if we have run out of locations to fill,break out of this loop
             if not locations:
                 unplaced_items += items_to_place
+                for item_to_place in items_to_place:
+                    fill_state.collect(item_to_place)
                 break
             item_to_place = items_to_place.pop(0)
 
@@ -130,9 +325,13 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
 
                         location.item = None
                         placed_item.location = None
-                        swap_state = sweep_from_pool(base_state, [placed_item, *item_pool] if unsafe else item_pool,
-                                                     multiworld.get_filled_locations(item.player)
-                                                     if single_player_placement else None)
+                        swap_fill_state = fill_state.copy()
+                        for unplaced_item in unplaced_items:
+                            swap_fill_state.remove(unplaced_item)
+                        swap_fill_state.unplace(location, placed_item)
+                        if unsafe:
+                            swap_fill_state.collect(placed_item)
+                        swap_state = swap_fill_state.update()
                         # unsafe means swap_state assumes we can somehow collect placed_item before item_to_place
                         # by continuing to swap, which is not guaranteed. This is unsafe because there is no mechanic
                         # to clean that up later, so there is a chance generation fails.
@@ -148,6 +347,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                             reachable_items[placed_item.player].appendleft(
                                 placed_item)
                             item_pool.append(placed_item)
+                            fill_state.collect(placed_item)
+                            fill_state.unplace(location, placed_item)
 
                             # cleanup at the end to hopefully get better errors
                             cleanup_required = True
@@ -161,11 +362,14 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                     if spot_to_fill is None:
                         # Can't place this item, move on to the next
                         unplaced_items.append(item_to_place)
+                        fill_state.collect(item_to_place)
                         continue
                 else:
                     unplaced_items.append(item_to_place)
+                    fill_state.collect(item_to_place)
                     continue
             multiworld.push_item(spot_to_fill, item_to_place, False)
+            fill_state.place(spot_to_fill)
             spot_to_fill.locked = lock
             placements.append(spot_to_fill)
             placed += 1
@@ -222,6 +426,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     item_pool.extend(unplaced_items)
 
 
+@profiled
 def remaining_fill(multiworld: MultiWorld,
                    locations: typing.List[Location],
                    itempool: typing.List[Item],
@@ -51,6 +51,9 @@ def mystery_argparse():
                         help="List of options that can be set manually. Can be combined, for example \"bosses, items\"")
     parser.add_argument("--skip_prog_balancing", action="store_true",
                         help="Skip progression balancing step during generation.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Writes a report of the time spent per world, stage, fill step and access rule "
+                             "next to the output.")
     parser.add_argument("--skip_output", action="store_true",
                         help="Skips generation assertion and output stages and skips multidata and spoiler output. "
                              "Intended for debugging and testing purposes.")
@@ -175,6 +178,7 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     erargs.outputname = seed_name
     erargs.outputpath = args.outputpath
     erargs.skip_prog_balancing = args.skip_prog_balancing
+    erargs.profile = args.profile
     erargs.skip_output = args.skip_output
     erargs.spoiler_only = args.spoiler_only
     erargs.name = {}
@@ -581,6 +585,8 @@ def roll_alttp_settings(ret: argparse.Namespace, weights):
 
 
 if __name__ == '__main__':
+    # only load the worlds of the games that are played
+    os.environ.setdefault("MULTIWORLDGG_LAZY_WORLDS", "1")
     import atexit
     confirmation = atexit.register(input, "Press enter to close.")
     erargs, seed = main()
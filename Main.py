@@ -2,18 +2,17 @@ import collections
 import concurrent.futures
 import logging
 import os
-import pickle
 import tempfile
 import time
 import zipfile
-import zlib
 
+import Profiling
 import worlds
 from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld
 from Fill import FillError, balance_multiworld_progression, distribute_items_restrictive, flood_items, \
     parse_planned_blocks, distribute_planned_blocks, resolve_early_locations_for_planned
 from Options import StartInventoryPool
-from Utils import __version__, output_path, version_tuple, instance_name
+from Utils import __version__, dump_compressed, output_path, version_tuple, instance_name
 from settings import get_settings
 from worlds import AutoWorld
 from worlds.generic.Rules import exclusion_rules, locality_rules
@@ -22,9 +21,29 @@ __all__ = ["main"]
 
 
 def main(args, seed=None, baked_server_options: dict[str, object] | None = None):
+    if not getattr(args, "profile", False):
+        return _main(args, seed, baked_server_options)
+
+    profile = Profiling.GenerationProfile()
+    try:
+        with profile:
+            return _main(args, seed, baked_server_options)
+    finally:
+        # also written when generation fails, as that is often where the time went
+        if profile.multiworld:
+            report_path = output_path(f"AP_{profile.multiworld.seed_name}_Profile")
+            logging.info(f"Writing generation profile to {report_path}.html")
+            profile.write(report_path)
+
+
+def _main(args, seed=None, baked_server_options: dict[str, object] | None = None):
     if not baked_server_options:
         baked_server_options = get_settings().server_options.as_dict()
     assert isinstance(baked_server_options, dict)
+    multidata_compression = get_settings().generator.multidata_compression
+    if not -1 <= multidata_compression <= 9:
+        raise ValueError(f"generator.multidata_compression has to be a zlib compression level from -1 to 9, "
+                         f"not {multidata_compression}.")
     if args.outputpath:
         os.makedirs(args.outputpath, exist_ok=True)
         output_path.cached_path = args.outputpath
@@ -35,6 +54,8 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
 
     logger = logging.getLogger()
     multiworld.set_seed(seed, args.race, str(args.outputname) if args.outputname else None)
+    if Profiling.current:
+        Profiling.current.multiworld = multiworld
     multiworld.plando_options = args.plando_options
     multiworld.game = args.game.copy()
     multiworld.player_name = args.name.copy()
@@ -49,13 +70,15 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     multiworld.state = CollectionState(multiworld)
     logger.info('%s Version %s  -  Seed: %s\n', instance_name, __version__, multiworld.seed)
 
-    logger.info(f"Found {len(AutoWorld.AutoWorldRegister.world_types)} World Types:")
-    longest_name = max(len(text) for text in AutoWorld.AutoWorldRegister.world_types)
+    # with lazy world loading, only the worlds used by this multiworld are listed
+    world_types = worlds.loaded_world_types()
+    logger.info(f"Found {len(world_types)} World Types:")
+    longest_name = max(len(text) for text in world_types)
 
-    item_count = len(str(max(len(cls.item_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
-    location_count = len(str(max(len(cls.location_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
+    item_count = len(str(max(len(cls.item_names) for cls in world_types.values())))
+    location_count = len(str(max(len(cls.location_names) for cls in world_types.values())))
 
-    for name, cls in AutoWorld.AutoWorldRegister.world_types.items():
+    for name, cls in world_types.items():
         if not cls.hidden and len(cls.item_names) > 0:
             logger.info(f" {name:{longest_name}}: Items: {len(cls.item_names):{item_count}} | "
                         f"Locations: {len(cls.location_names):{location_count}}")
@@ -177,9 +200,10 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
         multiworld._all_state = None
 
     logger.info("Running Item Plando.")
-    resolve_early_locations_for_planned(multiworld)
-    distribute_planned_blocks(multiworld, [x for player in multiworld.plando_item_blocks
-                                           for x in multiworld.plando_item_blocks[player]])
+    with Profiling.step("item plando"):
+        resolve_early_locations_for_planned(multiworld)
+        distribute_planned_blocks(multiworld, [x for player in multiworld.plando_item_blocks
+                                               for x in multiworld.plando_item_blocks[player]])
 
     logger.info('Running Pre Main Fill.')
 
@@ -187,15 +211,17 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
 
     logger.info(f'Filling the multiworld with {len(multiworld.itempool)} items.')
 
-    if multiworld.algorithm == 'flood':
-        flood_items(multiworld)  # different algo, biased towards early game progress items
-    elif multiworld.algorithm == 'balanced':
-        distribute_items_restrictive(multiworld, get_settings().generator.panic_method)
+    with Profiling.step("fill"):
+        if multiworld.algorithm == 'flood':
+            flood_items(multiworld)  # different algo, biased towards early game progress items
+        elif multiworld.algorithm == 'balanced':
+            distribute_items_restrictive(multiworld, get_settings().generator.panic_method)
 
     AutoWorld.call_all(multiworld, 'post_fill')
 
     if multiworld.players > 1 and not args.skip_prog_balancing:
-        balance_multiworld_progression(multiworld)
+        with Profiling.step("progression balancing"):
+            balance_multiworld_progression(multiworld)
     else:
         logger.info("Progression balancing skipped.")
 
@@ -212,9 +238,11 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     if args.spoiler_only:
         if args.spoiler > 1:
             logger.info('Calculating playthrough.')
-            multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
+            with Profiling.step("spoiler playthrough"):
+                multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
 
-        multiworld.spoiler.to_file(output_path('%s_Spoiler.txt' % outfilebase))
+        with Profiling.step("spoiler"):
+            multiworld.spoiler.to_file(output_path('%s_Spoiler.txt' % outfilebase))
         logger.info('Done. Skipped multidata modification. Total time: %s', time.perf_counter() - start)
         return multiworld
 
@@ -222,8 +250,14 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     with output as temp_dir:
         output_players = [player for player in multiworld.player_ids if AutoWorld.World.generate_output.__code__
                           is not multiworld.worlds[player].generate_output.__code__]
-        with concurrent.futures.ThreadPoolExecutor(len(output_players) + 2) as pool:
-            check_accessibility_task = pool.submit(multiworld.fulfills_accessibility)
+        with concurrent.futures.ThreadPoolExecutor(len(output_players) + 3) as pool:
+            check_accessibility_task = pool.submit(
+                Profiling.step("accessibility check")(multiworld.fulfills_accessibility))
+            if args.spoiler > 1:
+                # does not modify the multiworld, so it can run alongside output generation
+                logger.info('Calculating playthrough.')
+                playthrough_task = pool.submit(Profiling.step("spoiler playthrough")(
+                    multiworld.spoiler.create_playthrough), create_paths=args.spoiler > 2)
 
             output_file_futures = [pool.submit(AutoWorld.call_stage, multiworld, "generate_output", temp_dir)]
             for player in output_players:
@@ -235,6 +269,7 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
             er_hint_data: dict[int, dict[int, str]] = {}
             AutoWorld.call_all(multiworld, 'extend_hint_information', er_hint_data)
 
+            @Profiling.step("multidata")
             def write_multidata():
                 import NetUtils
                 from NetUtils import HintStatus
@@ -334,11 +369,10 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
                 }
                 AutoWorld.call_all(multiworld, "modify_multidata", multidata)
 
-                multidata = zlib.compress(pickle.dumps(multidata), 9)
-
+                # pickled straight into the compressor, so neither the pickle nor its compression is held in memory
                 with open(os.path.join(temp_dir, f'{outfilebase}.archipelago'), 'wb') as f:
                     f.write(bytes([3]))  # version of format
-                    f.write(multidata)
+                    dump_compressed(multidata, f, multidata_compression)
 
             output_file_futures.append(pool.submit(write_multidata))
             if not check_accessibility_task.result():
@@ -353,19 +387,21 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
                     logger.info(f'Generating output files ({i}/{len(output_file_futures)}).')
                 future.result()
 
-        if args.spoiler > 1:
-            logger.info('Calculating playthrough.')
-            multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
+            if args.spoiler > 1:
+                playthrough_task.result()
 
         if args.spoiler:
-            multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
+            with Profiling.step("spoiler"):
+                multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
 
         zipfilename = output_path(f"AP_{multiworld.seed_name}.zip")
         logger.info(f"Creating final archive at {zipfilename}")
-        with zipfile.ZipFile(zipfilename, mode="w", compression=zipfile.ZIP_DEFLATED,
-                             compresslevel=9) as zf:
+        with Profiling.step("archive"), zipfile.ZipFile(zipfilename, mode="w", compression=zipfile.ZIP_DEFLATED,
+                                                         compresslevel=9) as zf:
             for file in os.scandir(temp_dir):
-                zf.write(file.path, arcname=file.name)
+                # multidata is already compressed, deflating it again only takes time
+                zf.write(file.path, arcname=file.name,
+                         compress_type=zipfile.ZIP_STORED if file.name.endswith(".archipelago") else None)
 
     logger.info('Done. Enjoy. Total Time: %s', time.perf_counter() - start)
     return multiworld
@@ -9,13 +9,17 @@ import datetime
 import functools
 import hashlib
 import inspect
+import io
 import itertools
 import logging
 import math
 import operator
+import os
 import pickle
+import queue
 import random
 import shlex
+import struct
 import threading
 import time
 import typing
@@ -168,6 +172,209 @@ class Client(Endpoint):
 team_slot = typing.Tuple[int, int]
 
 
+class SaveJournal:
+    """
+    Append-only log of changes to a Context's save data since its last snapshot, so saving does not have to write
+    all of it every time. Each write appends a record of its length followed by a pickled list of
+    (attribute, key, value) events. A record cut short by a crash is dropped when the journal is read.
+
+    Records are pickled on the event loop by append() and written to the file by the save thread with write_queued(),
+    so the event loop does not wait for the file. Records of changes made while a snapshot is being written are held
+    back until the snapshot replaced the journal, records from before are dropped with the journal then.
+    """
+    record_header = struct.Struct("<I")
+    minimum_compaction_size = 1024 * 1024
+    """journal size in bytes that has to be exceeded before compacting into a snapshot"""
+
+    filename: str
+    size: int
+    compaction_size: int
+    """the journal gets compacted into a snapshot once it grows larger than this, at least the size of the snapshot"""
+    lock: threading.Lock
+    """held while writing to the journal or replacing it with a snapshot"""
+    snapshot_lock: threading.Lock
+    """held while a snapshot is written"""
+    records: "queue.SimpleQueue[typing.Tuple[int, bytes]]"
+    """records that still have to be written, with the generation they were appended in"""
+    held: typing.List[typing.Tuple[int, bytes]]
+    """records appended since the snapshot being written was started"""
+    generation: int
+    """number of snapshots started"""
+    written_generation: int
+    """records of later generations are held back"""
+    dropped_generation: int
+    """records of earlier generations are contained in the snapshot and dropped"""
+    changed: typing.Set[typing.Tuple[str, typing.Any]]
+    """attribute name and key of changed values that still have to be written"""
+    new_checks: typing.Dict[team_slot, typing.Set[int]]
+    """location checks that still have to be written"""
+    new_items: typing.Dict[typing.Tuple[int, int, bool], int]
+    """index of the first received item that still has to be written, by received_items key"""
+
+    def __init__(self, filename: str, snapshot_size: int = 0):
+        self.filename = filename
+        self.size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        self.compaction_size = max(self.minimum_compaction_size, snapshot_size)
+        self.lock = threading.Lock()
+        self.snapshot_lock = threading.Lock()
+        self.records = queue.SimpleQueue()
+        self.held = []
+        self.generation = self.written_generation = self.dropped_generation = 0
+        self.changed = set()
+        self.new_checks = collections.defaultdict(set)
+        self.new_items = {}
+
+    def read(self) -> typing.List[typing.Tuple[str, typing.Any, typing.Any]]:
+        """Read all complete records and cut off an incomplete one, so that new records can be appended."""
+        try:
+            with open(self.filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        events = []
+        position = 0
+        header_size = self.record_header.size
+        while position + header_size <= len(data):
+            length, = self.record_header.unpack_from(data, position)
+            if position + header_size + length > len(data):
+                break
+            events += restricted_loads(data[position + header_size:position + header_size + length])
+            position += header_size + length
+        if position < len(data):
+            with open(self.filename, "r+b") as f:
+                f.truncate(position)
+        self.size = position
+        return events
+
+    def append(self, events: typing.List[typing.Tuple[str, typing.Any, typing.Any]]) -> None:
+        """Queue a record of events to be written by write_queued."""
+        self.records.put((self.generation, pickle.dumps(events)))
+
+    def write_queued(self, timeout: float = 0) -> None:
+        """Write the queued records, waiting up to timeout seconds for one if there are none."""
+        try:
+            records = [self.records.get(timeout=timeout) if timeout > 0 else self.records.get_nowait()]
+        except queue.Empty:
+            return
+        with contextlib.suppress(queue.Empty):
+            while True:
+                records.append(self.records.get_nowait())
+        with self.lock:
+            self._write(records)
+
+    def _write(self, records: typing.Iterable[typing.Tuple[int, bytes]]) -> None:
+        data = bytearray()
+        for generation, record in records:
+            if generation < self.dropped_generation:
+                continue
+            if generation > self.written_generation:
+                self.held.append((generation, record))
+                continue
+            data += self.record_header.pack(len(record))
+            data += record
+        if data:
+            with open(self.filename, "ab") as f:
+                f.write(data)
+            self.size += len(data)
+
+    def begin_snapshot(self) -> int:
+        """
+        Write the queued records and start a new generation for the changes after the snapshot, returns it.
+        The pending changes are dropped, the snapshot contains them.
+        """
+        self.write_queued()
+        with self.lock:
+            self.generation += 1
+            self.take_pending()
+            return self.generation
+
+    def replace_with_snapshot(self, generation: int, temporary_filename: str, filename: str,
+                              snapshot_size: int) -> None:
+        """Replace the snapshot at filename with the complete one at temporary_filename and empty the journal."""
+        with self.lock:
+            os.replace(temporary_filename, filename)
+            with open(self.filename, "wb"):
+                pass
+            self.size = 0
+            self.compaction_size = max(self.minimum_compaction_size, snapshot_size)
+            self.dropped_generation = generation
+            self._end_snapshot(generation)
+
+    def abort_snapshot(self, generation: int) -> None:
+        """Keep the journal after writing a snapshot failed."""
+        with self.lock:
+            self._end_snapshot(generation)
+
+    def _end_snapshot(self, generation: int) -> None:
+        self.written_generation = generation
+        held, self.held = self.held, []
+        self._write(held)
+
+    def take_pending(self) -> typing.Tuple[typing.Set[typing.Tuple[str, typing.Any]],
+                                           typing.Dict[team_slot, typing.Set[int]],
+                                           typing.Dict[typing.Tuple[int, int, bool], int]]:
+        """Return the changes that still have to be written and start collecting new ones."""
+        pending = self.changed, self.new_checks, self.new_items
+        self.changed = set()
+        self.new_checks = collections.defaultdict(set)
+        self.new_items = {}
+        return pending
+
+
+class DataPackageCache:
+    """
+    Encoded data packages of single games by checksum, shared by all Contexts of a process, so that GetDataPackage
+    does not encode the same data again for every client of every room. Least recently used entries are dropped once
+    the encoded data packages exceed max_size.
+    """
+    max_size: int
+    """bytes of encoded data packages to keep"""
+    size: int
+    hits: int
+    misses: int
+    bytes_saved: int
+    """bytes of encoded data packages that were served from the cache instead of being encoded again"""
+    lock: threading.Lock
+    encoded: typing.OrderedDict[str, typing.Tuple[str, int]]
+    """encoded data package and its size in bytes by checksum"""
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.lock = threading.Lock()
+        self.encoded = collections.OrderedDict()
+
+    def get(self, game_package: typing.Dict[str, typing.Any], dumper: typing.Callable[[typing.Any], str]) -> str:
+        """Return game_package encoded with dumper, which has to be the same for all uses of the cache."""
+        checksum = game_package.get("checksum", None)
+        if checksum is None:
+            return dumper(game_package)  # old data packages without checksum can't be told apart
+        with self.lock:
+            if checksum in self.encoded:
+                self.encoded.move_to_end(checksum)
+                encoded, size = self.encoded[checksum]
+                self.hits += 1
+                self.bytes_saved += size
+                return encoded
+        encoded = dumper(game_package)
+        size = len(encoded.encode("utf-8"))
+        with self.lock:
+            self.misses += 1
+            if size <= self.max_size and checksum not in self.encoded:
+                self.encoded[checksum] = encoded, size
+                self.size += size
+                while self.size > self.max_size:
+                    _, (_, evicted_size) = self.encoded.popitem(last=False)
+                    self.size -= evicted_size
+        return encoded
+
+
+data_package_cache = DataPackageCache()
+
+
 class Context:
     dumper = staticmethod(encode)
     loader = staticmethod(decode)
@@ -205,6 +412,8 @@ class Context:
     spheres: typing.List[typing.Dict[int, typing.Set[int]]]
     """ each sphere is { player: { location_id, ... } } """
     logger: logging.Logger
+    lazy_game_data: bool = False
+    """only the game data of the games in the multidata gets loaded from worlds"""
 
     def __init__(self, host: str, port: int, server_password: str, password: str, location_check_points: int,
                  hint_cost: int, item_cheat: bool, release_mode: str = "disabled", collect_mode="disabled",
@@ -232,6 +441,7 @@ class Context:
         self.server = None
         self.countdown_timer = 0
         self.received_items = {}
+        self.new_item_receivers: typing.Set[team_slot] = set()  # received items not sent to their clients yet
         self.start_inventory = {}
         self.name_aliases: typing.Dict[team_slot, str] = {}
         self.location_checks = collections.defaultdict(set)
@@ -239,6 +449,9 @@ class Context:
         self.location_check_points = location_check_points
         self.hints_used = collections.defaultdict(int)
         self.hints: typing.Dict[team_slot, typing.Set[Hint]] = collections.defaultdict(set)
+        # (team, finding_player, location) -> current version of the hints for that location
+        self.location_hints: typing.Dict[typing.Tuple[int, int, int], typing.Set[Hint]] = \
+            collections.defaultdict(set)
         self.release_mode: str = release_mode
         self.remaining_mode: str = remaining_mode
         self.collect_mode: str = collect_mode
@@ -257,6 +470,7 @@ class Context:
         self.auto_save_interval = 60  # in seconds
         self.auto_saver_thread: typing.Optional[threading.Thread] = None
         self.save_dirty = False
+        self.save_journal: typing.Optional[SaveJournal] = None
         self.tags = ['AP']
         self.games: typing.Dict[int, str] = {}
         self.minimum_client_versions: typing.Dict[int, Version] = {}
@@ -281,27 +495,30 @@ class Context:
         self.location_names = collections.defaultdict(
             lambda: Utils.KeyedDefaultDict(lambda code: f'Unknown location (ID:{code})'))
         self.non_hintable_names = collections.defaultdict(frozenset)
+        self.name_matchers: typing.Dict[int, Utils.FuzzyMatcher] = {}
 
         self._load_game_data()
 
     # Data package retrieval
     def _load_game_data(self):
         import worlds
-        self.gamespackage = worlds.network_data_package["games"]
-
-        self.item_name_groups = {world_name: world.item_name_groups for world_name, world in
-                                 worlds.AutoWorldRegister.world_types.items()}
-        self.location_name_groups = {world_name: world.location_name_groups for world_name, world in
-                                     worlds.AutoWorldRegister.world_types.items()}
-        for world_name, world in worlds.AutoWorldRegister.world_types.items():
-            self.non_hintable_names[world_name] = world.hint_blacklist
-
-        for game_package in self.gamespackage.values():
-            # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+        # with lazy world loading, only the worlds of the games in the multidata get loaded, by _load
+        self.lazy_game_data = worlds.lazy_loading
+        games = ("Archipelago",) if self.lazy_game_data else worlds.network_data_package["games"]
+        for game in games:
+            self._load_world_game_data(game)
+
+    def _load_world_game_data(self, game: str):
+        # from the data package store if possible, which does not need to import the world
+        import worlds
+        game_package = self.gamespackage[game] = worlds.network_data_package["games"][game].copy()
+        # remove groups from data sent to clients
+        self.item_name_groups[game] = game_package.pop("item_name_groups")
+        self.location_name_groups[game] = game_package.pop("location_name_groups")
+        self.non_hintable_names[game] = worlds.get_hint_blacklist(game)
 
     def _init_game_data(self):
+        self.name_matchers.clear()
         for game_name, game_package in self.gamespackage.items():
             if "checksum" in game_package:
                 self.checksums[game_name] = game_package["checksum"]
@@ -321,12 +538,25 @@ class Context:
             self.item_names[game].update(archipelago_item_names)
             self.location_names[game].update(archipelago_location_names)
 
+    def get_name_matcher(self, names: typing.Collection[str]) -> Utils.FuzzyMatcher:
+        """Matcher for a collection of game data names, kept for the commands that look up names repeatedly."""
+        matcher = self.name_matchers.get(id(names))
+        if matcher is None or matcher.names is not names:
+            matcher = self.name_matchers[id(names)] = Utils.FuzzyMatcher(names)
+        return matcher
+
     def item_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["item_name_to_id"] if game in self.gamespackage else None
 
     def location_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["location_name_to_id"] if game in self.gamespackage else None
 
+    def encode_data_package(self, games: typing.Dict[str, typing.Dict[str, typing.Any]]) -> str:
+        """Encode a DataPackage message for games, the same as dumper would, reusing games encoded before."""
+        encoded_games = ",".join(f"{self.dumper(game)}:{data_package_cache.get(game_data, self.dumper)}"
+                                 for game, game_data in games.items())
+        return f'[{{"cmd":"DataPackage","data":{{"games":{{{encoded_games}}}}}}}]'
+
     # General networking
     async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
@@ -427,23 +657,29 @@ class Context:
             with zipfile.ZipFile(multidatapath) as zf:
                 for file in zf.namelist():
                     if file.endswith(".archipelago"):
-                        data = zf.read(file)
+                        with zf.open(file) as f:
+                            decoded_obj = self.read_multidata(f)
                         break
                 else:
                     raise Exception("No .archipelago found in archive.")
         else:
             with open(multidatapath, 'rb') as f:
-                data = f.read()
+                decoded_obj = self.read_multidata(f)
 
-        self._load(self.decompress(data), {}, use_embedded_server_options)
+        self._load(decoded_obj, {}, use_embedded_server_options)
         self.data_filename = multidatapath
 
     @staticmethod
     def decompress(data: bytes) -> dict:
-        format_version = data[0]
+        return Context.read_multidata(io.BytesIO(data))
+
+    @staticmethod
+    def read_multidata(file: typing.BinaryIO) -> dict:
+        """Reads multidata from file, decompressing it while it gets unpickled instead of all at once."""
+        format_version = file.read(1)[0]
         if format_version > 3:
             raise Utils.VersionException("Incompatible multidata.")
-        return restricted_loads(zlib.decompress(data[1:]))
+        return Utils.load_compressed(file)
 
     def _load(self, decoded_obj: dict, game_data_packages: typing.Dict[str, typing.Any],
               use_embedded_server_options: bool):
@@ -500,6 +736,7 @@ class Context:
 
         for slot, hints in decoded_obj["precollected_hints"].items():
             self.hints[0, slot].update(hints)
+        self.index_hints()
 
         # declare slots that aren't players as done
         for slot, slot_info in self.slot_info.items():
@@ -511,6 +748,12 @@ class Context:
             server_options = decoded_obj.get("server_options", {})
             self._set_options(server_options)
 
+        if self.lazy_game_data:
+            import worlds
+            for game_name in sorted(set(self.games.values()) - self.gamespackage.keys()):
+                if game_name in worlds.network_data_package["games"]:
+                    self._load_world_game_data(game_name)
+
         # embedded data package
         for game_name, data in decoded_obj.get("datapackage", {}).items():
             if game_name in game_data_packages:
@@ -530,6 +773,7 @@ class Context:
 
         # sorted access spheres
         self.spheres = decoded_obj.get("spheres", [])
+        self.locations.set_spheres(self.spheres)
 
     # saving
 
@@ -539,38 +783,140 @@ class Context:
                 self.save_dirty = False
                 return self._save()
 
+            if self.save_journal:
+                # changes get appended to the journal right away, a snapshot is only written to compact it
+                return self._write_journal()
+
             self.save_dirty = True
             return True
 
         return False
 
     def _save(self, exit_save: bool = False) -> bool:
+        journal = self.save_journal
         try:
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            if journal:
+                with journal.snapshot_lock:
+                    # the snapshot contains everything that is pending, changes after this get journaled again
+                    generation = journal.begin_snapshot()
+                    try:
+                        encoded_save = zlib.compress(pickle.dumps(self.get_save()))
+                        with open(self.save_filename + ".tmp", "wb") as f:
+                            f.write(encoded_save)
+                    except BaseException:
+                        journal.abort_snapshot(generation)
+                        raise
+                    # replace the snapshot only once it is complete, the journal still has its changes until then
+                    journal.replace_with_snapshot(generation, self.save_filename + ".tmp", self.save_filename,
+                                                  len(encoded_save))
+            else:
+                encoded_save = pickle.dumps(self.get_save())
+                with open(self.save_filename, "wb") as f:
+                    f.write(zlib.compress(encoded_save))
         except Exception as e:
             self.logger.exception(e)
             return False
         else:
             return True
 
+    def _write_journal(self) -> bool:
+        journal = self.save_journal
+        try:
+            changed, new_checks, new_items = journal.take_pending()
+            events: typing.List[typing.Tuple[str, typing.Any, typing.Any]] = []
+            for team_and_slot, locations in new_checks.items():
+                events.append(("location_checks", team_and_slot, locations))
+            for key, index in new_items.items():
+                events.append(("received_items", key, (index, self.received_items[key][index:])))
+            for attribute, key in changed:
+                value = getattr(self, attribute).get(key, None)
+                if attribute in ("client_activity_timers", "client_connection_timers"):
+                    value = value.timestamp()
+                elif isinstance(value, set):
+                    value = value.copy()
+                events.append((attribute, key, value))
+            if events:
+                # pickled right away, the save thread writes it to the file
+                journal.append(events)
+        except Exception as e:
+            self.logger.exception(e)
+            # fall back to writing a snapshot
+            self.save_dirty = True
+            return False
+        if journal.size > journal.compaction_size:
+            self.save_dirty = True
+        return True
+
+    def _write_queued_journal(self, timeout: float = 0) -> None:
+        try:
+            self.save_journal.write_queued(timeout)
+        except Exception as e:
+            self.logger.exception(e)
+            # fall back to writing a snapshot
+            self.save_dirty = True
+
+    def journal_change(self, attribute: str, key: typing.Any) -> None:
+        """Record that the save data in attribute changed at key, the new value is journaled on the next save."""
+        if self.save_journal:
+            self.save_journal.changed.add((attribute, key))
+
+    def snapshot_change(self) -> None:
+        """Record a change to save data that is not journaled, like the game options or the random state, so the save
+        thread writes a snapshot with it."""
+        self.save_dirty = True
+
+    def journal_checks(self, team: int, slot: int, locations: typing.Set[int]) -> None:
+        if self.save_journal:
+            self.save_journal.new_checks[team, slot] |= locations
+
+    def journal_received_item(self, team: int, slot: int, remote_items: bool) -> None:
+        """Call before appending to received items, the new items are journaled on the next save."""
+        if self.save_journal:
+            key = team, slot, remote_items
+            self.save_journal.new_items.setdefault(key, len(self.received_items.get(key, ())))
+
+    def apply_journal(self, events: typing.List[typing.Tuple[str, typing.Any, typing.Any]]):
+        for attribute, key, value in events:
+            if attribute == "location_checks":
+                self.location_checks[key] |= value
+            elif attribute == "received_items":
+                index, items = value
+                received_items = self.received_items.setdefault(key, [])
+                received_items[index:index + len(items)] = items
+            elif attribute in ("client_activity_timers", "client_connection_timers"):
+                getattr(self, attribute)[key] = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+            elif attribute == "name_aliases" and value is None:
+                self.name_aliases.pop(key, None)
+            else:
+                getattr(self, attribute)[key] = value
+        if any(attribute == "hints" for attribute, key, value in events):
+            self.index_hints()
+        if events:
+            self.logger.info(f"Replayed {len(events)} changes from the save journal.")
+
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
             if not self.save_filename:
-                import os
                 name, ext = os.path.splitext(self.data_filename)
                 self.save_filename = name + '.apsave' if ext.lower() in ('.archipelago', '.zip') \
                     else self.data_filename + '_' + 'apsave'
+            snapshot_size = 0
             try:
                 with open(self.save_filename, 'rb') as f:
-                    save_data = restricted_loads(zlib.decompress(f.read()))
+                    encoded_save = f.read()
+                    snapshot_size = len(encoded_save)
+                    save_data = restricted_loads(zlib.decompress(encoded_save))
                     self.set_save(save_data)
             except FileNotFoundError:
                 self.logger.error('No save data found, starting a new game')
             except Exception as e:
                 self.logger.exception(e)
+            self.save_journal = SaveJournal(self.save_filename + ".journal", snapshot_size)
+            try:
+                self.apply_journal(self.save_journal.read())
+            except Exception as e:
+                self.logger.exception(e)
             self._start_async_saving()
 
     def _start_async_saving(self, atexit_save: bool = True):
@@ -585,15 +931,23 @@ class Context:
                 while not self.exit_event.is_set():
                     try:
                         next_wakeup = (second - get_datetime_second()) % self.auto_save_interval
-                        time.sleep(max(1.0, next_wakeup))
+                        wakeup = time.monotonic() + max(1.0, next_wakeup)
+                        while time.monotonic() < wakeup:
+                            if self.save_journal:
+                                # write journal records as the event loop queues them until the next snapshot
+                                self._write_queued_journal(wakeup - time.monotonic())
+                            else:
+                                time.sleep(max(0.0, wakeup - time.monotonic()))
                         if self.save_dirty:
+                            # cleared first, so changes made while the snapshot is written get into the next one
+                            self.save_dirty = False
                             self.logger.debug("Saving via thread.")
-                            self._save()
+                            if not self._save():
+                                self.save_dirty = True
                     except OperationalError as e:
+                        self.save_dirty = True
                         self.logger.exception(e)
                         self.logger.info(f"Saving failed. Retry in {self.auto_save_interval} seconds.")
-                    else:
-                        self.save_dirty = False
                 if not atexit_save:  # if atexit is used, that keeps a reference anyway
                     queue_gc()
 
@@ -640,6 +994,7 @@ class Context:
         self.received_items = savedata["received_items"]
         self.hints_used.update(savedata["hints_used"])
         self.hints.update(savedata["hints"])
+        self.index_hints()
 
         self.name_aliases.update(savedata["name_aliases"])
         self.client_game_state.update(savedata["client_game_state"])
@@ -697,6 +1052,8 @@ class Context:
                 new_hints.add(new_hint)
                 if hint == new_hint:
                     continue
+                self.journal_change("hints", (hint_team, hint_slot))
+                self._reindex_hint(hint_team, hint, new_hint)
                 for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
                     if changed is not None:
                         changed.add((hint_team,player))
@@ -704,18 +1061,45 @@ class Context:
                         self.replace_hint(hint_team, player, hint, new_hint)
             self.hints[hint_team, hint_slot] = new_hints
 
+    def recheck_location_hints(self, team: int, slot: int, locations: typing.Iterable[int],
+                               changed: typing.Optional[typing.Set[team_slot]] = None) -> None:
+        """Refreshes only the hints for the specified locations of team/slot, in every slot that has them.
+        If a set is passed for 'changed', each (team,slot) pair that has at least one hint modified will be added to
+        the set.
+        """
+        for location in locations:
+            hints = self.location_hints.get((team, slot, location))
+            if not hints:
+                continue
+            for hint in tuple(hints):
+                new_hint = hint.re_check(self, team)
+                if hint == new_hint:
+                    continue
+                for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
+                    if changed is not None:
+                        changed.add((team, player))
+                    self.replace_hint(team, player, hint, new_hint)
+
     def get_rechecked_hints(self, team: int, slot: int):
         self.recheck_hints(team, slot)
         return self.hints[team, slot]
 
+    def index_hints(self) -> None:
+        """Rebuilds location_hints from hints."""
+        self.location_hints.clear()
+        for (team, slot), hints in self.hints.items():
+            for hint in hints:
+                self.location_hints[team, hint.finding_player, hint.location].add(hint)
+
+    def _reindex_hint(self, team: int, old_hint: Hint, new_hint: Hint) -> None:
+        location_hints = self.location_hints[team, old_hint.finding_player, old_hint.location]
+        location_hints.discard(old_hint)
+        location_hints.add(new_hint)
+
     def get_sphere(self, player: int, location_id: int) -> int:
         """Get sphere of a location, -1 if spheres are not available."""
         if self.spheres:
-            for i, sphere in enumerate(self.spheres):
-                if location_id in sphere.get(player, set()):
-                    return i
-            raise KeyError(f"No Sphere found for location ID {location_id} belonging to player {player}. "
-                           f"Location or player may not exist.")
+            return self.locations.get_sphere(player, location_id)
         return -1
 
     def get_players_package(self):
@@ -773,6 +1157,7 @@ class Context:
                 # we can check once if hint already exists
                 if hint not in self.hints[team, hint.finding_player]:
                     self.hints[team, hint.finding_player].add(hint)
+                    self.location_hints[team, hint.finding_player, hint.location].add(hint)
                     new_hint_events.add(hint.finding_player)
                     for player in self.slot_set(hint.receiving_player):
                         self.hints[team, player].add(hint)
@@ -780,6 +1165,7 @@ class Context:
 
             self.logger.info("Notice (Team #%d): %s" % (team + 1, format_hint(self, team, hint)))
         for slot in new_hint_events:
+            self.journal_change("hints", (team, slot))
             self.on_new_hint(team, slot)
         for slot, hint_data in concerns.items():
             if recipients is None or slot in recipients:
@@ -791,15 +1177,16 @@ class Context:
                     async_start(self.send_msgs(client, client_hints))
 
     def get_hint(self, team: int, finding_player: int, seeked_location: int) -> typing.Optional[Hint]:
-        for hint in self.hints[team, finding_player]:
-            if hint.location == seeked_location and hint.finding_player == finding_player:
-                return hint
+        for hint in self.location_hints.get((team, finding_player, seeked_location), ()):
+            return hint
         return None
     
     def replace_hint(self, team: int, slot: int, old_hint: Hint, new_hint: Hint) -> None:
         if old_hint in self.hints[team, slot]:
             self.hints[team, slot].remove(old_hint)
             self.hints[team, slot].add(new_hint)
+            self.journal_change("hints", (team, slot))
+        self._reindex_hint(team, old_hint, new_hint)
     
     # "events"
 
@@ -938,12 +1325,16 @@ async def on_client_joined(ctx: Context, client: Client):
                                   "It may stop working in the future. If you are a player, please report this to the "
                                   "client's developer.")
     ctx.client_connection_timers[client.team, client.slot] = datetime.datetime.now(datetime.timezone.utc)
+    ctx.journal_change("client_connection_timers", (client.team, client.slot))
+    ctx.save()
 
 
 async def on_client_left(ctx: Context, client: Client):
     if len(ctx.clients[client.team][client.slot]) < 1:
         update_client_status(ctx, client, ClientStatus.CLIENT_UNKNOWN)
         ctx.client_connection_timers[client.team, client.slot] = datetime.datetime.now(datetime.timezone.utc)
+        ctx.journal_change("client_connection_timers", (client.team, client.slot))
+        ctx.save()
 
     version_str = '.'.join(str(x) for x in client.version)
 
@@ -1022,20 +1413,21 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
-                    first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+    """Send new items to the clients of ctx.new_item_receivers."""
+    receivers, ctx.new_item_receivers = ctx.new_item_receivers, set()
+    for team, slot in receivers:
+        for client in ctx.clients.get(team, {}).get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                first_new_item = max(0, client.send_index - len(start_inventory))
+                async_start(ctx.send_msgs(client, [{
+                    "cmd": "ReceivedItems",
+                    "index": client.send_index,
+                    "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
+                client.send_index = len(start_inventory) + len(items)
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -1069,6 +1461,7 @@ def collect_player(ctx: Context, team: int, slot: int, is_group: bool = False):
             if slot in group_players:
                 group_collected_players = ctx.group_collected.setdefault(group, set())
                 group_collected_players.add(slot)
+                ctx.journal_change("group_collected", group)
                 if set(group_players) == group_collected_players:
                     collect_player(ctx, team, group, True)
 
@@ -1081,8 +1474,11 @@ def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem
     for target in ctx.slot_set(target_slot):
         for item in items:
             if item.player != target_slot:
+                ctx.journal_received_item(team, target, False)
                 get_received_items(ctx, team, target, False).append(item)
+            ctx.journal_received_item(team, target, True)
             get_received_items(ctx, team, target, True).append(item)
+        ctx.new_item_receivers.add((team, target))
 
 
 def register_location_checks(ctx: Context, team: int, slot: int, locations: typing.Iterable[int],
@@ -1093,6 +1489,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
     if new_locations:
         if count_activity:
             ctx.client_activity_timers[team, slot] = datetime.datetime.now(datetime.timezone.utc)
+            ctx.journal_change("client_activity_timers", (team, slot))
 
         sortable: list[tuple[int, int, int, int]] = []
         for location in new_locations:
@@ -1120,6 +1517,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
         del sortable
 
         ctx.location_checks[team, slot] |= new_locations
+        ctx.journal_checks(team, slot, new_locations)
         send_new_items(ctx)
         ctx.broadcast(ctx.clients[team][slot], [{
             "cmd": "RoomUpdate",
@@ -1127,7 +1525,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             "checked_locations": new_locations,  # send back new checks only
         }])
         updated_slots: typing.Set[tuple[int, int]] = set()
-        ctx.recheck_hints(team, slot, updated_slots)
+        ctx.recheck_location_hints(team, slot, new_locations, updated_slots)
         for hint_team, hint_slot in updated_slots:
             ctx.on_changed_hints(hint_team, hint_slot)
         ctx.save()
@@ -1567,12 +1965,14 @@ class ClientMessageProcessor(CommonCommandProcessor):
         if alias_name:
             alias_name = alias_name[:16].strip()
             self.ctx.name_aliases[self.client.team, self.client.slot] = alias_name
+            self.ctx.journal_change("name_aliases", (self.client.team, self.client.slot))
             self.output(f"Hello, {alias_name}")
             update_aliases(self.ctx, self.client.team)
             self.ctx.save()
             return True
         elif (self.client.team, self.client.slot) in self.ctx.name_aliases:
             del (self.ctx.name_aliases[self.client.team, self.client.slot])
+            self.ctx.journal_change("name_aliases", (self.client.team, self.client.slot))
             self.output("Removed Alias")
             update_aliases(self.ctx, self.client.team)
             self.ctx.save()
@@ -1586,12 +1986,15 @@ class ClientMessageProcessor(CommonCommandProcessor):
             names = self.ctx.item_names_for_game(self.ctx.games[self.client.slot])
             item_name, usable, response = get_intended_text(
                 item_name,
-                names
+                self.ctx.get_name_matcher(names)
             )
             if usable:
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
+                self.ctx.journal_received_item(self.client.team, self.client.slot, False)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
+                self.ctx.journal_received_item(self.client.team, self.client.slot, True)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.new_item_receivers.add((self.client.team, self.client.slot))
                 self.ctx.broadcast_text_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot),
@@ -1610,9 +2013,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
         cost = self.ctx.get_hint_cost(self.client.slot)
         auto_status = HintStatus.HINT_UNSPECIFIED if for_location else HintStatus.HINT_PRIORITY
         if not input_text:
-            hints = {hint.re_check(self.ctx, self.client.team) for hint in
-                     self.ctx.hints[self.client.team, self.client.slot]}
-            self.ctx.hints[self.client.team, self.client.slot] = hints
+            hints = self.ctx.get_rechecked_hints(self.client.team, self.client.slot)
             self.ctx.notify_hints(self.client.team, list(hints), recipients=(self.client.slot,))
             self.output(f"A hint costs {self.ctx.get_hint_cost(self.client.slot)} points. "
                         f"You have {points_available} points.")
@@ -1646,7 +2047,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
             names = self.ctx.all_location_and_group_names[game] \
                 if for_location else \
                 self.ctx.all_item_and_group_names[game]
-            hint_name, usable, response = get_intended_text(input_text, names)
+            hint_name, usable, response = get_intended_text(input_text, self.ctx.get_name_matcher(names))
 
             if usable:
                 if hint_name in self.ctx.non_hintable_names[game]:
@@ -1688,6 +2089,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                     can_pay = 1000
 
                 self.ctx.random.shuffle(not_found_hints)
+                self.ctx.snapshot_change()
                 # By popular vote, make hints prefer non-local placements
                 not_found_hints.sort(key=lambda hint: int(hint.receiving_player != hint.finding_player))
                 # By another popular vote, prefer early sphere
@@ -1702,6 +2104,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                     hints.append(hint)
                     can_pay -= 1
                     self.ctx.hints_used[self.client.team, self.client.slot] += 1
+                    self.ctx.journal_change("hints_used", (self.client.team, self.client.slot))
 
                 self.ctx.notify_hints(self.client.team, hints)
                 if not_found_hints:
@@ -1860,21 +2263,16 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
         if "games" in args:
             games = {name: game_data for name, game_data in ctx.gamespackage.items()
                      if name in set(args.get("games", []))}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": games}}])
+            await ctx.send_encoded_msgs(client, ctx.encode_data_package(games))
         # TODO: remove exclusions behaviour around 0.5.0
         elif exclusions:
             exclusions = set(exclusions)
             games = {name: game_data for name, game_data in ctx.gamespackage.items()
                      if name not in exclusions}
-
-            package = {"games": games}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": package}])
+            await ctx.send_encoded_msgs(client, ctx.encode_data_package(games))
 
         else:
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": ctx.gamespackage}}])
+            await ctx.send_encoded_msgs(client, ctx.encode_data_package(ctx.gamespackage))
 
     elif client.auth:
         if cmd == "ConnectUpdate":
@@ -2052,6 +2450,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
+            ctx.journal_change("stored_data", args["key"])
             targets = set(ctx.stored_data_notification_clients[args["key"]])
             if args.get("want_reply", False):
                 targets.add(client)
@@ -2080,6 +2479,7 @@ def update_client_status(ctx: Context, client: Client, new_status: ClientStatus)
                 ctx.broadcast_text_all(f"Team #{client.team + 1} has completed all of their games! Congratulations!")
 
         ctx.client_game_state[client.team, client.slot] = new_status
+        ctx.journal_change("client_game_state", (client.team, client.slot))
         ctx.on_client_status_change(client.team, client.slot)
         ctx.save()
 
@@ -2139,12 +2539,14 @@ class ServerCommandProcessor(CommonCommandProcessor):
                     if alias_name:
                         alias_name = alias_name.strip()[:15]
                         self.ctx.name_aliases[team, slot] = alias_name
+                        self.ctx.journal_change("name_aliases", (team, slot))
                         self.output(f"Named {player_name} as {alias_name}")
                         update_aliases(self.ctx, team)
                         self.ctx.save()
                         return True
                     else:
                         del (self.ctx.name_aliases[team, slot])
+                        self.ctx.journal_change("name_aliases", (team, slot))
                         self.output(f"Removed Alias for {player_name}")
                         update_aliases(self.ctx, team)
                         self.ctx.save()
@@ -2229,7 +2631,7 @@ class ServerCommandProcessor(CommonCommandProcessor):
             team, slot = self.ctx.player_name_lookup[seeked_player]
             item_name = " ".join(item_name)
             names = self.ctx.item_names_for_game(self.ctx.games[slot])
-            item_name, usable, response = get_intended_text(item_name, names)
+            item_name, usable, response = get_intended_text(item_name, self.ctx.get_name_matcher(names))
             if usable:
                 amount: int = int(amount)
                 if amount > 100:
@@ -2264,7 +2666,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 location, usable, response = int(full_name), True, None
             elif self.ctx.location_names_for_game(game) is not None:
-                location, usable, response = get_intended_text(full_name, self.ctx.location_names_for_game(game))
+                location, usable, response = get_intended_text(
+                    full_name, self.ctx.get_name_matcher(self.ctx.location_names_for_game(game)))
             else:
                 self.output("Can't look up location for unknown game. Send by ID instead.")
                 return False
@@ -2295,7 +2698,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 item, usable, response = int(full_name), True, None
             elif game in self.ctx.all_item_and_group_names:
-                item, usable, response = get_intended_text(full_name, self.ctx.all_item_and_group_names[game])
+                item, usable, response = get_intended_text(
+                    full_name, self.ctx.get_name_matcher(self.ctx.all_item_and_group_names[game]))
             else:
                 self.output("Can't look up item for unknown game. Hint for ID instead.")
                 return False
@@ -2334,7 +2738,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 location, usable, response = int(full_name), True, None
             elif game in self.ctx.all_location_and_group_names:
-                location, usable, response = get_intended_text(full_name, self.ctx.all_location_and_group_names[game])
+                location, usable, response = get_intended_text(
+                    full_name, self.ctx.get_name_matcher(self.ctx.all_location_and_group_names[game]))
             else:
                 self.output("Can't look up location for unknown game. Hint for ID instead.")
                 return False
@@ -2387,6 +2792,7 @@ class ServerCommandProcessor(CommonCommandProcessor):
                 return False
 
         setattr(self.ctx, option_name, value_type(option_value))
+        self.ctx.snapshot_change()
         self.output(f"Set option {option_name} to {getattr(self.ctx, option_name)}")
         if option_name in {"release_mode", "remaining_mode", "collect_mode"}:
             self.ctx.broadcast_all([{"cmd": "RoomUpdate", 'permissions': get_permissions(self.ctx)}])
@@ -2584,6 +2990,8 @@ async def main(args: argparse.Namespace):
 client_message_processor = ClientMessageProcessor
 
 if __name__ == '__main__':
+    # only load the worlds of the games that are played
+    os.environ.setdefault("MULTIWORLDGG_LAZY_WORLDS", "1")
     try:
         asyncio.run(main(parse_args()))
     except asyncio.exceptions.CancelledError:
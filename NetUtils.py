@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import typing
 import enum
+import itertools
 import warnings
 from json import JSONEncoder, JSONDecoder
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 if typing.TYPE_CHECKING:
     from websockets import WebSocketServerProtocol as ServerConnection
 
@@ -93,7 +99,103 @@ class NetworkItem(typing.NamedTuple):
     flags: int = 0
 
 
+_encode = JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(',', ':'),
+).encode
+
+_plain_types: typing.Set[type] = {str, int, bool, type(None)}
+"""types that orjson encodes exactly like json does, as values and as dict keys, with subclasses added as encountered"""
+_prepare_handlers: typing.Dict[type, typing.Callable[[_JSONPreparer, typing.Any], typing.Any]] = {}
+"""how _JSONPreparer handles each type, filled in as types are encountered"""
+
+
+class _JSONPreparer:
+    """Turns NamedTuples into dicts with a "class" key and sets into lists in one pass over a message, producing the
+    same JSON as _scan_for_TypedTuples without copying containers that don't contain any of them.
+    Also notes whether orjson would encode the result exactly like json does, which is not the case for floats."""
+    __slots__ = ("orjson_exact",)
+
+    orjson_exact: bool
+
+    def __init__(self) -> None:
+        self.orjson_exact = orjson is not None
+
+    def prepare(self, obj: typing.Any) -> typing.Any:
+        obj_type = type(obj)
+        handler = _prepare_handlers.get(obj_type, None)
+        if handler is None:
+            handler = _prepare_handlers[obj_type] = _get_prepare_handler(obj_type)
+        return handler(self, obj)
+
+    def prepare_plain(self, obj: typing.Any) -> typing.Any:
+        return obj
+
+    def prepare_other(self, obj: typing.Any) -> typing.Any:
+        self.orjson_exact = False  # floats, or objects json has to reject
+        return obj
+
+    def prepare_named_tuple(self, obj: typing.NamedTuple) -> typing.Dict[str, typing.Any]:
+        # fields are encoded as they are
+        if not _are_plain_types(map(type, obj)):
+            self.orjson_exact = False
+        data = obj._asdict()
+        data["class"] = obj.__class__.__name__
+        return data
+
+    def prepare_sequence(self, obj: typing.Collection[typing.Any]) -> typing.Collection[typing.Any]:
+        item_types = set(map(type, obj))
+        if _are_plain_types(item_types):
+            return obj if isinstance(obj, (list, tuple)) else list(obj)
+        if len(item_types) == 1:
+            item_type, = item_types
+            if _prepare_handlers.get(item_type, None) is _JSONPreparer.prepare_named_tuple:
+                return self.prepare_named_tuples(obj, item_type)
+        return [self.prepare(item) for item in obj]
+
+    def prepare_named_tuples(self, obj: typing.Collection[typing.NamedTuple],
+                             cls: typing.Type[typing.NamedTuple]) -> typing.List[typing.Dict[str, typing.Any]]:
+        if not _are_plain_types(map(type, itertools.chain.from_iterable(obj))):
+            self.orjson_exact = False
+        fields = (*cls._fields, "class")
+        name = (cls.__name__,)
+        return [dict(zip(fields, item + name)) for item in obj]
+
+    def prepare_dict(self, obj: typing.Dict[typing.Any, typing.Any]) -> typing.Dict[typing.Any, typing.Any]:
+        if not _are_plain_types(map(type, obj)):
+            self.orjson_exact = False
+        if _are_plain_types(map(type, obj.values())):
+            return obj
+        return {key: self.prepare(value) for key, value in obj.items()}
+
+
+def _get_prepare_handler(obj_type: type) -> typing.Callable[[_JSONPreparer, typing.Any], typing.Any]:
+    if obj_type in _plain_types:
+        return _JSONPreparer.prepare_plain
+    if issubclass(obj_type, (str, int)):  # like enums, which orjson encodes by value
+        _plain_types.add(obj_type)
+        return _JSONPreparer.prepare_plain
+    if issubclass(obj_type, tuple) and hasattr(obj_type, "_fields"):  # NamedTuple is not actually a parent class
+        return _JSONPreparer.prepare_named_tuple
+    if issubclass(obj_type, (tuple, list, set, frozenset)):
+        return _JSONPreparer.prepare_sequence
+    if issubclass(obj_type, dict):
+        return _JSONPreparer.prepare_dict
+    return _JSONPreparer.prepare_other
+
+
+def _are_plain_types(types: typing.Iterable[type]) -> bool:
+    types = set(types)
+    if types <= _plain_types:
+        return True
+    for new_type in types - _prepare_handlers.keys():
+        _prepare_handlers[new_type] = _get_prepare_handler(new_type)
+    return types <= _plain_types
+
+
 def _scan_for_TypedTuples(obj: typing.Any) -> typing.Any:
+    """Reference for the output of encode, which uses _JSONPreparer instead."""
     if isinstance(obj, tuple) and hasattr(obj, "_fields"):  # NamedTuple is not actually a parent class
         data = obj._asdict()
         data["class"] = obj.__class__.__name__
@@ -105,15 +207,15 @@ def _scan_for_TypedTuples(obj: typing.Any) -> typing.Any:
     return obj
 
 
-_encode = JSONEncoder(
-    ensure_ascii=False,
-    check_circular=False,
-    separators=(',', ':'),
-).encode
-
-
 def encode(obj: typing.Any) -> str:
-    return _encode(_scan_for_TypedTuples(obj))
+    preparer = _JSONPreparer()
+    data = preparer.prepare(obj)
+    if preparer.orjson_exact:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # integers beyond 64 bits, lone surrogates and deep nesting are left to json
+    return _encode(data)
 
 
 def get_any_version(data: dict) -> Version:
@@ -416,6 +518,22 @@ class _LocationStore(dict, typing.MutableMapping[int, typing.Dict[int, typing.Tu
         if len(self.get(0, {})):
             raise ValueError("Invalid player id 0 for location")
 
+        self._spheres: typing.Dict[typing.Tuple[int, int], int] = {}
+
+    def set_spheres(self, spheres: typing.Sequence[typing.Dict[int, typing.Set[int]]]) -> None:
+        """Remember the sphere of each location for get_sphere. Unknown players and locations are ignored."""
+        self._spheres = {(player, location): sphere_number
+                         for sphere_number, sphere in enumerate(spheres)
+                         for player, locations in sphere.items() if player in self
+                         for location in locations if location in self[player]}
+
+    def get_sphere(self, player: int, location: int) -> int:
+        try:
+            return self._spheres[player, location]
+        except KeyError:
+            raise KeyError(f"No Sphere found for location ID {location} belonging to player {player}. "
+                           f"Location or player may not exist.") from None
+
     def find_item(self, slots: typing.Set[int], seeked_item_id: int
                   ) -> typing.Generator[typing.Tuple[int, int, int, int, int], None, None]:
         for finding_player, check_data in self.items():
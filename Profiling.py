@@ -0,0 +1,268 @@
+"""
+Opt-in profiling of a generation, enabled by --profile of Generate.py.
+
+Records wall and CPU time of every world stage per player and of the named generation steps, and samples the stacks
+of all threads to find the access rules of locations and entrances that take the most time.
+The report is written as json and html next to the output.
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import html
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from BaseClasses import MultiWorld
+
+__all__ = ["GenerationProfile", "current", "step", "profiled"]
+
+current: typing.Optional[GenerationProfile] = None
+"""The profile of the running generation, if it is profiled."""
+
+_Times = typing.List[float]  # wall seconds, cpu seconds, calls
+
+
+class GenerationProfile:
+    """Records the time spent in a generation while active, use as a context manager around the generation."""
+    multiworld: typing.Optional[MultiWorld] = None
+    sample_interval: float
+    """seconds between samples of the running access rules"""
+    report_size: int = 50
+    """number of rules and of locations and entrances listed in the report"""
+
+    def __init__(self, sample_interval: float = 0.002) -> None:
+        self.sample_interval = sample_interval
+        self.stages: typing.Dict[typing.Tuple[str, str, typing.Optional[int]], _Times] = {}
+        self.steps: typing.Dict[str, _Times] = {}
+        self.rules: typing.Counter[typing.Tuple[str, str, int]] = collections.Counter()
+        self.rule_spots: typing.Dict[typing.Tuple[str, str, int], typing.Set[typing.Tuple[str, str, int]]] = \
+            collections.defaultdict(set)
+        self.spots: typing.Counter[typing.Tuple[str, str, int]] = collections.Counter()
+        self.sampled = 0.0
+        self.samples = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self._lock = threading.Lock()
+        self._step_names = threading.local()
+        self._stop = threading.Event()
+        self._sampler: typing.Optional[threading.Thread] = None
+
+    def __enter__(self) -> GenerationProfile:
+        global current
+        if current is not None:
+            raise RuntimeError("A generation is already being profiled.")
+        current = self
+        self._start = time.perf_counter(), time.process_time()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name="Profile Sampler", daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        global current
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+            self._sampler = None
+        self.wall = time.perf_counter() - self._start[0]
+        self.cpu = time.process_time() - self._start[1]
+        current = None
+
+    def record_call(self, stage: str, game: str, player: typing.Optional[int], wall: float, cpu: float) -> None:
+        """Adds a call of a world's stage, player is None for the stage_ classmethods of a game."""
+        with self._lock:
+            times = self.stages.setdefault((stage, game, player), [0.0, 0.0, 0])
+            times[0] += wall
+            times[1] += cpu
+            times[2] += 1
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> typing.Iterator[None]:
+        """Records the time spent in the with block, nested steps are named after the steps they run in."""
+        names: typing.Optional[typing.List[str]] = getattr(self._step_names, "names", None)
+        if names is None:
+            names = self._step_names.names = []
+        names.append(name)
+        path = " / ".join(names)
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - start_wall, time.thread_time() - start_cpu
+            names.pop()
+            with self._lock:
+                times = self.steps.setdefault(path, [0.0, 0.0, 0])
+                times[0] += wall
+                times[1] += cpu
+                times[2] += 1
+
+    def _sample(self) -> None:
+        from BaseClasses import Entrance, Location, Region
+        region_can_reach = Region.can_reach.__code__
+        own_thread = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.sample_interval):
+            now = time.perf_counter()
+            # weigh samples by the time since the last one, as the sampler may have to wait for the GIL
+            taken, last = now - last, now
+            self.sampled += taken
+            self.samples += 1
+            for thread, frame in sys._current_frames().items():
+                if thread == own_thread:
+                    continue
+                # the innermost can_reach of a location or entrance is the rule that is being evaluated
+                callee = None
+                while frame:
+                    if frame.f_code.co_name == "can_reach":
+                        spot = frame.f_locals.get("self")
+                        if isinstance(spot, (Location, Entrance)):
+                            if callee and callee.f_code is region_can_reach:
+                                # updating region reachability, the rules evaluated for it are found deeper
+                                break
+                            spot_key = type(spot).__name__, spot.name, spot.player
+                            self.spots[spot_key] += taken
+                            if callee:
+                                code = callee.f_code
+                                rule_key = code.co_qualname, code.co_filename, code.co_firstlineno
+                                self.rules[rule_key] += taken
+                                self.rule_spots[rule_key].add(spot_key)
+                            break
+                    callee, frame = frame, frame.f_back
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        multiworld = self.multiworld
+        games: typing.Dict[int, str] = multiworld.game if multiworld else {}
+        names: typing.Dict[int, str] = multiworld.player_name if multiworld else {}
+
+        def times(values: _Times) -> typing.Dict[str, typing.Any]:
+            return {"wall": round(values[0], 6), "cpu": round(values[1], 6), "calls": values[2]}
+
+        def add(into: typing.Dict[typing.Any, _Times], key: typing.Any, values: _Times) -> None:
+            total = into.setdefault(key, [0.0, 0.0, 0])
+            for index, value in enumerate(values):
+                total[index] += value
+
+        worlds: typing.Dict[int, typing.Dict[str, _Times]] = collections.defaultdict(dict)
+        world_totals: typing.Dict[int, _Times] = {}
+        game_totals: typing.Dict[str, _Times] = {}
+        stage_totals: typing.Dict[str, _Times] = {}
+        for (stage, game, player), values in self.stages.items():
+            add(game_totals, game, values)
+            add(stage_totals, stage, values)
+            if player is not None:
+                worlds[player][stage] = values
+                add(world_totals, player, values)
+
+        def by_wall(item: typing.Tuple[typing.Any, _Times]) -> float:
+            return -item[1][0]
+
+        sample_seconds = self.sampled or 1.0
+        return {
+            "seed_name": multiworld.seed_name if multiworld else None,
+            "players": multiworld.players if multiworld else 0,
+            "wall": round(self.wall, 6),
+            "cpu": round(self.cpu, 6),
+            "worlds": [{"player": player, "name": names.get(player, ""), "game": games.get(player, ""),
+                        **times(values),
+                        "stages": {stage: times(stage_values) for stage, stage_values in
+                                   sorted(worlds[player].items(), key=by_wall)}}
+                       for player, values in sorted(world_totals.items(), key=by_wall)],
+            "games": [{"game": game, "players": sum(1 for player in worlds if games.get(player) == game),
+                       **times(values)}
+                      for game, values in sorted(game_totals.items(), key=by_wall)],
+            "stages": [{"stage": stage, **times(values)} for stage, values in sorted(stage_totals.items(), key=by_wall)],
+            "steps": [{"step": path, **times(values)} for path, values in self.steps.items()],
+            "rules": {
+                "samples": self.samples,
+                "sampled": round(self.sampled, 6),
+                "rules": [{"rule": qualname, "file": f"{filename}:{line}", "seconds": round(seconds, 6),
+                           "share": round(seconds / sample_seconds, 6),
+                           "spots": len(self.rule_spots[(qualname, filename, line)])}
+                          for (qualname, filename, line), seconds in self.rules.most_common(self.report_size)],
+                "spots": [{"type": kind, "name": name, "player": player, "game": games.get(player, ""),
+                           "seconds": round(seconds, 6), "share": round(seconds / sample_seconds, 6)}
+                          for (kind, name, player), seconds in self.spots.most_common(self.report_size)],
+            },
+        }
+
+    def write(self, path: str) -> None:
+        """Writes the report to path with .json and .html appended."""
+        report = self.to_dict()
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        with open(f"{path}.html", "w", encoding="utf-8") as f:
+            f.write(_to_html(report, os.path.basename(path)))
+
+
+def _to_html(report: typing.Dict[str, typing.Any], title: str) -> str:
+    def table(heading: str, columns: typing.Sequence[str], rows: typing.Iterable[typing.Iterable[typing.Any]]) -> str:
+        head = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+        body = "".join("<tr>" + "".join(f"<td>{html.escape(str(value))}</td>" for value in row) + "</tr>"
+                       for row in rows)
+        return f"<h2>{html.escape(heading)}</h2><table><tr>{head}</tr>{body}</table>"
+
+    rules = report["rules"]
+    parts = [
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p>{report['players']} players, {report['wall']:.3f} seconds, {report['cpu']:.3f} seconds of CPU time.</p>",
+        table("Worlds", ("Player", "Name", "Game", "Seconds", "CPU seconds", "Slowest stage"),
+              ((world["player"], world["name"], world["game"], f"{world['wall']:.4f}", f"{world['cpu']:.4f}",
+                next(iter(world["stages"]), "")) for world in report["worlds"])),
+        table("Games", ("Game", "Players", "Seconds", "CPU seconds"),
+              ((game["game"], game["players"], f"{game['wall']:.4f}", f"{game['cpu']:.4f}")
+               for game in report["games"])),
+        table("Stages", ("Stage", "Calls", "Seconds", "CPU seconds"),
+              ((stage["stage"], stage["calls"], f"{stage['wall']:.4f}", f"{stage['cpu']:.4f}")
+               for stage in report["stages"])),
+        table("Steps", ("Step", "Calls", "Seconds", "CPU seconds"),
+              ((step["step"], step["calls"], f"{step['wall']:.4f}", f"{step['cpu']:.4f}")
+               for step in report["steps"])),
+        f"<p>{rules['samples']} samples over {rules['sampled']:.3f} seconds.</p>",
+        table("Access rules", ("Rule", "File", "Seconds", "Share", "Locations and entrances"),
+              ((rule["rule"], rule["file"], f"{rule['seconds']:.4f}", f"{rule['share']:.2%}", rule["spots"])
+               for rule in rules["rules"])),
+        table("Locations and entrances", ("Type", "Name", "Player", "Game", "Seconds", "Share"),
+              ((spot["type"], spot["name"], spot["player"], spot["game"], f"{spot['seconds']:.4f}",
+                f"{spot['share']:.2%}") for spot in rules["spots"])),
+    ]
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(title)}</title>"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+            "td,th{border:1px solid #999;padding:2px 6px;text-align:left}</style>"
+            f"</head><body>{''.join(parts)}</body></html>")
+
+
+@contextlib.contextmanager
+def step(name: str) -> typing.Iterator[None]:
+    """Records the with block as a step of the current profile, if a generation is being profiled."""
+    profile = current
+    if profile is None:
+        yield
+    else:
+        with profile.step(name):
+            yield
+
+
+def profiled(function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+    """Records calls of a fill function as steps of the current profile, named after it and its name argument."""
+    signature = inspect.signature(function)
+    default_name = signature.parameters["name"].default
+
+    @functools.wraps(function)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        profile = current
+        if profile is None:
+            return function(*args, **kwargs)
+        name = signature.bind(*args, **kwargs).arguments.get("name", default_name)
+        with profile.step(f"{function.__name__} {name}"):
+            return function(*args, **kwargs)
+
+    return wrapper
@@ -9,6 +9,7 @@ import subprocess
 import base64
 import logging
 import asyncio
+import bisect
 import enum
 import typing
 
@@ -129,6 +130,8 @@ class SNIContext(CommonContext):
     snes_recv_queue: "asyncio.Queue[bytes]"
     snes_request_lock: asyncio.Lock
     snes_write_buffer: typing.List[typing.Tuple[int, bytes]]
+    snes_memory_snapshot: typing.Optional[SNESMemorySnapshot]
+    """memory read at the start of the running game_watcher, see SNIClient.get_read_ranges"""
     snes_connector_lock: threading.Lock
     death_state: DeathState
     killing_player_task: "typing.Optional[asyncio.Task[None]]"
@@ -155,6 +158,7 @@ class SNIContext(CommonContext):
         self.snes_recv_queue = asyncio.Queue()
         self.snes_request_lock = asyncio.Lock()
         self.snes_write_buffer = []
+        self.snes_memory_snapshot = None
         self.snes_connector_lock = threading.Lock()
         self.death_state = DeathState.alive  # for death link flop behaviour
         self.killing_player_task = None
@@ -515,50 +519,131 @@ async def snes_recv_loop(ctx: SNIContext) -> None:
             ctx.snes_autoreconnect_task = asyncio.create_task(snes_autoreconnect(ctx), name="snes auto-reconnect")
 
 
-async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional[bytes]:
-    try:
-        await ctx.snes_request_lock.acquire()
+snes_get_address_max_ranges = 8
+"""most address ranges read by one GetAddress request, as SD2SNES reads at most 8 at once"""
 
-        if (
-            ctx.snes_state != SNESState.SNES_ATTACHED or
-            ctx.snes_socket is None or
-            not ctx.snes_socket.open or
-            ctx.snes_socket.closed
-        ):
+
+def merge_read_ranges(ranges: typing.Iterable[typing.Tuple[int, int]]) -> typing.List[typing.Tuple[int, int]]:
+    """Merges overlapping and adjacent (address, size) ranges into the fewest ranges, sorted by address."""
+    merged: typing.List[typing.List[int]] = []
+    for address, size in sorted(ranges):
+        if size <= 0:
+            continue
+        if merged and address <= merged[-1][0] + merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], address + size - merged[-1][0])
+        else:
+            merged.append([address, size])
+    return [(address, size) for address, size in merged]
+
+
+class SNESMemorySnapshot:
+    """Memory of address ranges that were read together, to answer snes_read without a request."""
+    starts: typing.List[int]
+    ranges: typing.List[typing.Tuple[int, int, int]]
+    """address, size and position in data of each range"""
+    data: bytearray
+
+    def __init__(self, ranges: typing.List[typing.Tuple[int, int]], data: bytearray) -> None:
+        """:param ranges: merged ranges, see merge_read_ranges, in the order of data"""
+        self.starts = []
+        self.ranges = []
+        position = 0
+        for address, size in ranges:
+            self.starts.append(address)
+            self.ranges.append((address, size, position))
+            position += size
+        self.data = data
+
+    def read(self, address: int, size: int) -> typing.Optional[bytes]:
+        """Returns the memory at address, or None if it was not read."""
+        index = bisect.bisect_right(self.starts, address) - 1
+        if index < 0:
+            return None
+        start, range_size, position = self.ranges[index]
+        if address + size > start + range_size:
             return None
+        position += address - start
+        return bytes(self.data[position:position + size])
+
+
+async def _snes_get_address(ctx: SNIContext, ranges: typing.Sequence[typing.Tuple[int, int]]) \
+        -> typing.Optional[bytearray]:
+    """Reads ranges with one GetAddress request, has to be called with snes_request_lock held."""
+    if (
+        ctx.snes_state != SNESState.SNES_ATTACHED or
+        ctx.snes_socket is None or
+        not ctx.snes_socket.open or
+        ctx.snes_socket.closed
+    ):
+        return None
+
+    GetAddress_Request: SNESRequest = {
+        "Opcode": "GetAddress",
+        "Space": "SNES",
+        "Operands": [operand for address, size in ranges for operand in (hex(address)[2:], hex(size)[2:])]
+    }
+    try:
+        await ctx.snes_socket.send(dumps(GetAddress_Request))
+    except ConnectionClosed:
+        return None
 
-        GetAddress_Request: SNESRequest = {
-            "Opcode": "GetAddress",
-            "Space": "SNES",
-            "Operands": [hex(address)[2:], hex(size)[2:]]
-        }
+    size = sum(range_size for _, range_size in ranges)
+    data = bytearray()
+    while len(data) < size:
         try:
-            await ctx.snes_socket.send(dumps(GetAddress_Request))
-        except ConnectionClosed:
-            return None
+            data += await asyncio.wait_for(ctx.snes_recv_queue.get(), 5)
+        except asyncio.TimeoutError:
+            break
 
-        data: bytes = bytes()
-        while len(data) < size:
-            try:
-                data += await asyncio.wait_for(ctx.snes_recv_queue.get(), 5)
-            except asyncio.TimeoutError:
-                break
-
-        if len(data) != size:
-            snes_logger.error('Error reading %s, requested %d bytes, received %d' % (hex(address), size, len(data)))
-            if len(data):
-                snes_logger.error(str(data))
-                snes_logger.warning('Communication Failure with SNI')
-            if ctx.snes_socket is not None and not ctx.snes_socket.closed:
-                await ctx.snes_socket.close()
-            return None
+    if len(data) != size:
+        snes_logger.error('Error reading %s, requested %d bytes, received %d' % (hex(ranges[0][0]), size, len(data)))
+        if len(data):
+            snes_logger.error(str(data))
+            snes_logger.warning('Communication Failure with SNI')
+        if ctx.snes_socket is not None and not ctx.snes_socket.closed:
+            await ctx.snes_socket.close()
+        return None
+
+    return data
+
+
+async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional[bytes]:
+    snapshot = ctx.snes_memory_snapshot
+    if snapshot:
+        data = snapshot.read(address, size)
+        if data is not None:
+            return data
 
-        return data
+    try:
+        await ctx.snes_request_lock.acquire()
+        data = await _snes_get_address(ctx, ((address, size),))
+        return None if data is None else bytes(data)
+    finally:
+        ctx.snes_request_lock.release()
+
+
+async def snes_read_ranges(ctx: SNIContext, ranges: typing.Iterable[typing.Tuple[int, int]]) \
+        -> typing.Optional[SNESMemorySnapshot]:
+    """Reads (address, size) ranges in as few requests as possible, returns None if they could not be read."""
+    merged = merge_read_ranges(ranges)
+    if not merged:
+        return None
+    try:
+        await ctx.snes_request_lock.acquire()
+        data = bytearray()
+        for start in range(0, len(merged), snes_get_address_max_ranges):
+            part = await _snes_get_address(ctx, merged[start:start + snes_get_address_max_ranges])
+            if part is None:
+                return None
+            data += part
+        return SNESMemorySnapshot(merged, data)
     finally:
         ctx.snes_request_lock.release()
 
 
 async def snes_write(ctx: SNIContext, write_list: typing.List[typing.Tuple[int, bytes]]) -> bool:
+    # written memory may be in the snapshot, so later reads of this tick have to ask the SNES again
+    ctx.snes_memory_snapshot = None
     try:
         await ctx.snes_request_lock.acquire()
 
@@ -660,12 +745,17 @@ async def game_watcher(ctx: SNIContext) -> None:
         perf_counter = time.perf_counter()
 
         try:
+            read_ranges = ctx.client_handler.get_read_ranges(ctx)
+            if read_ranges:
+                ctx.snes_memory_snapshot = await snes_read_ranges(ctx, read_ranges)
             await ctx.client_handler.game_watcher(ctx)
         except Exception as e:
             snes_logger.error(f"An error occurred, see logs for details: {e}")
             text_file_logger = logging.getLogger()
             text_file_logger.exception(e)
             await snes_disconnect(ctx)
+        finally:
+            ctx.snes_memory_snapshot = None
 
 
 async def run_game(romfile: str) -> None:
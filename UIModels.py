@@ -0,0 +1,136 @@
+"""
+Data behind the log and hint views of kvui, kept free of kivy so that it can be used and measured headless.
+"""
+from __future__ import annotations
+
+import bisect
+import collections
+import typing
+
+__all__ = ["LogBuffer", "HintRows"]
+
+Row = typing.Dict[str, typing.Any]
+HintKey = typing.Tuple[int, int]
+"""finding player and location of a hint"""
+
+
+class LogBuffer:
+    """Entries of a bounded log view that were added since the view was last updated.
+
+    Entries are collected as they are logged and added to the view's data by flush_into, at most once per frame,
+    and only the newest `size` entries are ever kept."""
+    size: int
+    pending: typing.Deque[Row]
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.pending = collections.deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def append(self, entry: Row) -> None:
+        self.pending.append(entry)
+
+    def flush_into(self, data: typing.MutableSequence[Row]) -> bool:
+        """Adds the pending entries to data, dropping its oldest entries beyond size, returns if data changed."""
+        if not self.pending:
+            return False
+        if len(self.pending) == self.size:
+            data[:] = self.pending
+        else:
+            data.extend(self.pending)
+            excess = len(data) - self.size
+            if excess > 0:
+                del data[:excess]
+        self.pending.clear()
+        return True
+
+
+class HintRows:
+    """Rows of the hint table by hint, in sorted order.
+
+    The rows of unchanged hints are kept between updates, so only the rows of new and changed hints are built and
+    put in place."""
+    make_row: typing.Callable[[typing.Dict[str, typing.Any]], Row]
+    sorter: typing.Optional[typing.Callable[[Row], typing.Any]]
+    reversed: bool
+    rows: typing.Dict[HintKey, Row]
+    hints: typing.Dict[HintKey, typing.Dict[str, typing.Any]]
+    """copies of the hints the rows were built from"""
+    order: typing.List[typing.Tuple[typing.Any, int, HintKey]]
+    """sort value, arrival and key of each row, ascending, so that rows with equal values stay in order of arrival"""
+
+    def __init__(self, make_row: typing.Callable[[typing.Dict[str, typing.Any]], Row]) -> None:
+        self.make_row = make_row
+        self.sorter = None
+        self.reversed = False
+        self.rows = {}
+        self.hints = {}
+        self.order = []
+        self._positions: typing.Dict[HintKey, typing.Tuple[typing.Any, int, HintKey]] = {}
+        self._arrivals: typing.Dict[HintKey, int] = {}
+        self._arrival = 0
+
+    def clear(self) -> None:
+        """Drops all rows, for when the way rows are built changed."""
+        self.sorter = None
+        self.rows.clear()
+        self.hints.clear()
+        self.order.clear()
+        self._positions.clear()
+        self._arrivals.clear()
+
+    def _place(self, key: HintKey) -> None:
+        assert self.sorter
+        arrival = self._arrivals[key]
+        position = self.sorter(self.rows[key]), -arrival if self.reversed else arrival, key
+        self._positions[key] = position
+        bisect.insort(self.order, position)
+
+    def _remove(self, key: HintKey) -> None:
+        position = self._positions.pop(key)
+        del self.order[bisect.bisect_left(self.order, position)]
+
+    def update(self, hints: typing.Iterable[typing.Dict[str, typing.Any]],
+               sorter: typing.Callable[[Row], typing.Any], reversed: bool) -> bool:
+        """Brings the rows up to date with hints and the sort order, returns if anything changed."""
+        changed = False
+        if sorter is not self.sorter or reversed != self.reversed:
+            self.sorter, self.reversed = sorter, reversed
+            self._positions.clear()
+            self.order.clear()
+            for key in self.rows:
+                self._place(key)
+            changed = True
+
+        seen: typing.Set[HintKey] = set()
+        for hint in hints:
+            key = hint["finding_player"], hint["location"]
+            seen.add(key)
+            if key in self.hints:
+                if self.hints[key] == hint:
+                    continue
+                self._remove(key)
+            else:
+                self._arrivals[key] = self._arrival
+                self._arrival += 1
+            self.hints[key] = dict(hint)
+            self.rows[key] = self.make_row(hint)
+            self._place(key)
+            changed = True
+
+        if len(seen) != len(self.rows):
+            for key in [key for key in self.rows if key not in seen]:
+                self._remove(key)
+                del self.rows[key]
+                del self.hints[key]
+                del self._arrivals[key]
+            changed = True
+        return changed
+
+    def __iter__(self) -> typing.Iterator[Row]:
+        """Rows in the order they are shown."""
+        rows = self.rows
+        positions = reversed(self.order) if self.reversed else self.order
+        return (rows[key] for _, _, key in positions)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import json
+import struct
 import typing
 import builtins
 import os
 import itertools
+import math
 import subprocess
 import sys
 import pickle
@@ -15,8 +18,10 @@ import collections
 import importlib
 import logging
 import warnings
+import zlib
 
 from argparse import Namespace
+from array import array
 from settings import Settings, get_settings
 from time import sleep
 from typing import BinaryIO, Coroutine, Optional, Set, Dict, Any, Union, TypeGuard
@@ -389,7 +394,198 @@ def get_file_safe_name(name: str) -> str:
     return "".join(c for c in name if c not in '<>:"/\\|?*')
 
 
+class CachedNames(typing.Mapping[int, str]):
+    """id -> name table of a cached data package, names are only decoded when they are looked up."""
+    _ids: memoryview
+    _offsets: memoryview
+    _names: memoryview
+    _decoded: Dict[int, str]
+
+    def __init__(self, ids: memoryview, offsets: memoryview, names: memoryview) -> None:
+        self._ids = ids
+        self._offsets = offsets
+        self._names = names
+        self._decoded = {}
+
+    def __getitem__(self, code: int) -> str:
+        name = self._decoded.get(code)
+        if name is None:
+            index = bisect.bisect_left(self._ids, code)
+            if index == len(self._ids) or self._ids[index] != code:
+                raise KeyError(code)
+            name = self._decoded[code] = str(self._names[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+        return name
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class CachedDataPackage(typing.NamedTuple):
+    game: str
+    checksum: str
+    item_names: CachedNames
+    location_names: CachedNames
+    extra: memoryview
+    """json of the other fields of the data package, such as name groups"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the data package as it was stored."""
+        data: Dict[str, Any] = json.loads(str(self.extra, "utf-8"))
+        data["item_name_to_id"] = {name: code for code, name in self.item_names.items()}
+        data["location_name_to_id"] = {name: code for code, name in self.location_names.items()}
+        data["checksum"] = self.checksum
+        return data
+
+
+class DataPackageCache:
+    """
+    Data packages the client got from servers, by game and checksum, in one binary file.
+
+    The file starts with a header and a json index of the entries, followed by one section per entry with sorted id
+    arrays and name tables, so that a data package can be used without parsing anything but the index.
+    Entries are only decoded when they are looked up and their names when they are first used, see CachedNames.
+    """
+    version = 1
+    magic = b"MWDP"
+    max_checksums: int = 3
+    """entries kept per game, the oldest are dropped when a game gets more"""
+
+    path: str
+    _data: bytes
+    _index: Dict[typing.Tuple[str, str], typing.Tuple[int, int]]
+    """(offset, size) of the entries by game and checksum, in the order they were stored"""
+    _stat: typing.Optional[typing.Tuple[int, int]]
+    _header = struct.Struct("<4sIcxxxI")  # magic, version, byte order, index size
+    _entry_header = struct.Struct("<III4x")  # item count, location count, extra size
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._data = b""
+        self._index = {}
+        self._stat = None
+
+    def _load(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self._data, self._index, self._stat = b"", {}, None
+            return
+        if (stat.st_mtime_ns, stat.st_size) == self._stat:
+            return
+        self._data, self._index, self._stat = b"", {}, (stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            magic, version, byte_order, index_size = self._header.unpack_from(data)
+            if magic != self.magic or version != self.version or byte_order != sys.byteorder[0].encode():
+                logging.debug(f"Ignoring data package cache {self.path} of another version.")
+                return
+            index = json.loads(data[self._header.size:self._header.size + index_size])
+            self._data = data
+            self._index = {(game, checksum): (offset, size) for game, checksum, offset, size in index}
+        except Exception as e:
+            logging.debug(f"Could not read data package cache: {e}")
+
+    def get(self, game: str, checksum: str) -> Optional[CachedDataPackage]:
+        self._load()
+        location = self._index.get((game, checksum))
+        if location is None:
+            return None
+        offset, size = location
+        view = memoryview(self._data)[offset:offset + size]
+        item_count, location_count, extra_size = self._entry_header.unpack_from(view)
+        position = self._entry_header.size
+        tables: typing.List[CachedNames] = []
+        for count in (item_count, location_count):
+            ids = view[position:position + count * 8].cast("q")
+            position += count * 8
+            offsets = view[position:position + (count + 1) * 4].cast("I")
+            position += (count + 1) * 4
+            names = view[position:position + offsets[count]]
+            position += -(-offsets[count] // 8) * 8
+            tables.append(CachedNames(ids, offsets, names))
+        return CachedDataPackage(game, checksum, tables[0], tables[1], view[position:position + extra_size])
+
+    @classmethod
+    def _encode(cls, data: Dict[str, Any]) -> bytes:
+        parts: typing.List[bytes] = []
+        counts: typing.List[int] = []
+        for key in ("item_name_to_id", "location_name_to_id"):
+            id_to_name = {code: name for name, code in data[key].items()}
+            ids = array("q", sorted(id_to_name))
+            names = [id_to_name[code].encode("utf-8") for code in ids]
+            offsets = array("I", itertools.accumulate(map(len, names), initial=0))
+            names_size = offsets[-1]
+            parts += (ids.tobytes(), offsets.tobytes(), b"".join(names), bytes(-names_size % 8))
+            counts.append(len(ids))
+        extra = json.dumps({key: value for key, value in data.items()
+                            if key not in {"item_name_to_id", "location_name_to_id", "checksum"}},
+                           ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return cls._entry_header.pack(counts[0], counts[1], len(extra)) + b"".join(parts) + extra
+
+    def store(self, games: Dict[str, Dict[str, Any]]) -> None:
+        """Adds the data packages of games, with their checksums, to the cache file."""
+        self._load()
+        entries = {key: self._data[offset:offset + size] for key, (offset, size) in self._index.items()}
+        for game, data in games.items():
+            checksum = data.get("checksum")
+            if checksum and game:
+                entries.pop((game, checksum), None)
+                entries[game, checksum] = self._encode(data)
+                stored = [key for key in entries if key[0] == game]
+                for key in stored[:-self.max_checksums]:
+                    del entries[key]
+
+        index: typing.List[typing.Tuple[str, str, int, int]] = []
+        # offsets depend on the size of the index, which depends on the offsets
+        start = 0
+        while True:
+            index.clear()
+            offset = start
+            for (game, checksum), entry in entries.items():
+                index.append((game, checksum, offset, len(entry)))
+                offset += -(-len(entry) // 8) * 8
+            index_data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            data_start = -(-(self._header.size + len(index_data)) // 8) * 8
+            if data_start == start:
+                break
+            start = data_start
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                header = self._header.pack(self.magic, self.version, sys.byteorder[0].encode(), len(index_data))
+                f.write(header + index_data + bytes(start - len(header) - len(index_data)))
+                for entry in entries.values():
+                    f.write(entry)
+                    f.write(bytes(-len(entry) % 8))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logging.debug(f"Could not store data packages: {e}")
+        self._stat = None
+
+
+@cache_argsless
+def get_data_package_cache() -> DataPackageCache:
+    return DataPackageCache(cache_path("datapackage", "datapackages.bin"))
+
+
+def load_cached_data_package(game: str, checksum: typing.Optional[str]) -> Optional[CachedDataPackage]:
+    """Returns the data package of game with checksum from the client's cache, with names decoded only when used."""
+    if checksum and game:
+        return get_data_package_cache().get(game, checksum)
+    return None
+
+
 def load_data_package_for_checksum(game: str, checksum: typing.Optional[str]) -> Dict[str, Any]:
+    cached = load_cached_data_package(game, checksum)
+    if cached:
+        return cached.to_dict()
+
+    # fall back to json files of older versions
     if checksum and game:
         if checksum != get_file_safe_name(checksum):
             raise ValueError(f"Bad symbols in checksum: {checksum}")
@@ -410,18 +606,12 @@ def load_data_package_for_checksum(game: str, checksum: typing.Optional[str]) ->
     return {}
 
 
+def store_data_packages_for_checksums(games: typing.Dict[str, typing.Dict[str, Any]]) -> None:
+    get_data_package_cache().store(games)
+
+
 def store_data_package_for_checksum(game: str, data: typing.Dict[str, Any]) -> None:
-    checksum = data.get("checksum")
-    if checksum and game:
-        if checksum != get_file_safe_name(checksum):
-            raise ValueError(f"Bad symbols in checksum: {checksum}")
-        game_folder = cache_path("datapackage", get_file_safe_name(game))
-        os.makedirs(game_folder, exist_ok=True)
-        try:
-            with open(os.path.join(game_folder, f"{checksum}.json"), "w", encoding="utf-8-sig") as f:
-                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
-        except Exception as e:
-            logging.debug(f"Could not store data package: {e}")
+    store_data_packages_for_checksums({game: data})
 
 
 def get_default_adjuster_settings(game_name: str) -> Namespace:
@@ -508,6 +698,69 @@ def restricted_loads(s: bytes) -> Any:
     return RestrictedUnpickler(io.BytesIO(s)).load()
 
 
+def restricted_load(file: typing.BinaryIO) -> Any:
+    """Helper function analogous to pickle.load()."""
+    return RestrictedUnpickler(file).load()
+
+
+class ZlibWriter(io.RawIOBase):
+    """Writes a zlib stream into file, as zlib.compress would return it, without holding the uncompressed data."""
+
+    def __init__(self, file: typing.BinaryIO, level: int = 9) -> None:
+        super().__init__()
+        self._file = file
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: typing.Union[bytes, bytearray, memoryview]) -> int:
+        self._file.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self) -> None:
+        """Writes the end of the zlib stream, the file itself stays open."""
+        if not self.closed:
+            self._file.write(self._compressor.flush())
+        super().close()
+
+
+class ZlibReader(io.RawIOBase):
+    """Reads a zlib stream from file, decompressing it as it gets read. Wrap in io.BufferedReader for pickle."""
+    chunk_size: int = 64 * 1024
+
+    def __init__(self, file: typing.BinaryIO) -> None:
+        super().__init__()
+        self._file = file
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = len(buffer)
+        while size and not self._decompressor.eof:
+            data = self._decompressor.unconsumed_tail or self._file.read(self.chunk_size)
+            if not data:
+                raise EOFError("Compressed data ended before the end-of-stream marker was reached")
+            chunk = self._decompressor.decompress(data, size)
+            if chunk:
+                buffer[:len(chunk)] = chunk
+                return len(chunk)
+        return 0
+
+
+def dump_compressed(obj: Any, file: typing.BinaryIO, level: int = 9) -> None:
+    """Pickles obj into file as a zlib stream, readable with load_compressed or zlib.decompress, in chunks."""
+    with ZlibWriter(file, level) as writer:
+        pickle.Pickler(writer).dump(obj)
+
+
+def load_compressed(file: typing.BinaryIO) -> Any:
+    """Unpickles a zlib stream from file with the RestrictedUnpickler, decompressing it while it gets unpickled."""
+    return restricted_load(io.BufferedReader(ZlibReader(file)))
+
+
 class ByValue:
     """
     Mixin for enums to pickle value instead of name (restores pre-3.11 behavior). Use as left-most parent.
@@ -684,7 +937,16 @@ def format_SI_prefix(value, power=1000, power_labels=("", "k", "M", "G", "T", "P
     return f"{value.quantize(decimal.Decimal('1.00'))} {chaining_prefix(n, power_labels)}"
 
 
-def get_fuzzy_results(input_word: str, word_list: typing.Collection[str], limit: typing.Optional[int] = None) \
+def get_fuzzy_results(input_word: str, word_list: typing.Union[typing.Collection[str], FuzzyMatcher],
+                      limit: typing.Optional[int] = None) -> typing.List[typing.Tuple[str, int]]:
+    if isinstance(word_list, FuzzyMatcher):
+        return word_list.get_results(input_word, limit)
+    if limit and limit < len(word_list):
+        return FuzzyMatcher(word_list).get_results(input_word, limit)
+    return _get_all_fuzzy_results(input_word, word_list, limit)
+
+
+def _get_all_fuzzy_results(input_word: str, word_list: typing.Collection[str], limit: typing.Optional[int] = None) \
         -> typing.List[typing.Tuple[str, int]]:
     import jellyfish
 
@@ -707,7 +969,101 @@ def get_fuzzy_results(input_word: str, word_list: typing.Collection[str], limit:
     )
 
 
-def get_intended_text(input_text: str, possible_answers) -> typing.Tuple[str, bool, str]:
+class FuzzyMatcher:
+    """
+    Finds the closest names to an input with the same results as get_fuzzy_results, for a collection of names that
+    gets matched against repeatedly.
+
+    Names are visited best first by an upper bound of their score, which comes from the difference in length and in
+    the characters of name and input, as every edit changes at most one character of either.
+    The edit distance is only computed for names that can still be among the results.
+    jellyfish counts edits of grapheme clusters, so names with characters that may combine into one are always
+    visited.
+    """
+    names: typing.Collection[str]
+    """the collection the matcher was built from"""
+
+    def __init__(self, names: typing.Collection[str]) -> None:
+        self.names = names
+        self._words = list(names)
+        self._lowered = [word.lower() for word in self._words]
+        by_length: Dict[typing.Optional[typing.Tuple[int, int]], typing.List[int]] = collections.defaultdict(list)
+        for index, (word, lowered) in enumerate(zip(self._words, self._lowered)):
+            by_length[(len(word), len(lowered)) if self._is_simple(lowered) else None].append(index)
+        self._by_length = dict(by_length)
+
+    @staticmethod
+    def _is_simple(text: str) -> bool:
+        """if every character of text is a grapheme cluster of its own, so that lengths and edits can be counted in
+        characters; below the combining diacritical marks and without line breaks"""
+        return not text or (" " <= min(text) and max(text) < "\u0300")
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def get_results(self, input_word: str, limit: typing.Optional[int] = None) -> typing.List[typing.Tuple[str, int]]:
+        """Returns the `limit` best matches of input_word with their score in percent, the best first."""
+        if not limit or limit >= len(self._words) or not self._is_simple(input_word.lower()):
+            return _get_all_fuzzy_results(input_word, self._words, limit)
+
+        import heapq
+        import jellyfish
+
+        words, lowered_words = self._words, self._lowered
+        length = len(input_word)
+        lowered = input_word.lower()
+        lowered_length = len(lowered)
+        character_counts = collections.Counter(lowered).items()
+
+        # bounds of the length groups, from the difference in length alone
+        groups = sorted(((1.01 if key is None or key == (length, lowered_length) else
+                          1 - abs(lowered_length - key[1]) / max(length, key[0]), index)
+                         for index, key in enumerate(self._by_length)), reverse=True)
+        group_keys = list(self._by_length)
+        group_index = 0
+        candidates: typing.List[typing.Tuple[float, int]] = []  # heap of negated bound and index
+        best: typing.List[typing.Tuple[float, int]] = []  # heap of score and negated index, the worst first
+
+        while True:
+            group_bound = groups[group_index][0] if group_index < len(groups) else -math.inf
+            if candidates and -candidates[0][0] >= group_bound:
+                bound, index = heapq.heappop(candidates)
+                if len(best) == limit and -bound < best[0][0]:
+                    break
+                word = words[index]
+                if word == input_word:
+                    score = 1.01
+                else:
+                    score = (1 - jellyfish.damerau_levenshtein_distance(lowered, lowered_words[index])
+                             / max(length, len(word)))
+                if len(best) < limit:
+                    heapq.heappush(best, (score, -index))
+                elif (score, -index) > best[0]:
+                    heapq.heapreplace(best, (score, -index))
+            elif group_index < len(groups):
+                if len(best) == limit and group_bound < best[0][0]:
+                    break
+                key = group_keys[groups[group_index][1]]
+                for index in self._by_length[key]:
+                    word = words[index]
+                    if key is None or word == input_word:
+                        bound = 1.01
+                    else:
+                        lowered_word = lowered_words[index]
+                        shared = sum(min(count, lowered_word.count(character))
+                                     for character, count in character_counts)
+                        bound = 1 - (max(lowered_length, len(lowered_word)) - shared) / max(length, len(word))
+                    if len(best) < limit or bound >= best[0][0]:
+                        heapq.heappush(candidates, (-bound, index))
+                group_index += 1
+            else:
+                break
+
+        return [(words[-negated_index], int(score * 100)) for score, negated_index in sorted(best, reverse=True)]
+
+
+def get_intended_text(input_text: str, possible_answers: typing.Union[typing.Collection[str], FuzzyMatcher]) \
+        -> typing.Tuple[str, bool, str]:
     picks = get_fuzzy_results(input_text, possible_answers, limit=2)
     if len(picks) > 1:
         dif = picks[0][1] - picks[1][1]
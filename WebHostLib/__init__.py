@@ -41,6 +41,8 @@ app.config["JOB_THRESHOLD"] = 1
 app.config["JOB_TIME"] = 600
 # memory limit for generator processes in bytes
 app.config["GENERATOR_MEMORY_LIMIT"] = 4294967296
+# fork generators from a template process with the worlds already imported, where supported
+app.config["GENERATOR_PRELOAD"] = True
 app.config['SESSION_PERMANENT'] = True
 # set worlds requested to be removed by maintainer as hidden by default
 app.config['HIDDEN_WEBWORLDS'] = ["Super Mario World", "Sonic Adventure 2 Battle", "Celeste 64", "Donkey Kong Country 3"]
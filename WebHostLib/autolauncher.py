@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import multiprocessing
+import sys
+import time
 import typing
 from datetime import timedelta, datetime
 from threading import Event, Thread
@@ -11,7 +14,7 @@ from uuid import UUID
 
 from pony.orm import db_session, select, commit, PrimaryKey
 
-from Utils import restricted_loads
+from Utils import format_SI_prefix, restricted_loads
 from .locker import Locker, AlreadyRunningException
 
 _stop_event = Event()
@@ -25,8 +28,20 @@ def stop():
     stop_event.set()
 
 
-def handle_generation_success(seed_id):
-    logging.info(f"Generation finished for seed {seed_id}")
+class GenerationMetrics(typing.NamedTuple):
+    queue_wait: float
+    """seconds from queueing the generation to a generator picking it up"""
+    generation_time: float
+    """seconds spent generating and uploading the seed"""
+    peak_rss: int | None
+    """highest resident memory of the generator process so far in bytes, if known"""
+
+
+def handle_generation_success(result: tuple[PrimaryKey | None, GenerationMetrics]):
+    seed_id, metrics = result
+    peak_rss = f"{format_SI_prefix(metrics.peak_rss, 1024)}iB" if metrics.peak_rss else "unknown"
+    logging.info(f"Generation finished for seed {seed_id} after {metrics.queue_wait:.2f}s queued and "
+                 f"{metrics.generation_time:.2f}s generating, generator peak RSS {peak_rss}")
 
 
 def handle_generation_failure(result: BaseException):
@@ -36,13 +51,24 @@ def handle_generation_failure(result: BaseException):
         logging.exception(e)
 
 
-def _mp_gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None, sid=None) -> PrimaryKey | None:
+def _get_peak_rss() -> int | None:
+    try:
+        import resource
+    except ModuleNotFoundError:
+        return None  # unix only module
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024  # kibibytes outside of macOS
+
+
+def _mp_gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None, sid=None,
+                 queued: float | None = None) -> tuple[PrimaryKey | None, GenerationMetrics]:
     from setproctitle import setproctitle
 
+    start = time.time()
     setproctitle(f"Generator ({sid})")
     res = gen_game(gen_options, meta=meta, owner=owner, sid=sid)
     setproctitle(f"Generator (idle)")
-    return res
+    return res, GenerationMetrics(start - queued if queued else 0, time.time() - start, _get_peak_rss())
 
 
 def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
@@ -53,7 +79,8 @@ def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
         pool.apply_async(_mp_gen_game, (options,),
                          {"meta": meta,
                           "sid": generation.id,
-                          "owner": generation.owner},
+                          "owner": generation.owner,
+                          "queued": time.time()},
                          handle_generation_success, handle_generation_failure)
     except Exception as e:
         generation.state = STATE_ERROR
@@ -63,10 +90,27 @@ def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
         generation.state = STATE_STARTED
 
 
+def get_generator_context(config: dict[str, Any]) -> multiprocessing.context.BaseContext:
+    """Returns the multiprocessing context to create the generator pool with.
+
+    With GENERATOR_PRELOAD, generators are forked from a template process that imported the worlds, and with them the
+    data package, once. They then start in a fraction of a second instead of importing everything on their own.
+    Forking the WebHost process itself would start them as quickly, but it runs threads and has the database bound,
+    which forked generators must not inherit, so WebHost.py sets spawn as the default start method."""
+    if config["GENERATOR_PRELOAD"] and "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["worlds", __name__])
+        return context
+    return multiprocessing.get_context()
+
+
 def init_generator(config: dict[str, Any]) -> None:
     from setproctitle import setproctitle
+    from . import app
 
     setproctitle("Generator (idle)")
+    # generators that were not forked from the WebHost process start out with the default config
+    app.config.update(config)
 
     try:
         import resource
@@ -99,6 +143,84 @@ def cleanup():
         logging.info(f"{rooms} Rooms, {seeds} Seeds and {slots} Slots have been deleted.")
 
 
+class RoomScheduler:
+    """Hands rooms that became active to their hoster without rescanning every recent room on each tick.
+
+    The first tick looks at all rooms active in the last 3 days. Later ticks only query rooms whose last_activity
+    changed since the previous tick, through its index, and rooms that a hoster finished shutting down."""
+    overlap: typing.ClassVar[timedelta] = timedelta(seconds=10)
+    """Activity can be committed a bit after its timestamp was taken, so each query reaches back this far."""
+
+    hosters: typing.Sequence[MultiworldInstance]
+    since: datetime | None
+    active: dict[UUID, datetime]
+    """last_activity of each room that was handed out, to hand out each activation only once"""
+    expiry: list[tuple[datetime, UUID, datetime]]
+    """heap of (timeout, room id, last_activity) to forget active rooms once they timed out"""
+
+    # scan cost metrics
+    ticks: int
+    scanned_rooms: int
+    started_rooms: int
+    scan_time: float
+
+    def __init__(self, hosters: typing.Sequence[MultiworldInstance]):
+        self.hosters = hosters
+        self.since = None
+        self.active = {}
+        self.expiry = []
+        self.ticks = 0
+        self.scanned_rooms = 0
+        self.started_rooms = 0
+        self.scan_time = 0
+
+    def tick(self) -> None:
+        start = time.perf_counter()
+        now = datetime.utcnow()
+        since = now - timedelta(days=3) if self.since is None else self.since - self.overlap
+        self.since = now
+
+        while self.expiry and self.expiry[0][0] < now:
+            _, room_id, last_activity = heapq.heappop(self.expiry)
+            if self.active.get(room_id) == last_activity:
+                del self.active[room_id]
+
+        shut_down: set[UUID] = set()
+        for hoster in self.hosters:
+            shut_down.update(hoster.get_rooms_shut_down())
+        for room_id in shut_down:
+            self.active.pop(room_id, None)
+
+        with db_session:
+            for room in select(room for room in Room if room.last_activity >= since):
+                shut_down.discard(room.id)
+                self._consider(room, now)
+            # a room may have been activated again while shutting down
+            for room_id in shut_down:
+                room = Room.get(id=room_id)
+                if room:
+                    self._consider(room, now)
+
+        self.ticks += 1
+        self.scan_time += time.perf_counter() - start
+
+    def _consider(self, room: Room, now: datetime) -> None:
+        self.scanned_rooms += 1
+        if self.active.get(room.id) == room.last_activity:
+            return  # already handed out
+        # the per-room timeout can't currently be PonyORM transpiled, so it is checked here
+        timeout = room.last_activity + timedelta(seconds=room.timeout + 5)
+        if timeout >= now:
+            self.active[room.id] = room.last_activity
+            heapq.heappush(self.expiry, (timeout, room.id, room.last_activity))
+            self.hosters[room.id.int % len(self.hosters)].start_room(room.id)
+            self.started_rooms += 1
+
+    def log_metrics(self) -> None:
+        logging.info(f"Autohost: {self.ticks} ticks took {self.scan_time:.3f}s, looked at {self.scanned_rooms} rooms "
+                     f"and started {self.started_rooms}. {len(self.active)} rooms are active.")
+
+
 def autohost(config: dict):
     def keep_running():
         stop_event = _stop_event
@@ -111,15 +233,11 @@ def autohost(config: dict):
                     hosters.append(hoster)
                     hoster.start()
 
+                scheduler = RoomScheduler(hosters)
                 while not stop_event.wait(0.1):
-                    with db_session:
-                        rooms = select(
-                            room for room in Room if
-                            room.last_activity >= datetime.utcnow() - timedelta(days=3))
-                        for room in rooms:
-                            # we have to filter twice, as the per-room timeout can't currently be PonyORM transpiled.
-                            if room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
-                                hosters[room.id.int % len(hosters)].start_room(room.id)
+                    scheduler.tick()
+                    if scheduler.ticks % 36000 == 0:  # hourly
+                        scheduler.log_metrics()
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -133,8 +251,8 @@ def autogen(config: dict):
         try:
             with Locker("autogen"):
 
-                with multiprocessing.Pool(config["GENERATORS"], initializer=init_generator,
-                                          initargs=(config,), maxtasksperchild=10) as generator_pool:
+                with get_generator_context(config).Pool(config["GENERATORS"], initializer=init_generator,
+                                                        initargs=(config,), maxtasksperchild=10) as generator_pool:
                     with db_session:
                         to_start = select(generation for generation in Generation if generation.state == STATE_STARTED)
 
@@ -191,9 +309,16 @@ class MultiworldInstance():
         process.start()
         self.process = process
 
-    def start_room(self, room_id):
+    def get_rooms_shut_down(self) -> typing.List[UUID]:
+        """Forgets and returns the rooms that finished shutting down since the last call."""
+        rooms = []
         while not self.rooms_shutting_down.empty():
-            self.room_ids.remove(self.rooms_shutting_down.get(block=True, timeout=None))
+            room_id = self.rooms_shutting_down.get(block=True, timeout=None)
+            self.room_ids.remove(room_id)
+            rooms.append(room_id)
+        return rooms
+
+    def start_room(self, room_id):
         if room_id in self.room_ids:
             pass  # should already be hosted currently.
         else:
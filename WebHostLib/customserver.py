@@ -86,19 +86,6 @@ class WebHostContext(Context):
             setattr(self, key, value)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
-    def listen_to_db_commands(self):
-        cmdprocessor = DBCommandProcessor(self)
-
-        while not self.exit_event.is_set():
-            with db_session:
-                commands = select(command for command in Command if command.room.id == self.room_id)
-                if commands:
-                    for command in commands:
-                        self.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
-                        command.delete()
-                    commit()
-            time.sleep(5)
-
     @db_session
     def load(self, room_id: int):
         self.room_id = room_id
@@ -154,7 +141,6 @@ class WebHostContext(Context):
             if savegame_data:
                 self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
             self._start_async_saving(atexit_save=False)
-        threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
@@ -171,6 +157,57 @@ class WebHostContext(Context):
         return d
 
 
+class CommandDispatcher(threading.Thread):
+    """Hands the commands queued in the database to the rooms hosted by this process.
+
+    Pending commands of all rooms are fetched with a single query per interval, instead of one query per room."""
+    interval: float
+    _rooms: typing.Dict[typing.Any, typing.Tuple[WebHostContext, DBCommandProcessor]]
+
+    def __init__(self, interval: float = 1):
+        super().__init__(name="CommandDispatcher", daemon=True)
+        self.interval = interval
+        self._rooms = {}
+        self._lock = threading.Lock()
+
+    def register(self, ctx: WebHostContext) -> None:
+        with self._lock:
+            self._rooms[ctx.room_id] = ctx, DBCommandProcessor(ctx)
+
+    def unregister(self, room_id) -> None:
+        with self._lock:
+            self._rooms.pop(room_id, None)
+
+    def dispatch(self) -> int:
+        """Hands out all pending commands of registered rooms once. Returns the number of commands handed out."""
+        with self._lock:
+            rooms = {room_id: room for room_id, room in self._rooms.items() if not room[0].exit_event.is_set()}
+        if not rooms:
+            return 0
+
+        dispatched = 0
+        room_ids = list(rooms)
+        with db_session:
+            # only the commands of this process' rooms, the other hoster processes pick up theirs
+            for command in select(command for command in Command
+                                  if command.room.id in room_ids).order_by(Command.id):  # type: ignore
+                ctx, cmdprocessor = rooms[command.room.id]
+                ctx.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
+                command.delete()
+                dispatched += 1
+            if dispatched:
+                commit()
+        return dispatched
+
+    def run(self) -> None:
+        while True:
+            try:
+                self.dispatch()
+            except Exception as e:
+                logging.exception(e)
+            time.sleep(self.interval)
+
+
 def get_random_port():
     return random.randint(49152, 65535)
 
@@ -178,10 +215,12 @@ def get_random_port():
 @cache_argsless
 def get_static_server_data() -> dict:
     import worlds
+    # built from the data package store where possible, without going through the world classes
+    games_package = worlds.network_data_package["games"]
     data = {
         "non_hintable_names": {
-            world_name: world.hint_blacklist
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: worlds.get_hint_blacklist(world_name)
+            for world_name in games_package
         },
         "gamespackage": {
             world_name: {
@@ -189,15 +228,15 @@ def get_static_server_data() -> dict:
                 for key, value in game_package.items()
                 if key not in ("item_name_groups", "location_name_groups")
             }
-            for world_name, game_package in worlds.network_data_package["games"].items()
+            for world_name, game_package in games_package.items()
         },
         "item_name_groups": {
-            world_name: world.item_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: game_package["item_name_groups"]
+            for world_name, game_package in games_package.items()
         },
         "location_name_groups": {
-            world_name: world.location_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: game_package["location_name_groups"]
+            for world_name, game_package in games_package.items()
         },
     }
 
@@ -270,6 +309,8 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
     gc.collect()  # free intermediate objects used during setup
 
     loop = asyncio.get_event_loop()
+    command_dispatcher = CommandDispatcher()
+    command_dispatcher.start()
 
     async def start_room(room_id):
         with Locker(f"RoomLocker {room_id}"):
@@ -278,6 +319,7 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 ctx = WebHostContext(static_server_data, logger)
                 ctx.load(room_id)
                 ctx.init_save()
+                command_dispatcher.register(ctx)
                 assert ctx.server is None
                 try:
                     ctx.server = websockets.serve(
@@ -328,6 +370,7 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                     ctx._save()
                     setattr(asyncio.current_task(), "save", None)
             finally:
+                command_dispatcher.unregister(room_id)
                 try:
                     ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
                     ctx.exit_event.set()  # make sure the saving thread stops at some point
@@ -1,7 +1,8 @@
 import datetime
 import collections
+import threading
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, NamedTuple, Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, NamedTuple, Counter
 from uuid import UUID
 from email.utils import parsedate_to_datetime
 
@@ -17,7 +18,6 @@ from .models import GameDataPackage, Room
 # Multisave is currently updated, at most, every minute.
 TRACKER_CACHE_TIMEOUT_IN_SECONDS = 60
 
-_multidata_cache = {}
 _multiworld_trackers: Dict[str, Callable] = {}
 _player_trackers: Dict[str, Callable] = {}
 
@@ -25,6 +25,96 @@ TeamPlayer = Tuple[int, int]
 ItemMetadata = Tuple[int, int, int]
 
 
+class _LRUCache:
+    """Process-wide, thread-safe cache that evicts the least recently used entries once the sizes of the held entries
+    add up to more than max_size. Entries count as size 1 unless set with another size."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: "collections.OrderedDict[Hashable, Tuple[Any, int]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def set(self, key: Hashable, value: Any, size: int = 1) -> None:
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            if size > self.max_size:
+                return
+            self._entries[key] = value, size
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Decompressed multidata by seed id. It never changes for a seed, so entries only leave the cache by eviction.
+# Sized by the compressed multidata, as measuring the decompressed objects would cost about as much as loading them.
+_multidata_cache = _LRUCache(64 * 1024 * 1024)
+# Lookup tables built from a GameDataPackage by checksum. The checksum covers the contents, so these never go stale.
+_game_package_cache = _LRUCache(256)
+# (Room.multisave, loaded multisave) by room id. Not every save updates Room.last_activity, so the stored bytes are
+# compared instead, which fails on the length for most saves and is far cheaper than loading them either way.
+_multisave_cache = _LRUCache(256)
+
+
+class _GameLookups(NamedTuple):
+    item_id_to_name: Dict[int, str]
+    location_id_to_name: Dict[int, str]
+    item_name_to_id: Dict[str, int]
+    location_name_to_id: Dict[str, int]
+
+
+def _get_multidata(room: Room) -> Dict[str, Any]:
+    multidata = _multidata_cache.get(room.seed.id)
+    if multidata is None:
+        compressed = room.seed.multidata
+        multidata = Context.decompress(compressed)
+        _multidata_cache.set(room.seed.id, multidata, len(compressed))
+    return multidata
+
+
+def _get_multisave(room: Room) -> Dict[str, Any]:
+    stored = room.multisave
+    cached = _multisave_cache.get(room.id)
+    if cached is not None and cached[0] == stored:
+        return cached[1]
+    multisave = restricted_loads(stored) if stored else {}
+    _multisave_cache.set(room.id, (stored, multisave))
+    return multisave
+
+
+def _get_game_lookups(checksum: str) -> _GameLookups:
+    lookups = _game_package_cache.get(checksum)
+    if lookups is None:
+        game_package = restricted_loads(GameDataPackage.get(checksum=checksum).data)
+        lookups = _GameLookups(
+            KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
+                id: name for name, id in game_package["item_name_to_id"].items()}),
+            KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
+                id: name for name, id in game_package["location_name_to_id"].items()}),
+            game_package["item_name_to_id"],
+            game_package["location_name_to_id"],
+        )
+        _game_package_cache.set(checksum, lookups)
+    return lookups
+
+
 def _cache_results(func: Callable) -> Callable:
     """Stores the results of any computationally expensive methods after the initial call in TrackerData.
     If called again, returns the cached result instead, as results will not change for the lifetime of TrackerData.
@@ -45,6 +135,9 @@ def _cache_results(func: Callable) -> Callable:
 class TrackerData:
     """A helper dataclass that is instantiated each time an HTTP request comes in for tracker data.
 
+    The decompressed multidata, multisave and data package lookup tables are shared between instances through
+    process-wide caches and must not be modified.
+
     Provides helper methods to lazily load necessary data that each tracker require and caches any results so any
     subsequent helper method calls do not need to recompute results during the lifetime of this instance.
     """
@@ -56,14 +149,14 @@ class TrackerData:
     def __init__(self, room: Room):
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
-        self._multidata = Context.decompress(room.seed.multidata)
-        self._multisave = restricted_loads(room.multisave) if room.multisave else {}
+        self._multidata = _get_multidata(room)
+        self._multisave = _get_multisave(room)
         self._tracker_cache = {}
 
         self.item_name_to_id: Dict[str, Dict[str, int]] = {}
         self.location_name_to_id: Dict[str, Dict[str, int]] = {}
 
-        # Generate inverse lookup tables from data package, useful for trackers.
+        # Inverse lookup tables from data package, useful for trackers. Shared with other requests through the cache.
         self.item_id_to_name: Dict[str, Dict[int, str]] = KeyedDefaultDict(lambda game_name: {
             game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Item (ID: {code})")
         })
@@ -71,15 +164,13 @@ class TrackerData:
             game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
         })
         for game, game_package in self._multidata["datapackage"].items():
-            game_package = restricted_loads(GameDataPackage.get(checksum=game_package["checksum"]).data)
-            self.item_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
-                id: name for name, id in game_package["item_name_to_id"].items()})
-            self.location_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
-                id: name for name, id in game_package["location_name_to_id"].items()})
+            lookups = _get_game_lookups(game_package["checksum"])
+            self.item_id_to_name[game] = lookups.item_id_to_name
+            self.location_id_to_name[game] = lookups.location_id_to_name
 
             # Normal lookup tables as well.
-            self.item_name_to_id[game] = game_package["item_name_to_id"]
-            self.location_name_to_id[game] = game_package["location_name_to_id"]
+            self.item_name_to_id[game] = lookups.item_name_to_id
+            self.location_name_to_id[game] = lookups.location_name_to_id
 
     def get_seed_name(self) -> str:
         """Retrieves the seed name."""
@@ -4,7 +4,6 @@ import pickle
 import typing
 import uuid
 import zipfile
-import zlib
 
 from io import BytesIO
 from flask import request, flash, redirect, url_for, session, render_template, abort
@@ -15,7 +14,7 @@ import schema
 
 import MultiServer
 from NetUtils import SlotType
-from Utils import VersionException, __version__
+from Utils import VersionException, __version__, dump_compressed
 from worlds import GamesPackage
 from worlds.Files import AutoPatchRegister
 from worlds.AutoWorld import data_package_checksum
@@ -92,7 +91,10 @@ def process_multidata(compressed_multidata, files={}):
                            game=slot_info.game))
         flush()  # commit slots
 
-    compressed_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
+    output = BytesIO()
+    output.write(compressed_multidata[0:1])
+    dump_compressed(decompressed_multidata, output)
+    compressed_multidata = output.getvalue()
     return slots, compressed_multidata
 
 
@@ -27,6 +27,7 @@ cdef extern from *:
 ctypedef uint32_t ap_player_t  # on AMD64 this is faster (and smaller) than 64bit ints
 ctypedef uint32_t ap_flags_t
 ctypedef int64_t ap_id_t
+ctypedef uint32_t ap_sphere_t
 
 cdef ap_player_t MAX_PLAYER_ID = 1000000  # limit the size of indexing array
 cdef size_t INVALID_SIZE = <size_t>(-1)  # this is all 0xff... adding 1 results in 0, but it's not negative
@@ -62,6 +63,7 @@ cdef struct LocationEntry:
     ap_player_t receiver
     ap_id_t item
     ap_flags_t flags
+    ap_sphere_t sphere  # sphere + 1, 0 if unknown. uses what would otherwise be padding after flags
 
 
 cdef struct IndexEntry:
@@ -214,7 +216,55 @@ cdef class LocationStore:
     def items(self) -> Iterable[Tuple[int, PlayerLocationProxy]]:
         return self._items
 
+    cdef LocationEntry* _get(self, size_t sender, ap_id_t loc):
+        # This requires locations to be sorted.
+        cdef LocationEntry* entry = NULL
+        # binary search
+        cdef size_t l = self.sender_index[sender].start
+        cdef size_t e = l + self.sender_index[sender].count
+        cdef size_t r = e
+        cdef size_t m
+        while l < r:
+            m = (l + r) // 2
+            entry = self.entries + m
+            if entry.location < loc:
+                l = m + 1
+            else:
+                r = m
+        if l < e:
+            entry = self.entries + l
+            if entry.location == loc:
+                return entry
+        return NULL
+
     # specialized accessors
+    def set_spheres(self, spheres: Sequence[Dict[int, Set[int]]]) -> None:
+        """Remember the sphere of each location for get_sphere. Unknown players and locations are ignored."""
+        cdef LocationEntry* entry
+        cdef size_t sender
+        cdef ap_sphere_t sphere_number = 0
+        for sphere in spheres:
+            sphere_number += 1
+            for player, locations in sphere.items():
+                if player < 1 or player >= self.sender_index_size:
+                    continue
+                sender = player
+                for location in locations:
+                    entry = self._get(sender, location)
+                    if entry:
+                        entry.sphere = sphere_number
+
+    def get_sphere(self, player: int, location: int) -> int:
+        cdef LocationEntry* entry = NULL
+        cdef size_t sender
+        if 0 < player < self.sender_index_size:
+            sender = player
+            entry = self._get(sender, location)
+        if not entry or not entry.sphere:
+            raise KeyError(f"No Sphere found for location ID {location} belonging to player {player}. "
+                           f"Location or player may not exist.")
+        return entry.sphere - 1
+
     def find_item(self, slots: Set[int], seeked_item_id: int) -> Generator[Tuple[int, int, int, int, int], None, None]:
         cdef ap_id_t item = seeked_item_id
         cdef ap_player_t receiver
@@ -336,27 +386,9 @@ cdef class PlayerLocationProxy:
             yield entry.location
 
     cdef LocationEntry* _get(self, ap_id_t loc):
-        # This requires locations to be sorted.
         # This is always going to be slower than a pure python dict, because constructing the result tuple takes as long
         # as the search in a python dict, which stores a pointer to an existing tuple.
-        cdef LocationEntry* entry = NULL
-        # binary search
-        cdef size_t l = self._store.sender_index[self._player].start
-        cdef size_t e = l + self._store.sender_index[self._player].count
-        cdef size_t r = e
-        cdef size_t m
-        while l < r:
-            m = (l + r) // 2
-            entry = self._store.entries + m
-            if entry.location < loc:
-                l = m + 1
-            else:
-                r = m
-        if l < e:
-            entry = self._store.entries + l
-            if entry.location == loc:
-                return entry
-        return NULL
+        return self._store._get(self._player, loc)
 
     def __getitem__(self, key: int) -> Tuple[int, int, int]:
         cdef LocationEntry* entry = self._get(key)
@@ -20,7 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 ]]
 
-local SCRIPT_VERSION = 1
+local SCRIPT_VERSION = 2
 
 -- Set to log incoming requests
 -- Will cause lag due to large console output
@@ -37,6 +37,13 @@ field `type`. The value of `type` determines what other fields may exist.
 To get the script version, instead of JSON, send "VERSION" to get the script
 version directly (e.g. "2").
 
+Since version 2, a list of requests may instead be wrapped in an object with
+an `id`, which is copied to the object wrapping its responses. A client can
+send more lists before the responses to earlier ones arrive, and every list
+that has arrived is answered on the same frame. If `binary` is true, each
+`READ_RESPONSE` holds the `size` of its data instead of a base64 `value`, and
+the raw data of all reads follows the newline ending the response, in order.
+
 #### Ex. 1
 
 Request: `[{"type": "PING"}]`
@@ -97,6 +104,22 @@ Response:
 
 ---
 
+#### Ex. 5
+
+Request:
+
+```json
+{"id": 7, "binary": true, "requests": [{"type": "READ", "address": 500, "size": 4, "domain": "ROM"}]}
+```
+
+Response, followed by the 4 bytes `test`:
+
+```json
+{"id": 7, "responses": [{"type": "READ_RESPONSE", "size": 4}]}
+```
+
+---
+
 ### Supported Request Types
 
 - `PING`  
@@ -250,6 +273,8 @@ Response:
 
     Additional Fields:
     - `value` (`string`): A base64 string representing the read data
+    - `size` (`int`): Instead of `value` for binary request lists, the number
+    of raw bytes this response adds after the response line
 
 - `WRITE_RESPONSE`  
     Acknowledges `WRITE`.
@@ -285,6 +310,8 @@ if lua_major > 5 or (lua_major == 5 and lua_minor >= 3) then
     require("lua_5_3_compat")
 end
 
+local unpack = table.unpack or unpack
+
 local base64 = require("base64")
 local socket = require("socket")
 local json = require("json")
@@ -436,8 +463,9 @@ request_handlers = {
     ["READ"] = function (req)
         local res = {}
 
+        -- Encoded when the response is sent, as base64 or raw bytes
         res["type"] = "READ_RESPONSE"
-        res["value"] = base64.encode(memory.read_bytes_as_array(req["address"], req["size"], req["domain"]))
+        res["value"] = memory.read_bytes_as_array(req["address"], req["size"], req["domain"])
 
         return res
     end,
@@ -487,7 +515,44 @@ function process_request (req)
     end
 end
 
+-- Returns the bytes in an array as a string
+function bytes_to_string (bytes)
+    local chunks = {}
+    -- unpack is limited in how many values it can return at once
+    for i = 1, #bytes, 4096 do
+        chunks[#chunks + 1] = string.char(unpack(bytes, i, math.min(i + 4095, #bytes)))
+    end
+    return table.concat(chunks)
+end
+
+-- Executes a list of requests in order and returns the list of responses
+function process_requests (data)
+    local res = {}
+    local failed_guard_response = nil
+    for i, req in ipairs(data) do
+        if failed_guard_response ~= nil then
+            res[i] = failed_guard_response
+        else
+            -- An error is more likely to cause an NLua exception than to return an error here
+            local status, response = pcall(process_request, req)
+            if status then
+                res[i] = response
+
+                -- If the GUARD validation failed, skip the remaining commands
+                if response["type"] == "GUARD_RESPONSE" and not response["value"] then
+                    failed_guard_response = response
+                end
+            else
+                if type(response) ~= "string" then response = "Unknown error" end
+                res[i] = {type = "ERROR", err = response}
+            end
+        end
+    end
+    return res
+end
+
 -- Receive data from AP client and send message back
+-- Returns true if a message was received
 function send_receive ()
     local message, err = client_socket:receive()
 
@@ -497,15 +562,15 @@ function send_receive ()
             print("Connection to client closed")
         end
         current_state = STATE_NOT_CONNECTED
-        return
+        return false
     elseif err == "timeout" then
         unlock()
-        return
+        return false
     elseif err ~= nil then
         print(err)
         current_state = STATE_NOT_CONNECTED
         unlock()
-        return
+        return false
     end
 
     -- Reset timeout timer
@@ -519,31 +584,35 @@ function send_receive ()
     if message == "VERSION" then
         client_socket:send(tostring(SCRIPT_VERSION).."\n")
     else
-        local res = {}
         local data = json.decode(message)
-        local failed_guard_response = nil
-        for i, req in ipairs(data) do
-            if failed_guard_response ~= nil then
-                res[i] = failed_guard_response
-            else
-                -- An error is more likely to cause an NLua exception than to return an error here
-                local status, response = pcall(process_request, req)
-                if status then
-                    res[i] = response
-
-                    -- If the GUARD validation failed, skip the remaining commands
-                    if response["type"] == "GUARD_RESPONSE" and not response["value"] then
-                        failed_guard_response = response
+
+        if data["requests"] == nil then
+            local res = process_requests(data)
+            for _, response in ipairs(res) do
+                if response["type"] == "READ_RESPONSE" then
+                    response["value"] = base64.encode(response["value"])
+                end
+            end
+            client_socket:send(json.encode(res).."\n")
+        else
+            local res = process_requests(data["requests"])
+            local binary_data = {}
+            for _, response in ipairs(res) do
+                if response["type"] == "READ_RESPONSE" then
+                    if data["binary"] then
+                        binary_data[#binary_data + 1] = bytes_to_string(response["value"])
+                        response["size"] = #response["value"]
+                        response["value"] = nil
+                    else
+                        response["value"] = base64.encode(response["value"])
                     end
-                else
-                    if type(response) ~= "string" then response = "Unknown error" end
-                    res[i] = {type = "ERROR", err = response}
                 end
             end
+            client_socket:send(json.encode({id = data["id"], responses = res}).."\n"..table.concat(binary_data))
         end
-
-        client_socket:send(json.encode(res).."\n")
     end
+
+    return true
 end
 
 function initialize_server ()
@@ -609,9 +678,11 @@ function main ()
                 end
             end
         else
+            -- Answer every message that has arrived, and keep waiting for messages while locked
+            local received
             repeat
-                send_receive()
-            until not locked
+                received = send_receive()
+            until not locked and not received
 
             if timeout_timer <= 0 then
                 print("Client timed out")
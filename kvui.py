@@ -79,6 +79,7 @@ from kivymd.uix.tooltip import MDTooltip, MDTooltipPlain
 fade_in_animation = Animation(opacity=0, duration=0) + Animation(opacity=1, duration=0.25)
 
 from NetUtils import JSONtoTextParser, JSONMessagePart, SlotType, HintStatus
+from UIModels import HintRows, LogBuffer
 from Utils import async_start, get_input_text_from_response
 
 if typing.TYPE_CHECKING:
@@ -1138,20 +1139,22 @@ class UILog(MDRecycleView):
     def __init__(self, *loggers_to_handle, **kwargs):
         super(UILog, self).__init__(**kwargs)
         self.data = []
+        # messages are added to the view once per frame, as updating it for every message stalls on message spam
+        self.buffer = LogBuffer(self.messages)
+        self.flush_trigger = Clock.create_trigger(self.flush)
         for logger in loggers_to_handle:
             logger.addHandler(LogtoUI(self.on_log))
 
     def on_log(self, record: str) -> None:
-        self.data.append({"text": escape_markup(record)})
-        self.clean_old()
+        self.buffer.append({"text": escape_markup(record)})
+        self.flush_trigger()
 
     def on_message_markup(self, text):
-        self.data.append({"text": text})
-        self.clean_old()
+        self.buffer.append({"text": text})
+        self.flush_trigger()
 
-    def clean_old(self):
-        if len(self.data) > self.messages:
-            self.data.pop(0)
+    def flush(self, dt: typing.Optional[float] = None) -> None:
+        self.buffer.flush_into(self.data)
 
     def fix_heights(self):
         """Workaround fix for divergent texture and layout heights"""
@@ -1218,49 +1221,62 @@ class HintLog(MDRecycleView):
         super(HintLog, self).__init__()
         self.data = [self.header]
         self.parser = parser
+        self.rows = HintRows(self.make_row)
+        self.checksums: typing.Dict[str, typing.Optional[str]] = {}
+        self.player_names: typing.Dict[int, str] = {}
 
     def refresh_hints(self, hints):
         if not hints:  # Fix the scrolling looking visually wrong in some edge cases
             self.scroll_y = 1.0
-        data = []
         ctx = MDApp.get_running_app().ctx
+        if ctx.checksums != self.checksums or ctx.player_names != self.player_names:
+            # names of players, items and locations may have changed, like through an alias in a RoomUpdate,
+            # so the rows that show them are outdated
+            self.checksums = dict(ctx.checksums)
+            self.player_names = dict(ctx.player_names)
+            self.rows.clear()
         for hint in hints:
             if not hint.get("status"): # Allows connecting to old servers
                 hint["status"] = HintStatus.HINT_FOUND if hint["found"] else HintStatus.HINT_UNSPECIFIED
-            hint_status_node = self.parser.handle_node({"type": "color",
-                                                        "color": status_colors.get(hint["status"], "red"),
-                                                        "text": status_names.get(hint["status"], "Unknown")})
-            if hint["status"] != HintStatus.HINT_FOUND and ctx.slot_concerns_self(hint["receiving_player"]):
-                hint_status_node = f"[u]{hint_status_node}[/u]"
-            data.append({
-                "receiving": {"text": self.parser.handle_node({"type": "player_id", "text": hint["receiving_player"]})},
-                "item": {"text": self.parser.handle_node({
-                    "type": "item_id",
-                    "text": hint["item"],
-                    "flags": hint["item_flags"],
-                    "player": hint["receiving_player"],
-                })},
-                "finding": {"text": self.parser.handle_node({"type": "player_id", "text": hint["finding_player"]})},
-                "location": {"text": self.parser.handle_node({
-                    "type": "location_id",
-                    "text": hint["location"],
-                    "player": hint["finding_player"],
-                })},
-                "entrance": {"text": self.parser.handle_node({"type": "color" if hint["entrance"] else "text",
-                                                              "color": 'entrancecolor', "text": hint["entrance"]
-                                                              if hint["entrance"] else "Vanilla"})},
-                "status": {
-                    "text": hint_status_node,
-                    "hint": hint,
-                },
-            })
+        if not self.rows.update(hints, self.hint_sorter, self.reversed):
+            return
 
-        data.sort(key=self.hint_sorter, reverse=self.reversed)
-        for i in range(0, len(data), 2):
-            data[i]["striped"] = True
-        data.insert(0, self.header)
+        data = [self.header]
+        for i, row in enumerate(self.rows):
+            row["striped"] = i % 2 == 0
+            data.append(row)
         self.data = data
 
+    def make_row(self, hint: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        ctx = MDApp.get_running_app().ctx
+        hint_status_node = self.parser.handle_node({"type": "color",
+                                                    "color": status_colors.get(hint["status"], "red"),
+                                                    "text": status_names.get(hint["status"], "Unknown")})
+        if hint["status"] != HintStatus.HINT_FOUND and ctx.slot_concerns_self(hint["receiving_player"]):
+            hint_status_node = f"[u]{hint_status_node}[/u]"
+        return {
+            "receiving": {"text": self.parser.handle_node({"type": "player_id", "text": hint["receiving_player"]})},
+            "item": {"text": self.parser.handle_node({
+                "type": "item_id",
+                "text": hint["item"],
+                "flags": hint["item_flags"],
+                "player": hint["receiving_player"],
+            })},
+            "finding": {"text": self.parser.handle_node({"type": "player_id", "text": hint["finding_player"]})},
+            "location": {"text": self.parser.handle_node({
+                "type": "location_id",
+                "text": hint["location"],
+                "player": hint["finding_player"],
+            })},
+            "entrance": {"text": self.parser.handle_node({"type": "color" if hint["entrance"] else "text",
+                                                          "color": 'entrancecolor', "text": hint["entrance"]
+                                                          if hint["entrance"] else "Vanilla"})},
+            "status": {
+                "text": hint_status_node,
+                "hint": hint,
+            },
+        }
+
     @staticmethod
     def hint_sorter(element: dict) -> str:
         return element["status"]["hint"]["status"]  # By status by default
@@ -24,24 +24,20 @@ __all__ = [
 
 no_gui = False
 skip_autosave = False
-_world_settings_name_cache: dict[str, str] = {}  # TODO: cache on disk and update when worlds change
+_world_settings_name_cache: dict[str, str] = {}
 _world_settings_name_cache_updated = False
 _lock = Lock()
 
 
 def _update_cache() -> None:
-    """Load all worlds and update world_settings_name_cache"""
+    """Find the settings of all worlds and update world_settings_name_cache"""
     global _world_settings_name_cache_updated
     if _world_settings_name_cache_updated:
         return
 
     try:
-        from worlds.AutoWorld import AutoWorldRegister
-        for world in AutoWorldRegister.world_types.values():
-            annotation = world.__annotations__.get("settings", None)
-            if annotation is None or annotation == "ClassVar[Optional['Group']]":
-                continue
-            _world_settings_name_cache[world.settings_key] = f"{world.__module__}.{world.__name__}"
+        from worlds import get_world_settings_names
+        _world_settings_name_cache.update(get_world_settings_names())
     finally:
         _world_settings_name_cache_updated = True
 
@@ -675,6 +671,12 @@ class GeneratorOptions(Group):
         start_inventory -> Move remaining items to start_inventory, generate additional filler items to fill locations.
         """
 
+    class MultidataCompression(int):
+        """
+        zlib compression level of the multidata (.archipelago) from 1 to 9, 0 to not compress or -1 for zlib's default.
+        Lower levels generate faster, but make larger files.
+        """
+
     enemizer_path: EnemizerPath = EnemizerPath("EnemizerCLI/EnemizerCLI.Core")  # + ".exe" is implied on Windows
     player_files_path: PlayerFilesPath = PlayerFilesPath("Players")
     players: Players = Players(0)
@@ -684,6 +686,7 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    multidata_compression: MultidataCompression = MultidataCompression(9)
     loglevel: str = "info"
     logtime: bool = False
 
@@ -745,15 +748,24 @@ class Settings(Group):
             if key not in _world_settings_name_cache:
                 # find world that provides the settings class
                 _update_cache()
-                # check for missing keys to update _changed
-                for world_settings_name in _world_settings_name_cache:
-                    if world_settings_name not in dir(self):
+                # check for missing keys to update _changed, which can only be added once the worlds are loaded
+                from worlds import lazy_loading
+                for world_settings_name, world_name in _world_settings_name_cache.items():
+                    if world_settings_name not in dir(self) and \
+                            (not lazy_loading or world_name.rsplit(".", 1)[0] in sys.modules):
                         self._changed = True
             if key not in _world_settings_name_cache:
                 # not a world group
                 return super().__getattribute__(key)
             # directly import world and grab settings class
             world_mod, world_cls_name = _world_settings_name_cache[key].rsplit(".", 1)
+            if world_mod not in sys.modules:
+                # not imported yet with lazy world loading, and .apworld files can only be imported as world source
+                from worlds import lazy_loading, load_world_module
+                if lazy_loading and super().__getattribute__("_dumping"):
+                    # keep the section as read, loading the world may be impossible during autosave
+                    return super().__getattribute__(key)
+                load_world_module(world_mod)
             world = cast(type, getattr(__import__(world_mod, fromlist=[world_cls_name]), world_cls_name))
             assert getattr(world, "settings_key") == key
             try:
@@ -850,7 +862,10 @@ class Settings(Group):
     def dump(self, f: TextIO, level: int = 0) -> None:
         # load all world setting classes
         _update_cache()
-        for key in _world_settings_name_cache:
+        from worlds import lazy_loading
+        for key, world_settings_name in _world_settings_name_cache.items():
+            if lazy_loading and world_settings_name.rsplit(".", 1)[0] not in sys.modules:
+                continue  # see __getattribute__
             self.__getattribute__(key)  # load all worlds
         super().dump(f, level)
 
@@ -5,3 +5,33 @@ if __name__ == "__main__":
     load_worlds.run_load_worlds_benchmark()
     import locations
     locations.run_locations_benchmark()
+    import fill
+    fill.run_fill_benchmark()
+    import collection_state
+    collection_state.run_collection_state_benchmark()
+    import multi_server
+    multi_server.run_multi_server_benchmark()
+    import patch_tokens
+    patch_tokens.run_patch_tokens_benchmark()
+    import bizhawk_connector
+    bizhawk_connector.run_bizhawk_connector_benchmark()
+    import webhost_commands
+    webhost_commands.run_webhost_commands_benchmark()
+    import webhost_autohost
+    webhost_autohost.run_webhost_autohost_benchmark()
+    import webhost_generators
+    webhost_generators.run_webhost_generators_benchmark()
+    import netutils_encode
+    netutils_encode.run_netutils_encode_benchmark()
+    import data_package_requests
+    data_package_requests.run_data_package_requests_benchmark()
+    import data_package_store
+    data_package_store.run_data_package_store_benchmark()
+    import sni_client
+    sni_client.run_sni_client_benchmark()
+    import data_package_cache
+    data_package_cache.run_data_package_cache_benchmark()
+    import ui_models
+    ui_models.run_ui_models_benchmark()
+    import fuzzy_matcher
+    fuzzy_matcher.run_fuzzy_matcher_benchmark()
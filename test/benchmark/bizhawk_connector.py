@@ -0,0 +1,72 @@
+def run_bizhawk_connector_benchmark():
+    """Reads per second through the BizHawk connector against a fake connector script answering at 60 frames per
+    second, for one request list at a time and for several in flight, and time spent on large reads."""
+    import asyncio
+    import logging
+    import time
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from worlds._bizhawk import BizHawkContext, connect, disconnect, get_script_version, read
+    from test.bizhawk import FakeBizHawk
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        duration: float = 2
+        in_flight: typing.Tuple[int, ...] = (1, 4, 16)
+        large_read_size: int = 0x8000
+        large_reads: int = 100
+
+        async def connect(self, script_version: int, frame_time: float) -> typing.Tuple[FakeBizHawk, BizHawkContext]:
+            bizhawk = FakeBizHawk(script_version, frame_time, self.large_read_size)
+            await bizhawk.start()
+            ctx = BizHawkContext()
+            await connect(ctx)
+            await get_script_version(ctx)
+            return bizhawk, ctx
+
+        async def reads_per_second(self, ctx: BizHawkContext, in_flight: int) -> float:
+            reads = 0
+            end = time.perf_counter() + self.duration
+
+            async def reader() -> None:
+                nonlocal reads
+                while time.perf_counter() < end:
+                    await read(ctx, [(0x100, 4, "System Bus")])
+                    reads += 1
+
+            await asyncio.gather(*(reader() for _ in range(in_flight)))
+            return reads / self.duration
+
+        async def main(self):
+            for script_version in (1, 2):
+                for in_flight in self.in_flight:
+                    bizhawk, ctx = await self.connect(script_version, 1 / 60)
+                    reads = await self.reads_per_second(ctx, in_flight)
+                    logger.info(f"{reads:.0f} reads per second with script version {script_version} "
+                                f"and {in_flight} request lists in flight")
+                    disconnect(ctx)
+                    await bizhawk.stop()
+
+            for script_version, binary_reads in ((1, False), (2, False), (2, True)):
+                bizhawk, ctx = await self.connect(script_version, 0)
+                ctx.binary_reads = binary_reads
+                with TimeIt(f"{self.large_reads} reads of {self.large_read_size} bytes with script version "
+                            f"{script_version}{' as raw bytes' if binary_reads else ''}", logger):
+                    for _ in range(self.large_reads):
+                        await read(ctx, [(0, self.large_read_size, "System Bus")])
+                disconnect(ctx)
+                await bizhawk.stop()
+
+    runner = BenchmarkRunner()
+    asyncio.run(runner.main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_bizhawk_connector_benchmark()
@@ -0,0 +1,90 @@
+def run_collection_state_benchmark():
+    """Time and peak memory of CollectionState copies in get_all_state and balance_multiworld_progression, for large
+    multiworlds of a single game."""
+    import argparse
+    import logging
+    import gc
+    import tracemalloc
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState
+    from Fill import balance_multiworld_progression, distribute_items_restrictive
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        gen_steps: typing.Tuple[str, ...] = (
+            "generate_early",
+            "create_regions",
+            "create_items",
+            "set_rules",
+            "connect_entrances",
+            "generate_basic",
+            "pre_fill",
+        )
+
+        games: typing.Tuple[str, ...] = ("Timespinner", "Hollow Knight")
+        players: int = 50
+        copies: int = 100
+        """copies of the all state taken, as done by fill and spoiler code"""
+
+        def setup_multiworld(self, game: str) -> MultiWorld:
+            multiworld = MultiWorld(self.players)
+            multiworld.game = {player: game for player in multiworld.player_ids}
+            multiworld.player_name = {player: f"Tester{player}" for player in multiworld.player_ids}
+            multiworld.set_seed(0)
+            args = argparse.Namespace()
+            for name, option in AutoWorld.AutoWorldRegister.world_types[game].options_dataclass.type_hints.items():
+                setattr(args, name, {player: option.from_any(option.default) for player in multiworld.player_ids})
+            multiworld.set_options(args)
+            multiworld.state = CollectionState(multiworld)
+            for step in self.gen_steps:
+                call_all(multiworld, step)
+            distribute_items_restrictive(multiworld)
+            call_all(multiworld, "post_fill")
+            return multiworld
+
+        @staticmethod
+        def measure(name: str, function: typing.Callable[[], typing.Any]) -> None:
+            gc.collect()
+            tracemalloc.start()
+            # times include the overhead of tracing allocations, compare them only with each other
+            with TimeIt(name, logger):
+                function()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            logger.info(f"{peak / 1024 / 1024:.1f} MiB peak memory in {name}.")
+
+        def main(self):
+            for game in self.games:
+                try:
+                    multiworld = self.setup_multiworld(game)
+                    multiworld.get_all_state(True)
+
+                    def copy_all_state() -> None:
+                        states = [multiworld.get_all_state(True) for _ in range(self.copies)]
+                        # touch a few players like a reachability check would
+                        for state in states:
+                            for player in range(1, 4):
+                                state.can_reach(multiworld.worlds[player].origin_region_name, "Region", player)
+
+                    self.measure(f"{game} {self.players} players {self.copies} get_all_state copies", copy_all_state)
+                    self.measure(f"{game} {self.players} players balance_multiworld_progression",
+                                 lambda: balance_multiworld_progression(multiworld))
+                except Exception as e:
+                    logger.exception(e)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_collection_state_benchmark()
@@ -0,0 +1,55 @@
+def run_data_package_cache_benchmark():
+    """Time a client spends getting the data packages of all loaded games from its cache, from the json files of
+    older versions and from the binary cache, and looking up some of their names."""
+    import json
+    import logging
+    import os
+    import tempfile
+
+    from time_it import TimeIt
+
+    from Utils import DataPackageCache, init_logging
+    from worlds import network_data_package
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        lookups: int = 10
+        """names looked up per game, like the items and locations shown in a client"""
+
+        def main(self):
+            games = network_data_package["games"]
+            with tempfile.TemporaryDirectory() as folder:
+                for game, data in games.items():
+                    with open(os.path.join(folder, f"{len(os.listdir(folder))}.json"), "w",
+                              encoding="utf-8-sig") as f:
+                        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                cache_path = os.path.join(folder, "datapackages.bin")
+                DataPackageCache(cache_path).store(games)
+
+                with TimeIt(f"{len(games)} games from json", logger):
+                    for index in range(len(games)):
+                        with open(os.path.join(folder, f"{index}.json"), "r", encoding="utf-8-sig") as f:
+                            data = json.load(f)
+                        for key in ("item_name_to_id", "location_name_to_id"):
+                            names = {code: name for name, code in data[key].items()}
+                            for code in list(names)[:self.lookups]:
+                                names[code]
+
+                with TimeIt(f"{len(games)} games from the binary cache", logger):
+                    cache = DataPackageCache(cache_path)
+                    for game, data in games.items():
+                        cached = cache.get(game, data["checksum"])
+                        for names in (cached.item_names, cached.location_names):
+                            for code in list(names)[:self.lookups]:
+                                names[code]
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_data_package_cache_benchmark()
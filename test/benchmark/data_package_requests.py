@@ -0,0 +1,40 @@
+def run_data_package_requests_benchmark():
+    """Time spent encoding the replies to clients requesting the full data package, like after a server restart,
+    by encoding the whole message for each of them and by reusing the games encoded for earlier clients."""
+    import logging
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from MultiServer import Context, data_package_cache
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        clients: int = 20
+
+        def main(self):
+            ctx = Context("", 0, "", "", 0, 0, False, logger=logging.getLogger("Benchmark Server"))
+            games = ctx.gamespackage
+            assert ctx.encode_data_package(games) == ctx.dumper([{"cmd": "DataPackage", "data": {"games": games}}])
+            data_package_cache.encoded.clear()
+            data_package_cache.size = data_package_cache.hits = data_package_cache.bytes_saved = 0
+
+            with TimeIt(f"{self.clients} clients {len(games)} games with dumper", logger):
+                for _ in range(self.clients):
+                    ctx.dumper([{"cmd": "DataPackage", "data": {"games": games}}])
+            with TimeIt(f"{self.clients} clients {len(games)} games with encode_data_package", logger):
+                for _ in range(self.clients):
+                    ctx.encode_data_package(games)
+            logger.info(f"{data_package_cache.hits} cache hits, "
+                        f"{data_package_cache.bytes_saved / 1024 / 1024:.1f} MiB not encoded again")
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_data_package_requests_benchmark()
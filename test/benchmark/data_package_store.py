@@ -0,0 +1,64 @@
+def run_data_package_store_benchmark():
+    """Time spent getting the data packages of all worlds by building them and by reading them from the data package
+    store, and the time a fresh process with lazy world loading takes to get the game data a server needs."""
+    import logging
+    import os
+    import shutil
+    import subprocess
+    import sys
+    import tempfile
+
+    from time_it import TimeIt
+
+    from Utils import init_logging, instance_name
+    import worlds
+    from worlds import DataPackageStore, data_package_store, world_sources
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        games = ("Clique", "ChecksFinder", "A Link to the Past")
+        script = f"""
+import time
+start = time.perf_counter()
+import worlds
+for game in {games!r}:
+    worlds.network_data_package["games"][game]
+    worlds.get_hint_blacklist(game)
+print(time.perf_counter() - start, len(worlds.loaded_world_types()))
+"""
+
+        def run_server_start(self, name: str, env: dict) -> None:
+            output = subprocess.run([sys.executable, "-c", self.script], env=env, capture_output=True, text=True,
+                                    check=True).stdout.split()
+            seconds, loaded = float(output[-2]), int(output[-1])
+            logger.info(f"{name} game data of {len(self.games)} games with lazy world loading took {seconds:.4f} "
+                        f"seconds, importing {loaded} world types.")
+
+        def main(self):
+            sources = [source for source in world_sources if data_package_store.get(source) is not None]
+            with TimeIt(f"Building data packages of {len(worlds.AutoWorldRegister.world_types)} games", logger):
+                for world in worlds.AutoWorldRegister.world_types.values():
+                    world.get_data_package_data()
+            with TimeIt(f"Reading data packages of {len(sources)} world sources from the store", logger):
+                store = DataPackageStore(data_package_store.folder)
+                for source in sources:
+                    store.get(source)
+
+            with tempfile.TemporaryDirectory() as cache_folder:
+                # redirect the cache folder of the subprocesses on Linux, to start without manifest and stored data
+                env = dict(os.environ, MULTIWORLDGG_LAZY_WORLDS="1", XDG_CACHE_HOME=cache_folder)
+                self.run_server_start("Indexing worlds for", env)
+                shutil.rmtree(os.path.join(cache_folder, instance_name, "world_data_packages"))
+                self.run_server_start("Building", env)
+                self.run_server_start("Getting stored", env)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_data_package_store_benchmark()
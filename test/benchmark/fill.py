@@ -0,0 +1,118 @@
+def run_fill_benchmark():
+    """Compare placements per second of fill_restrictive's maximum exploration state being swept from scratch for each
+    placement against being updated incrementally through AssumedFillState."""
+    import argparse
+    import logging
+    import gc
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState, Item, Location
+    from Fill import AssumedFillState, sweep_from_pool
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        gen_steps: typing.Tuple[str, ...] = (
+            "generate_early",
+            "create_regions",
+            "create_items",
+            "set_rules",
+            "connect_entrances",
+            "generate_basic",
+            "pre_fill",
+        )
+
+        players: int = 3
+        """copies of each game in the benchmarked multiworld"""
+
+        def setup_multiworld(self, game: str) -> MultiWorld:
+            multiworld = MultiWorld(self.players)
+            multiworld.game = {player: game for player in multiworld.player_ids}
+            multiworld.player_name = {player: f"Tester{player}" for player in multiworld.player_ids}
+            multiworld.set_seed(0)
+            args = argparse.Namespace()
+            for name, option in AutoWorld.AutoWorldRegister.world_types[game].options_dataclass.type_hints.items():
+                setattr(args, name, {player: option.from_any(option.default) for player in multiworld.player_ids})
+            multiworld.set_options(args)
+            multiworld.state = CollectionState(multiworld)
+            for step in self.gen_steps:
+                call_all(multiworld, step)
+            return multiworld
+
+        @staticmethod
+        def place(state: CollectionState, item: Item, locations: typing.List[Location]) -> typing.Optional[Location]:
+            for i, location in enumerate(locations):
+                if location.can_fill(state, item):
+                    location.item = item
+                    item.location = location
+                    return locations.pop(i)
+            return None
+
+        def fill_from_scratch(self, base_state: CollectionState, item_pool: typing.List[Item],
+                              locations: typing.List[Location]) -> typing.List[Location]:
+            placements = []
+            while item_pool:
+                item = item_pool.pop()
+                location = self.place(sweep_from_pool(base_state, item_pool), item, locations)
+                if location:
+                    placements.append(location)
+            return placements
+
+        def fill_incremental(self, base_state: CollectionState, item_pool: typing.List[Item],
+                             locations: typing.List[Location]) -> typing.List[Location]:
+            placements = []
+            fill_state = AssumedFillState(base_state, item_pool)
+            while item_pool:
+                item = item_pool.pop()
+                fill_state.remove(item)
+                location = self.place(fill_state.update(), item, locations)
+                if location:
+                    placements.append(location)
+                    fill_state.place(location)
+                else:
+                    fill_state.collect(item)
+            return placements
+
+        def main(self):
+            for game in sorted(AutoWorld.AutoWorldRegister.world_types):
+                try:
+                    multiworld = self.setup_multiworld(game)
+                    item_pool = [item for item in multiworld.itempool if item.advancement]
+                    multiworld.random.shuffle(item_pool)
+                    locations = multiworld.get_unfilled_locations()
+                    multiworld.random.shuffle(locations)
+                    if not item_pool or not locations:
+                        continue
+                    base_state = sweep_from_pool(multiworld.state)
+
+                    results: typing.Dict[str, typing.List[Location]] = {}
+                    for fill in (self.fill_from_scratch, self.fill_incremental):
+                        gc.collect()
+                        with TimeIt(f"{game} {fill.__name__}", logger) as t:
+                            placements = fill(base_state, item_pool.copy(), locations.copy())
+                        results[fill.__name__] = placements
+                        logger.info(f"{game} {fill.__name__} placed {len(placements)} items at "
+                                    f"{len(placements) / t.dif:.1f} placements per second.")
+                        for location in placements:
+                            location.item.location = None
+                            location.item = None
+
+                    if results["fill_from_scratch"] != results["fill_incremental"]:
+                        logger.warning(f"{game} placements differ between fill_from_scratch and fill_incremental.")
+                except Exception as e:
+                    logger.exception(e)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_fill_benchmark()
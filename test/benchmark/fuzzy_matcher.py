@@ -0,0 +1,52 @@
+def run_fuzzy_matcher_benchmark():
+    """Time spent looking up item and location names typed with a typo, as the !hint and !getitem commands do, for
+    the largest name collections of the loaded games, comparing against every name and with a FuzzyMatcher."""
+    import logging
+    import random
+
+    from time_it import TimeIt
+
+    from Utils import FuzzyMatcher, _get_all_fuzzy_results, get_intended_text, init_logging
+    from worlds import AutoWorldRegister
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        lookups: int = 20
+        collections: int = 3
+
+        def typos(self, names: list, rng: random.Random) -> list:
+            inputs = []
+            for name in rng.sample(names, min(self.lookups, len(names))):
+                position = rng.randrange(len(name))
+                inputs.append(name[:position] + name[position + 1:])
+            return inputs
+
+        def main(self):
+            rng = random.Random(0)
+            collections = []
+            for game, world in AutoWorldRegister.world_types.items():
+                collections.append((f"{game} items", set(world.item_names) | set(world.item_name_groups)))
+                collections.append((f"{game} locations",
+                                    set(world.location_names) | set(world.location_name_groups)))
+            collections.sort(key=lambda collection: len(collection[1]), reverse=True)
+
+            for name, names in collections[:self.collections]:
+                inputs = self.typos(sorted(names), rng)
+                with TimeIt(f"{len(inputs)} lookups in {len(names)} {name} against every name", logger):
+                    for input_text in inputs:
+                        _get_all_fuzzy_results(input_text, names, 2)
+                with TimeIt(f"{len(inputs)} lookups in {len(names)} {name} with a FuzzyMatcher", logger):
+                    matcher = FuzzyMatcher(names)
+                    for input_text in inputs:
+                        get_intended_text(input_text, matcher)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_fuzzy_matcher_benchmark()
@@ -20,6 +20,38 @@ def run_load_worlds_benchmark():
     for module in world_sources:
         logger.info(f"{module} took {module.time_taken:.4f} seconds.")
 
+    run_lazy_load_worlds_benchmark(logger)
+
+
+def run_lazy_load_worlds_benchmark(logger):
+    """Compare the time to import worlds and look up a few games in a fresh process, with all worlds loaded and with
+    lazy world loading. The first lazy run may have to index the worlds into the manifest."""
+    import os
+    import subprocess
+    import sys
+
+    games = ("Clique", "ChecksFinder", "A Link to the Past")
+    script = f"""
+import time
+start = time.perf_counter()
+import worlds
+for game in {games!r}:
+    worlds.AutoWorldRegister.world_types[game]
+print(time.perf_counter() - start, len(worlds.loaded_world_types()))
+"""
+
+    def run(lazy: str) -> None:
+        env = dict(os.environ, MULTIWORLDGG_LAZY_WORLDS=lazy)
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True,
+                                check=True).stdout.split()
+        seconds, loaded = float(output[-2]), int(output[-1])
+        logger.info(f"{'lazy' if lazy == '1' else 'eager'} import of worlds for {len(games)} games took "
+                    f"{seconds:.4f} seconds, loading {loaded} world types.")
+
+    run("0")
+    run("1")
+    run("1")
+
 
 if __name__ == "__main__":
     from path_change import change_home
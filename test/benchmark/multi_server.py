@@ -0,0 +1,76 @@
+def run_multi_server_benchmark():
+    """Time spent registering location checks on a MultiServer Context with many connected clients and hints, for a
+    release and for checks arriving one at a time."""
+    import asyncio
+    import logging
+    import random
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from MultiServer import Client, Context, register_location_checks, release_player
+    from NetUtils import Hint, LocationStore, NetworkSlot, SlotType
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkContext(Context):
+        def _load_game_data(self) -> None:
+            pass  # items and locations are not named in this benchmark
+
+    class BenchmarkRunner:
+        slot_counts: typing.Tuple[int, ...] = (10, 100, 1000)
+        locations: int = 1000
+        """locations per slot, each holding an item for a random slot"""
+        hints: int = 100
+        """hinted locations per slot"""
+
+        def setup_context(self, slots: int) -> Context:
+            server_logger = logging.getLogger("Benchmark Server")
+            server_logger.setLevel(logging.WARNING)
+            ctx = BenchmarkContext("", 0, "", "", 0, 0, False, logger=server_logger)
+            rand = random.Random(0)
+            ctx.slot_info = {slot: NetworkSlot(f"Player{slot}", "Benchmark", SlotType.player)
+                             for slot in range(1, slots + 1)}
+            ctx.locations = LocationStore({
+                slot: {location: (location, rand.randint(1, slots), 0) for location in range(1, self.locations + 1)}
+                for slot in ctx.slot_info
+            })
+            ctx.clients = {0: {}}
+            for slot, slot_info in ctx.slot_info.items():
+                ctx.player_names[0, slot] = slot_info.name
+                client = Client(None, ctx)
+                client.team, client.slot, client.auth = 0, slot, True
+                client.items_handling = 0b111
+                ctx.clients[0][slot] = [client]
+            for slot in ctx.slot_info:
+                for location in rand.sample(range(1, self.locations + 1), self.hints):
+                    item, receiver, flags = ctx.locations[slot][location]
+                    hint = Hint(receiver, slot, location, item, False, item_flags=flags)
+                    ctx.hints[0, slot].add(hint)
+                    ctx.hints[0, receiver].add(hint)
+            ctx.index_hints()
+            return ctx
+
+        async def main(self):
+            for slots in self.slot_counts:
+                ctx = self.setup_context(slots)
+                with TimeIt(f"{slots} clients release of {self.locations} locations", logger):
+                    release_player(ctx, 0, 1)
+
+                ctx = self.setup_context(slots)
+                with TimeIt(f"{slots} clients {self.locations} single location checks", logger):
+                    for location in range(1, self.locations + 1):
+                        register_location_checks(ctx, 0, 1, (location,))
+                # let the queued sends finish before the next context
+                await asyncio.sleep(0)
+
+    runner = BenchmarkRunner()
+    asyncio.run(runner.main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_multi_server_benchmark()
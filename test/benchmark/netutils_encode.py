@@ -0,0 +1,45 @@
+def run_netutils_encode_benchmark():
+    """Time spent by NetUtils.encode on large packets, compared to the previous two-pass encoding through
+    _scan_for_TypedTuples and json."""
+    import logging
+    import random
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from NetUtils import NetworkItem, _encode, _scan_for_TypedTuples, encode
+    from worlds import network_data_package
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        rounds: int = 20
+        received_items: int = 10000
+
+        def messages(self):
+            rand = random.Random(0)
+            items = [NetworkItem(rand.randrange(1 << 30), rand.randrange(1 << 30), rand.randint(1, 100),
+                                 rand.randrange(8)) for _ in range(self.received_items)]
+            yield f"{self.received_items} item ReceivedItems", [{"cmd": "ReceivedItems", "index": 0, "items": items}]
+            games = len(network_data_package["games"])
+            yield f"{games} game DataPackage", [{"cmd": "DataPackage", "data": network_data_package}]
+
+        def main(self):
+            for name, message in self.messages():
+                assert encode(message) == _encode(_scan_for_TypedTuples(message))
+                with TimeIt(f"{self.rounds} times {name} with _scan_for_TypedTuples and json", logger):
+                    for _ in range(self.rounds):
+                        _encode(_scan_for_TypedTuples(message))
+                with TimeIt(f"{self.rounds} times {name} with encode", logger):
+                    for _ in range(self.rounds):
+                        encode(message)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_netutils_encode_benchmark()
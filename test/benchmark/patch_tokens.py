@@ -0,0 +1,56 @@
+def run_patch_tokens_benchmark():
+    """Time spent applying token patches the size of large ROM edits, made up of single byte writes, AND/OR/XOR
+    tokens and longer COPY, RLE and WRITE tokens."""
+    import logging
+    import random
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from worlds.Files import APPatchExtension, APProcedurePatch, APTokenMixin, APTokenTypes
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkPatch(APProcedurePatch, APTokenMixin):
+        pass
+
+    class BenchmarkRunner:
+        rom_size: int = 4 * 1024 * 1024
+        token_counts: typing.Tuple[int, ...] = (10_000, 100_000)
+
+        def create_patch(self, tokens: int) -> BenchmarkPatch:
+            rand = random.Random(0)
+            patch = BenchmarkPatch()
+            for _ in range(tokens):
+                offset = rand.randrange(self.rom_size - 64)
+                token_type = rand.choice((APTokenTypes.WRITE, APTokenTypes.WRITE, APTokenTypes.WRITE,
+                                          APTokenTypes.AND_8, APTokenTypes.OR_8, APTokenTypes.XOR_8,
+                                          APTokenTypes.COPY, APTokenTypes.RLE))
+                if token_type == APTokenTypes.WRITE:
+                    patch.write_token(token_type, offset, rand.randbytes(rand.choice((1, 1, 2, 4, 16, 64))))
+                elif token_type == APTokenTypes.COPY:
+                    patch.write_token(token_type, offset, (rand.randint(1, 64), rand.randrange(self.rom_size - 64)))
+                elif token_type == APTokenTypes.RLE:
+                    patch.write_token(token_type, offset, (rand.randint(1, 64), rand.randrange(256)))
+                else:
+                    patch.write_token(token_type, offset, rand.randrange(256))
+            patch.write_file("token_data.bin", patch.get_token_binary())
+            return patch
+
+        def main(self):
+            rom = random.Random(0).randbytes(self.rom_size)
+            for tokens in self.token_counts:
+                patch = self.create_patch(tokens)
+                with TimeIt(f"{tokens} tokens applied", logger):
+                    APPatchExtension.apply_tokens(patch, rom, "token_data.bin")
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_patch_tokens_benchmark()
@@ -8,7 +8,8 @@ def change_home():
     sys.path.remove(old_home)
     new_home = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
     os.chdir(new_home)
-    sys.path.append(new_home)
+    # ahead of the standard library, so that the "test" package is this project's
+    sys.path.insert(0, new_home)
     # fallback to local import
     sys.path.append(old_home)
 
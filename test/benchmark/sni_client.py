@@ -0,0 +1,58 @@
+def run_sni_client_benchmark():
+    """Reads per second through SNIClient against a fake SNI answering after a fixed latency, for reads sent one at a
+    time and for the same reads planned per tick and answered from the memory snapshot."""
+    import asyncio
+    import logging
+    import time
+    import typing
+
+    from Utils import init_logging
+    from SNIClient import SNIContext, snes_connect, snes_disconnect, snes_read, snes_read_ranges
+    from test.sni import FakeSNI
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        duration: float = 2
+        latencies: typing.Tuple[float, ...] = (0, 0.001, 0.005)
+        # a tick of the alttp client: game mode, save data and the location flags read by track_locations
+        tick_reads: typing.Tuple[typing.Tuple[int, int], ...] = (
+            (0xF50010, 1), (0xF5F443, 1), (0xF5F42E, 4), (0xF5F4D0, 8), (0xF5F302, 0x50),
+            (0xF5F000, 0x250), (0xF5F280, 0xC0), (0xF5F410, 2), (0xF5F3C6, 4),
+        )
+
+        async def reads_per_second(self, ctx: SNIContext, planned: bool) -> float:
+            reads = 0
+            end = time.perf_counter() + self.duration
+            while time.perf_counter() < end:
+                if planned:
+                    ctx.snes_memory_snapshot = await snes_read_ranges(ctx, self.tick_reads)
+                for address, size in self.tick_reads:
+                    await snes_read(ctx, address, size)
+                ctx.snes_memory_snapshot = None
+                reads += len(self.tick_reads)
+            return reads / self.duration
+
+        async def main(self):
+            for latency in self.latencies:
+                sni = FakeSNI(latency)
+                await sni.start()
+                ctx = SNIContext(sni.address, None, None)
+                await snes_connect(ctx, sni.address)
+                for planned in (False, True):
+                    reads = await self.reads_per_second(ctx, planned)
+                    logger.info(f"{reads:.0f} reads per second with {latency * 1000:.0f} ms latency, "
+                                f"{'planned per tick' if planned else 'one request each'}")
+                ctx.snes_reconnect_address = None
+                await snes_disconnect(ctx)
+                await sni.stop()
+
+    runner = BenchmarkRunner()
+    asyncio.run(runner.main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_sni_client_benchmark()
@@ -0,0 +1,147 @@
+def run_ui_models_benchmark():
+    """Time spent putting a flood of PrintJSON messages into the client log and keeping the hint table up to date,
+    headless, with the models kvui uses and with updating the views' data for every message and every hint."""
+    import asyncio
+    import logging
+    import typing
+
+    from time_it import TimeIt
+
+    import NetUtils
+    from CommonClient import CommonContext
+    from NetUtils import HintStatus, JSONtoTextParser
+    from UIModels import HintRows, LogBuffer
+    from Utils import init_logging
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class CountingList(list):
+        """Counts the changes that would make a RecycleView refresh."""
+        changes = 0
+
+        def append(self, item: typing.Any) -> None:
+            self.changes += 1
+            super().append(item)
+
+        def extend(self, items: typing.Iterable[typing.Any]) -> None:
+            self.changes += 1
+            super().extend(items)
+
+        def pop(self, index: typing.SupportsIndex = -1) -> typing.Any:
+            self.changes += 1
+            return super().pop(index)
+
+        def __setitem__(self, key: typing.Any, value: typing.Any) -> None:
+            self.changes += 1
+            super().__setitem__(key, value)
+
+        def __delitem__(self, key: typing.Any) -> None:
+            self.changes += 1
+            super().__delitem__(key)
+
+    class BenchmarkRunner:
+        messages: int = 100_000
+        messages_per_frame: int = 200
+        """messages arriving between two frames of the client during a release"""
+        log_size: int = 1000
+        hints: int = 2000
+        hint_updates: int = 50
+
+        def setup_context(self) -> CommonContext:
+            ctx = CommonContext()
+            ctx.slot = 1
+            ctx.team = 0
+            ctx.slot_info.update({player: NetUtils.NetworkSlot(f"Player {player}", "Archipelago",
+                                                               NetUtils.SlotType.player) for player in range(1, 17)})
+            ctx.consume_players_package([NetUtils.NetworkPlayer(0, player, f"Player {player}", f"Player {player}")
+                                         for player in range(1, 17)])
+            return ctx
+
+        def message(self, number: int) -> typing.List[NetUtils.JSONMessagePart]:
+            return [
+                {"type": "player_id", "text": str(number % 16 + 1)},
+                {"type": "text", "text": " sent "},
+                {"type": "item_id", "text": str(-1), "player": 1, "flags": number % 4},
+                {"type": "text", "text": " to "},
+                {"type": "player_id", "text": "1"},
+                {"type": "text", "text": " ("},
+                {"type": "location_id", "text": str(-1), "player": number % 16 + 1},
+                {"type": "text", "text": ")"},
+            ]
+
+        def make_row(self, parser: JSONtoTextParser, hint: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+            return {
+                "receiving": {"text": parser.handle_node({"type": "player_id", "text": hint["receiving_player"]})},
+                "item": {"text": parser.handle_node({"type": "item_id", "text": hint["item"],
+                                                     "flags": hint["item_flags"], "player": hint["receiving_player"]})},
+                "finding": {"text": parser.handle_node({"type": "player_id", "text": hint["finding_player"]})},
+                "location": {"text": parser.handle_node({"type": "location_id", "text": hint["location"],
+                                                         "player": hint["finding_player"]})},
+                "entrance": {"text": parser.handle_node({"type": "text", "text": "Vanilla"})},
+                "status": {"text": parser.handle_node({"type": "color", "color": "gold", "text": "Priority"}),
+                           "hint": hint},
+            }
+
+        async def main(self):
+            ctx = self.setup_context()
+            parser = JSONtoTextParser(ctx)
+            # the parser changes the messages it handles
+            messages = [self.message(number) for number in range(self.messages)]
+
+            data = CountingList()
+            with TimeIt(f"{self.messages} messages into the log one at a time", logger):
+                for message in messages:
+                    data.append({"text": parser(message)})
+                    if len(data) > self.log_size:
+                        data.pop(0)
+            logger.info(f"{data.changes} log view changes")
+
+            messages = [self.message(number) for number in range(self.messages)]
+            data = CountingList()
+            buffer = LogBuffer(self.log_size)
+            with TimeIt(f"{self.messages} messages into the log once per frame", logger):
+                for number, message in enumerate(messages, 1):
+                    buffer.append({"text": parser(message)})
+                    if number % self.messages_per_frame == 0:
+                        buffer.flush_into(data)
+                buffer.flush_into(data)
+            logger.info(f"{data.changes} log view changes")
+
+            hints = [{"receiving_player": number % 16 + 1, "finding_player": number % 7 + 1, "location": number,
+                      "item": -1, "item_flags": 1, "entrance": "", "found": False,
+                      "status": HintStatus.HINT_UNSPECIFIED} for number in range(self.hints)]
+
+            def sorter(row: typing.Dict[str, typing.Any]) -> int:
+                return row["status"]["hint"]["status"]
+
+            def update(number: int) -> typing.List[typing.Dict[str, typing.Any]]:
+                # the server sends all hints again when one of them changes
+                hints[number * 7 % self.hints]["status"] = HintStatus.HINT_PRIORITY
+                return [dict(hint) for hint in hints]
+
+            with TimeIt(f"{self.hint_updates} updates of {self.hints} hints rebuilding the table", logger):
+                for number in range(self.hint_updates):
+                    rows = [self.make_row(parser, hint) for hint in update(number)]
+                    rows.sort(key=sorter, reverse=True)
+                    for index in range(0, len(rows), 2):
+                        rows[index]["striped"] = True
+
+            for hint in hints:
+                hint["status"] = HintStatus.HINT_UNSPECIFIED
+            hint_rows = HintRows(lambda hint: self.make_row(parser, hint))
+            hint_rows.update(hints, sorter, True)
+            with TimeIt(f"{self.hint_updates} updates of {self.hints} hints with the incremental model", logger):
+                for number in range(self.hint_updates):
+                    hint_rows.update(update(number), sorter, True)
+                    for index, row in enumerate(hint_rows):
+                        row["striped"] = index % 2 == 0
+
+    runner = BenchmarkRunner()
+    asyncio.run(runner.main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_ui_models_benchmark()
@@ -0,0 +1,87 @@
+def run_webhost_autohost_benchmark():
+    """Time spent by the WebHost autohost looking for rooms to start, with a local SQLite database holding rooms
+    active over the last 3 days, comparing a scan of all those rooms per tick to the room scheduler."""
+    import logging
+    import os
+    import random
+    import tempfile
+    import typing
+    from datetime import datetime, timedelta
+    from uuid import uuid4
+
+    from pony.orm import db_session, select
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from WebHostLib.autolauncher import RoomScheduler
+    from WebHostLib.models import Room, Seed, db
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class Hoster:
+        def __init__(self) -> None:
+            self.room_ids = set()
+
+        def start_room(self, room_id) -> None:
+            self.room_ids.add(room_id)
+
+        def get_rooms_shut_down(self) -> typing.List:
+            return []
+
+    class BenchmarkRunner:
+        rooms: int = 20000
+        """rooms active within the last 3 days"""
+        active_rooms: int = 500
+        """rooms within their timeout"""
+        scan_ticks: int = 10
+        ticks: int = 100
+
+        def setup(self) -> None:
+            owner = uuid4()
+            rand = random.Random(0)
+            now = datetime.utcnow()
+            with db_session:
+                seed = Seed(multidata=b"", owner=owner)
+                for room in range(self.rooms):
+                    if room < self.active_rooms:
+                        last_activity = now - timedelta(seconds=rand.randrange(3600))
+                    else:
+                        last_activity = now - timedelta(seconds=rand.randrange(3 * 3600, 3 * 24 * 3600))
+                    Room(seed=seed, owner=owner, last_activity=last_activity)
+
+        def main(self) -> None:
+            self.setup()
+            hosters = [Hoster() for _ in range(4)]
+
+            with TimeIt(f"{self.scan_ticks} ticks scanning all rooms of the last 3 days", logger):
+                for _ in range(self.scan_ticks):
+                    with db_session:
+                        rooms = select(
+                            room for room in Room if
+                            room.last_activity >= datetime.utcnow() - timedelta(days=3))
+                        for room in rooms:
+                            if room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
+                                hosters[room.id.int % len(hosters)].start_room(room.id)
+
+            scheduler = RoomScheduler(hosters)  # type: ignore
+            with TimeIt("first tick of the room scheduler", logger):
+                scheduler.tick()
+            with TimeIt(f"{self.ticks} more ticks of the room scheduler", logger):
+                for _ in range(self.ticks):
+                    scheduler.tick()
+            scheduler.log_metrics()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        db.bind(provider="sqlite", filename=os.path.join(tempdir, "benchmark.db3"), create_db=True)
+        db.generate_mapping(create_tables=True)
+        runner = BenchmarkRunner()
+        runner.main()
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_webhost_autohost_benchmark()
@@ -0,0 +1,77 @@
+def run_webhost_commands_benchmark():
+    """Time spent by a WebHost hoster process looking for commands queued for its rooms, with a local SQLite database
+    and simulated rooms, comparing one query per room to the process' single command dispatcher."""
+    import asyncio
+    import logging
+    import os
+    import tempfile
+    import typing
+    from types import SimpleNamespace
+    from uuid import uuid4
+
+    from pony.orm import db_session, select
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from WebHostLib.customserver import CommandDispatcher
+    from WebHostLib.models import Command, Room, Seed, db
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class Loop:
+        def call_soon_threadsafe(self, callback: typing.Callable, *args: typing.Any) -> None:
+            pass
+
+    class BenchmarkRunner:
+        rooms: int = 1000
+        commands: int = 10
+        """commands queued in one poll, for random rooms"""
+        polls: int = 10
+
+        def setup(self) -> typing.List[SimpleNamespace]:
+            owner = uuid4()
+            loop = Loop()
+            with db_session:
+                seed = Seed(multidata=b"", owner=owner)
+                rooms = [Room(seed=seed, owner=owner) for _ in range(self.rooms)]
+            return [SimpleNamespace(room_id=room.id, exit_event=asyncio.Event(), main_loop=loop, logger=logger)
+                    for room in rooms]
+
+        def queue_commands(self, contexts: typing.List[SimpleNamespace], poll: int) -> None:
+            with db_session:
+                for ctx in contexts[poll::len(contexts) // self.commands][:self.commands]:
+                    Command(room=Room.get(id=ctx.room_id), commandtext="/help")
+
+        def main(self) -> None:
+            contexts = self.setup()
+
+            with TimeIt(f"{self.polls} polls with one query per room for {self.rooms} rooms", logger):
+                for poll in range(self.polls):
+                    self.queue_commands(contexts, poll)
+                    for ctx in contexts:
+                        with db_session:
+                            for command in select(command for command in Command if command.room.id == ctx.room_id):
+                                command.delete()
+
+            dispatcher = CommandDispatcher()
+            for ctx in contexts:
+                dispatcher.register(ctx)  # type: ignore
+            with TimeIt(f"{self.polls} polls with the command dispatcher for {self.rooms} rooms", logger):
+                for poll in range(self.polls):
+                    self.queue_commands(contexts, poll)
+                    dispatcher.dispatch()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        db.bind(provider="sqlite", filename=os.path.join(tempdir, "benchmark.db3"), create_db=True)
+        db.generate_mapping(create_tables=True)
+        runner = BenchmarkRunner()
+        runner.main()
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_webhost_commands_benchmark()
@@ -0,0 +1,77 @@
+def run_webhost_generators_benchmark():
+    """Time per WebHost generation of a small seed with a local SQLite database, when every job needs a new generator
+    process, for spawned generators, which WebHost.py used for all platforms, for generators forked directly from a
+    process that already imported the worlds, where available, and for generators forked from a preloaded template
+    process."""
+    import logging
+    import multiprocessing
+    import os
+    import tempfile
+    import time
+    import typing
+    import uuid
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from WebHostLib import app
+    from WebHostLib.autolauncher import GenerationMetrics, _mp_gen_game, get_generator_context, init_generator
+    from WebHostLib.check import roll_options
+    from WebHostLib.models import db
+    import worlds  # noqa: F401  the WebHost process has imported the worlds by the time it starts generators
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        jobs: int = 3
+        options = {"Player1.yaml": {"name": "Player1", "game": "Clique", "Clique": {}}}
+
+        def run_jobs(self, name: str, context: multiprocessing.context.BaseContext, config: typing.Dict[str, typing.Any]):
+            _, gen_options = roll_options(self.options)
+            gen_options = {name: vars(options) for name, options in gen_options.items()}
+            # a new generator for every job, like after memory limits or recycling
+            with context.Pool(1, initializer=init_generator, initargs=(config,), maxtasksperchild=1) as pool:
+                with TimeIt(f"{self.jobs} generations with {name}", logger):
+                    for _ in range(self.jobs):
+                        seed_id, metrics = pool.apply(_mp_gen_game, (gen_options,),
+                                                      {"meta": {}, "owner": uuid.uuid4(), "queued": time.time()})
+                        metrics: GenerationMetrics
+                        logger.info(f"{name}: seed {seed_id}, {metrics.queue_wait:.2f}s until the generator was ready, "
+                                    f"{metrics.generation_time:.2f}s generating")
+
+        def main(self, config: typing.Dict[str, typing.Any]) -> None:
+            self.run_jobs("spawned generators", multiprocessing.get_context("spawn"), config)
+            if "fork" in multiprocessing.get_all_start_methods():
+                self.run_jobs("forked generators", multiprocessing.get_context("fork"), config)
+
+            context = get_generator_context({**config, "GENERATOR_PRELOAD": True})
+            if context.get_start_method() == "forkserver":
+                with TimeIt("starting the template process", logger):
+                    context.Process(target=time.sleep, args=(0,)).start()
+                self.run_jobs("preloaded generators", context, config)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        config = dict(app.config)
+        config["PONY"] = {"provider": "sqlite", "filename": os.path.join(tempdir, "benchmark.db3"), "create_db": True}
+
+        def create_tables() -> None:
+            db.bind(**config["PONY"])
+            db.generate_mapping(create_tables=True)
+            db.disconnect()
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            # generators bind the database on their own, which fails in forked ones if it was bound here already
+            process = multiprocessing.get_context("fork").Process(target=create_tables)
+            process.start()
+            process.join()
+        else:
+            create_tables()
+        runner = BenchmarkRunner()
+        runner.main(config)
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_webhost_generators_benchmark()
@@ -0,0 +1,122 @@
+import asyncio
+import base64
+import json
+from typing import Any
+
+from worlds._bizhawk import BIZHAWK_SOCKET_PORT_RANGE_SIZE, BIZHAWK_SOCKET_PORT_RANGE_START
+
+
+class FakeBizHawk:
+    """Stand-in for `connector_bizhawk_generic.lua` that answers requests against in-memory domains.
+
+    Like the connector script, it only answers on frame ends: one message per frame for version 1, and every message
+    that has arrived for later versions."""
+    script_version: int
+    frame_time: float
+    memory: dict[str, bytearray]
+    frames: int
+    server: asyncio.Server | None
+    writers: set[asyncio.StreamWriter]
+
+    def __init__(self, script_version: int = 2, frame_time: float = 1 / 60, memory_size: int = 0x10000) -> None:
+        self.script_version = script_version
+        self.frame_time = frame_time
+        self.memory = {"System Bus": bytearray(memory_size)}
+        self.frames = 0
+        self.server = None
+        self.writers = set()
+
+    async def start(self) -> None:
+        """Listens on the first free port of the connector port range."""
+        for port in range(BIZHAWK_SOCKET_PORT_RANGE_START,
+                          BIZHAWK_SOCKET_PORT_RANGE_START + BIZHAWK_SOCKET_PORT_RANGE_SIZE):
+            try:
+                self.server = await asyncio.start_server(self._serve, "127.0.0.1", port)
+                return
+            except OSError:
+                continue
+        raise OSError("All connector ports are in use")
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            # wait_closed waits for every connection to end, like BizHawk closing when the client stays connected
+            for writer in self.writers:
+                writer.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        received: list[bytes] = []
+        self.writers.add(writer)
+
+        async def receive() -> None:
+            while line := await reader.readline():
+                received.append(line.rstrip(b"\n"))
+
+        receive_task = asyncio.create_task(receive())
+        try:
+            while not receive_task.done() or received:
+                await asyncio.sleep(self.frame_time)
+                self.frames += 1
+                count = len(received) if self.script_version >= 2 else min(len(received), 1)
+                for message in received[:count]:
+                    writer.write(self.respond(message))
+                del received[:count]
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # client or fake went away
+        finally:
+            receive_task.cancel()
+            writer.close()
+            self.writers.discard(writer)
+
+    def respond(self, message: bytes) -> bytes:
+        if message == b"VERSION":
+            return f"{self.script_version}\n".encode()
+
+        data = json.loads(message)
+        if isinstance(data, list):
+            responses = self.process_requests(data)
+            for response in responses:
+                if response["type"] == "READ_RESPONSE":
+                    response["value"] = base64.b64encode(response["value"]).decode("ascii")
+            return json.dumps(responses).encode() + b"\n"
+
+        responses = self.process_requests(data["requests"])
+        binary_data = bytearray()
+        for response in responses:
+            if response["type"] == "READ_RESPONSE":
+                if data["binary"]:
+                    binary_data += response["value"]
+                    response["size"] = len(response.pop("value"))
+                else:
+                    response["value"] = base64.b64encode(response["value"]).decode("ascii")
+        return json.dumps({"id": data["id"], "responses": responses}).encode() + b"\n" + binary_data
+
+    def process_requests(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        responses: list[dict[str, Any]] = []
+        failed_guard_response: dict[str, Any] | None = None
+        for request in requests:
+            if failed_guard_response is not None:
+                responses.append(failed_guard_response)
+            elif request["type"] == "PING":
+                responses.append({"type": "PONG"})
+            elif request["type"] == "READ":
+                domain = self.memory[request["domain"]]
+                value = bytes(domain[request["address"]:request["address"] + request["size"]])
+                responses.append({"type": "READ_RESPONSE", "value": value})
+            elif request["type"] == "WRITE":
+                value = base64.b64decode(request["value"])
+                self.memory[request["domain"]][request["address"]:request["address"] + len(value)] = value
+                responses.append({"type": "WRITE_RESPONSE"})
+            elif request["type"] == "GUARD":
+                expected_data = base64.b64decode(request["expected_data"])
+                domain = self.memory[request["domain"]]
+                validated = domain[request["address"]:request["address"] + len(expected_data)] == expected_data
+                responses.append({"type": "GUARD_RESPONSE", "value": validated, "address": request["address"]})
+                if not validated:
+                    failed_guard_response = responses[-1]
+            else:
+                responses.append({"type": "ERROR", "err": f"Unknown command: {request['type']}"})
+        return responses
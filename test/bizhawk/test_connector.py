@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from worlds._bizhawk import BizHawkContext, ConnectionStatus, RequestFailedError, connect, disconnect, \
+    get_script_version, guarded_read, guarded_write, ping, read, write
+
+from . import FakeBizHawk
+
+
+class TestConnector(unittest.IsolatedAsyncioTestCase):
+    bizhawk: FakeBizHawk
+    ctx: BizHawkContext
+
+    async def connect(self, script_version: int, frame_time: float = 0.001) -> None:
+        self.bizhawk = FakeBizHawk(script_version, frame_time)
+        await self.bizhawk.start()
+        self.addAsyncCleanup(self.bizhawk.stop)
+        self.ctx = BizHawkContext()
+        self.assertTrue(await connect(self.ctx))
+        self.addCleanup(disconnect, self.ctx)
+        self.assertEqual(await get_script_version(self.ctx), script_version)
+
+    async def test_requests(self) -> None:
+        """Tests that reads, writes and guards work with every connector script version and read encoding."""
+        for script_version in (1, 2):
+            for binary_reads in (False, True):
+                with self.subTest(script_version=script_version, binary_reads=binary_reads):
+                    await self.connect(script_version)
+                    self.ctx.binary_reads = binary_reads
+                    await ping(self.ctx)
+                    self.assertEqual(self.ctx.connection_status, ConnectionStatus.CONNECTED)
+
+                    await write(self.ctx, [(0x10, b"\x01\x02\x03\n", "System Bus")])
+                    self.assertEqual(await read(self.ctx, [(0x10, 4, "System Bus"), (0x12, 3, "System Bus")]),
+                                     [b"\x01\x02\x03\n", b"\x03\n\x00"])
+                    self.assertFalse(await guarded_write(self.ctx, [(0x20, [1], "System Bus")],
+                                                         [(0x10, [9], "System Bus")]))
+                    self.assertIsNone(await guarded_read(self.ctx, [(0x20, 1, "System Bus")],
+                                                         [(0x10, [9], "System Bus")]))
+                    self.assertEqual(await guarded_read(self.ctx, [(0x20, 1, "System Bus")],
+                                                        [(0x10, [1], "System Bus")]), [b"\x00"])
+                    disconnect(self.ctx)
+                    await self.bizhawk.stop()
+
+    async def test_pipelined_requests(self) -> None:
+        """Tests that concurrent request lists are answered on the same frame and get their own responses."""
+        await self.connect(2, frame_time=0.05)
+        self.bizhawk.memory["System Bus"][:16] = bytes(range(16))
+        frames = self.bizhawk.frames
+        results = await asyncio.gather(*(read(self.ctx, [(address, 2, "System Bus")]) for address in range(8)))
+        self.assertEqual(results, [[bytes((address, address + 1))] for address in range(8)])
+        self.assertLessEqual(self.bizhawk.frames - frames, 2)
+
+    async def test_lost_connection(self) -> None:
+        """Tests that request lists waiting for a response fail when the connection closes."""
+        await self.connect(2, frame_time=0.05)
+        requests = [asyncio.create_task(ping(self.ctx)) for _ in range(3)]
+        await asyncio.sleep(0)
+        disconnect(self.ctx)
+        for request in requests:
+            with self.assertRaises(RequestFailedError):
+                await request
+        self.assertEqual(self.ctx.connection_status, ConnectionStatus.NOT_CONNECTED)
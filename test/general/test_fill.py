@@ -3,8 +3,8 @@ import unittest
 
 from Options import Accessibility
 from test.general import generate_items, generate_locations, generate_test_multiworld
-from Fill import FillError, balance_multiworld_progression, fill_restrictive, \
-    distribute_early_items, distribute_items_restrictive
+from Fill import AssumedFillState, FillError, balance_multiworld_progression, fill_restrictive, \
+    distribute_early_items, distribute_items_restrictive, sweep_from_pool
 from BaseClasses import Entrance, LocationProgressType, MultiWorld, Region, Item, Location, \
     ItemClassification
 from worlds.generic.Rules import CollectionRule, add_item_rule, locality_rules, set_rule
@@ -464,6 +464,79 @@ class TestFillRestrictive(unittest.TestCase):
         self.assertIsNot(loc0.item, player1.prog_items[0], "Filled item was still present in item pool")
 
 
+class TestAssumedFillState(unittest.TestCase):
+    def setUp(self) -> None:
+        """Two players with a chain of locations, each after the first requiring the item before it"""
+        self.multiworld = generate_test_multiworld(2)
+        self.players = [generate_player_data(self.multiworld, player, 4, 4) for player in (1, 2)]
+        for player in self.players:
+            for location, item in zip(player.locations[1:], player.prog_items):
+                set_rule(location, lambda state, name=item.name, player_id=player.id: state.has(name, player_id))
+        self.pool = [item for player in self.players for item in player.prog_items]
+        self.fill_state = AssumedFillState(self.multiworld.state, self.pool)
+
+    def assert_swept(self) -> None:
+        """Asserts that the updated state is the same as sweeping from scratch with the current pool"""
+        state = self.fill_state.update()
+        expected = sweep_from_pool(self.multiworld.state, list(self.fill_state.pool.values()))
+        for player in self.multiworld.player_ids:
+            self.assertEqual(+state.prog_items[player], +expected.prog_items[player])
+        self.assertEqual(state.advancements, expected.advancements)
+
+    def place(self, location: Location, item: Item) -> None:
+        self.multiworld.push_item(location, item, False)
+        self.fill_state.place(location)
+
+    def unplace(self, location: Location) -> Item:
+        item = location.item
+        assert item
+        location.item = None
+        item.location = None
+        self.fill_state.unplace(location, item)
+        return item
+
+    def test_collect_remove(self) -> None:
+        """Tests that items are collected and removed from the assumed pool"""
+        self.assert_swept()
+        item = self.players[0].prog_items[0]
+        self.fill_state.remove(item)
+        self.assert_swept()
+        self.fill_state.collect(item)
+        self.assert_swept()
+
+    def test_place_unplace(self) -> None:
+        """Tests that filled locations are swept when reachable, and un-collected when they no longer are"""
+        player1, player2 = self.players
+        # player 2's second item behind their first, which is behind player 1's first
+        for item, location in ((player2.prog_items[1], player2.locations[1]),
+                               (player2.prog_items[0], player1.locations[1]),
+                               (player1.prog_items[0], player1.locations[0])):
+            self.fill_state.remove(item)
+            self.assert_swept()
+            self.place(location, item)
+            self.assert_swept()
+        self.assertIn(player2.locations[1], self.fill_state.state.advancements)
+
+        # taking player 1's first item out cuts off player 1's second location and through it player 2's
+        self.fill_state.collect(self.unplace(player1.locations[0]))
+        self.fill_state.remove(player1.prog_items[0])
+        self.assert_swept()
+        self.assertNotIn(player1.locations[1], self.fill_state.state.advancements)
+        self.assertNotIn(player2.locations[1], self.fill_state.state.advancements)
+
+        self.place(player1.locations[0], player1.prog_items[0])
+        self.assert_swept()
+        self.assertIn(player2.locations[1], self.fill_state.state.advancements)
+
+    def test_copy(self) -> None:
+        """Tests that a copy is updated separately from its source"""
+        self.fill_state.update()
+        copy = self.fill_state.copy()
+        copy.remove(self.players[0].prog_items[0])
+        self.assertNotEqual(+copy.update().prog_items[1], +self.fill_state.update().prog_items[1])
+        self.assert_swept()
+
+
 class TestDistributeItemsRestrictive(unittest.TestCase):
     def test_basic_distribute(self):
         """Test that distribute_items_restrictive is deterministic"""
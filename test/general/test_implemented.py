@@ -1,5 +1,6 @@
 import unittest
 
+from BaseClasses import CollectionState
 from Fill import distribute_items_restrictive
 from NetUtils import encode
 from worlds.AutoWorld import AutoWorldRegister, call_all
@@ -134,6 +135,36 @@ class TestImplemented(unittest.TestCase):
                                       f"\n{reachable_only_with_explicit}")
                 self.fail("Unreachable")
 
+    def test_rule_dependencies_spheres(self):
+        """Tests that worlds tracking rule dependencies produce identical spheres and sweeps as when rechecking every
+        blocked entrance and remaining location"""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            if not world_type.track_rule_dependencies:
+                continue
+            multiworld = setup_solo_multiworld(world_type)
+            world = multiworld.get_game_worlds(game_name)[0]
+            with self.subTest(game=game_name, seed=multiworld.seed):
+                distribute_items_restrictive(multiworld)
+                call_all(multiworld, "post_fill")
+
+                tracked_spheres = list(multiworld.get_spheres())
+                tracked_state = CollectionState(multiworld)
+                tracked_state.sweep_for_advancements()
+                # CollectionStates only track dependencies of worlds that have a RuleDependencies
+                world.rule_dependencies = None
+                untracked_spheres = list(multiworld.get_spheres())
+                untracked_state = CollectionState(multiworld)
+                untracked_state.sweep_for_advancements()
+                self.assertEqual(tracked_state.advancements, untracked_state.advancements,
+                                 "Sweeping for advancements differs when tracking rule dependencies.")
+
+                for sphere_num, (sphere_tracked, sphere_untracked) in enumerate(
+                        zip(tracked_spheres, untracked_spheres), start=1):
+                    self.assertEqual(sphere_tracked, sphere_untracked,
+                                     f"Sphere {sphere_num} differs when tracking rule dependencies. Entrance rules may "
+                                     f"read something other than the player's items and region reachability.")
+                self.assertEqual(len(tracked_spheres), len(untracked_spheres))
+
     def test_no_items_or_locations_or_regions_submitted_in_init(self):
         """Test that worlds don't submit items/locations/regions to the multiworld in __init__"""
         for game_name, world_type in AutoWorldRegister.world_types.items():
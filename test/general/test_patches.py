@@ -1,6 +1,6 @@
 ﻿import unittest
 from worlds.AutoWorld import AutoWorldRegister
-from worlds.Files import AutoPatchRegister
+from worlds.Files import APPatchExtension, APProcedurePatch, APTokenMixin, APTokenTypes, AutoPatchRegister
 
 
 class TestPatches(unittest.TestCase):
@@ -9,3 +9,25 @@ class TestPatches(unittest.TestCase):
             with self.subTest(game=game_name):
                 self.assertIn(game_name, AutoWorldRegister.world_types.keys(),
                               f"Patch '{game_name}' does not match the name of any world.")
+
+
+class TokenPatch(APProcedurePatch, APTokenMixin):
+    pass
+
+
+class TestApplyTokens(unittest.TestCase):
+    def test_tokens_apply_in_order(self) -> None:
+        patch = TokenPatch()
+        patch.write_token(APTokenTypes.WRITE, 0, b"\x0F\xF0\xAA")
+        patch.write_token(APTokenTypes.AND_8, 0, 0x3C)
+        patch.write_token(APTokenTypes.OR_8, 1, 0x01)
+        patch.write_token(APTokenTypes.XOR_8, 2, 0xFF)
+        patch.write_token(APTokenTypes.RLE, 4, (3, 0x42))
+        patch.write_token(APTokenTypes.COPY, 8, (4, 0))
+        patch.write_token(APTokenTypes.COPY, 1, (4, 4))  # reads what the earlier tokens wrote
+        patch.write_token(APTokenTypes.WRITE, 12, b"\x01\x02")  # grows the file past its end
+        patch.write_file("token_data.bin", patch.get_token_binary())
+
+        result = APPatchExtension.apply_tokens(patch, bytes(12), "token_data.bin")
+        self.assertEqual(result, bytes([0x0C, 0x42, 0x42, 0x42, 0x00, 0x42, 0x42, 0x00,
+                                        0x0C, 0xF1, 0x55, 0x00, 0x01, 0x02]))
@@ -0,0 +1,24 @@
+import unittest
+
+from . import generate_items, generate_locations, generate_test_multiworld
+
+
+class TestPlaythrough(unittest.TestCase):
+    def test_playthrough_keeps_multiworld(self):
+        """Tests that the playthrough culls precollected items without removing them from the multiworld."""
+        multiworld = generate_test_multiworld(1)
+        menu = multiworld.get_region("Menu", 1)
+        location, = generate_locations(1, 1, menu)
+        required, unneeded, goal = generate_items(3, 1, True)
+        location.place_locked_item(goal)
+        location.access_rule = lambda state: state.has(required.name, 1)
+        multiworld.completion_condition[1] = lambda state: state.has(goal.name, 1)
+        multiworld.push_precollected(required)
+        multiworld.push_precollected(unneeded)
+
+        multiworld.spoiler.create_playthrough()
+
+        self.assertEqual(multiworld.spoiler.playthrough["0"], [multiworld.get_name_string_for_object(required)])
+        self.assertEqual(multiworld.spoiler.playthrough["1"], {str(location): str(goal)})
+        self.assertEqual(multiworld.precollected_items[1], [required, unneeded])
+        self.assertTrue(multiworld.state.has(unneeded.name, 1))
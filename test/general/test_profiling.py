@@ -0,0 +1,55 @@
+import json
+import time
+import unittest
+
+import Profiling
+from BaseClasses import CollectionState
+from Fill import distribute_items_restrictive
+from Profiling import GenerationProfile
+from worlds import AutoWorldRegister
+
+from . import setup_multiworld
+
+
+class TestProfiling(unittest.TestCase):
+    def test_stages_and_steps(self) -> None:
+        """Tests that stages are recorded per player and fill functions as steps."""
+        world_type = AutoWorldRegister.world_types["Clique"]
+        with GenerationProfile() as profile:
+            self.assertIs(Profiling.current, profile)
+            multiworld = setup_multiworld([world_type] * 2)
+            profile.multiworld = multiworld
+            with Profiling.step("fill"):
+                distribute_items_restrictive(multiworld)
+        self.assertIsNone(Profiling.current)
+
+        for player in multiworld.player_ids:
+            self.assertEqual(profile.stages[("create_regions", "Clique", player)][2], 1)
+        self.assertIn("fill / fill_restrictive Progression", profile.steps)
+        self.assertIn("fill / remaining_fill Remaining", profile.steps)
+
+        report = json.loads(json.dumps(profile.to_dict()))
+        self.assertEqual(report["seed_name"], multiworld.seed_name)
+        self.assertEqual(sorted(world["player"] for world in report["worlds"]), [1, 2])
+        self.assertEqual(report["games"][0]["players"], 2)
+
+    def test_rule_sampling(self) -> None:
+        """Tests that the time spent in an access rule is attributed to it and its location."""
+        world_type = AutoWorldRegister.world_types["Clique"]
+        multiworld = setup_multiworld(world_type)
+        location = next(iter(multiworld.get_locations(1)))
+
+        def slow_rule(state: CollectionState) -> bool:
+            time.sleep(0.05)
+            return True
+
+        location.access_rule = slow_rule
+        with GenerationProfile(sample_interval=0.001) as profile:
+            profile.multiworld = multiworld
+            self.assertTrue(location.can_reach(multiworld.state))
+
+        rules = profile.to_dict()["rules"]
+        self.assertEqual(rules["rules"][0]["rule"], slow_rule.__qualname__)
+        self.assertEqual(rules["rules"][0]["spots"], 1)
+        self.assertEqual((rules["spots"][0]["name"], rules["spots"][0]["player"]), (location.name, 1))
+        self.assertGreater(rules["spots"][0]["seconds"], 0.02)
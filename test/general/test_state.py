@@ -1,7 +1,8 @@
 import unittest
 
+from BaseClasses import CollectionState, Region, RuleDependencies
 from worlds.AutoWorld import AutoWorldRegister, call_all
-from . import setup_solo_multiworld
+from . import generate_items, generate_locations, generate_test_multiworld, setup_solo_multiworld
 
 
 class TestBase(unittest.TestCase):
@@ -27,3 +28,73 @@ class TestBase(unittest.TestCase):
                     with self.subTest("Step", step=step):
                         call_all(multiworld, step)
                         self.assertTrue(multiworld.get_all_state(False, allow_partial_entrances=True))
+
+    def test_copy_is_independent(self):
+        """Ensure changes to a copied state don't show up in the state it was copied from, and the other way around."""
+        multiworld = generate_test_multiworld(2)
+        key, other_key = generate_items(2, 1, True)
+        menu = multiworld.get_region("Menu", 1)
+        locked = Region("Locked", 1, multiworld)
+        multiworld.regions.append(locked)
+        menu.connect(locked, rule=lambda state: state.has(key.name, 1))
+
+        state = CollectionState(multiworld)
+        self.assertFalse(locked.can_reach(state))
+        copy = state.copy()
+        copy.collect(key, True)
+        self.assertTrue(locked.can_reach(copy))
+        self.assertFalse(state.has(key.name, 1))
+        self.assertFalse(locked.can_reach(state))
+
+        state.collect(other_key, True)
+        self.assertTrue(state.has(other_key.name, 1))
+        self.assertFalse(copy.has(other_key.name, 1))
+        copy.remove(key)
+        self.assertFalse(locked.can_reach(copy))
+
+    def test_copy_direct_writes(self):
+        """Ensure writing to prog_items of a copy directly after unshare(), as rules caching values in it do, doesn't
+        change the state it was copied from."""
+        multiworld = generate_test_multiworld()
+        state = CollectionState(multiworld)
+        state.add_item("Cached", 1)
+        copy = state.copy()
+        copy.unshare(1)
+        copy.prog_items[1]["Cached"] += 1
+        copy.prog_items[1]["Other"] = 1
+        self.assertEqual(state.prog_items[1], {"Cached": 1})
+        self.assertEqual(copy.prog_items[1], {"Cached": 2, "Other": 1})
+
+    def test_rules_keep_copied_state(self):
+        """Ensure evaluating every location and entrance rule on a copy doesn't change the state it was copied from."""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                state = CollectionState(multiworld)
+                prog_items = {player: dict(items) for player, items in state.prog_items.items()}
+                copy = state.copy()
+                for spot in (*multiworld.get_locations(), *multiworld.get_entrances()):
+                    spot.can_reach(copy)
+                self.assertEqual({player: dict(items) for player, items in state.prog_items.items()}, prog_items)
+
+    def test_sweep_rule_dependencies(self):
+        """Ensure sweeping with tracked rule dependencies rechecks locations whose rules read an item name through
+        get() or in, or whose region became reachable."""
+        multiworld = generate_test_multiworld()
+        multiworld.worlds[1].rule_dependencies = RuleDependencies()
+        key, event, other = generate_items(3, 1, True)
+        menu = multiworld.get_region("Menu", 1)
+        locked = Region("Locked", 1, multiworld)
+        multiworld.regions.append(locked)
+        menu.connect(locked, rule=lambda state: state.has(key.name, 1))
+        key_location, event_location, other_location = generate_locations(3, 1, menu)
+        locked_location, = generate_locations(1, 1, locked, tag="_locked")
+        event_location.access_rule = lambda state: key.name in state.prog_items[1]
+        other_location.access_rule = lambda state: state.prog_items[1].get(event.name, 0) > 0
+        for location, item in ((key_location, key), (event_location, event), (other_location, other),
+                               (locked_location, generate_items(1, 1, True)[0])):
+            location.place_locked_item(item)
+
+        state = CollectionState(multiworld)
+        state.sweep_for_advancements()
+        self.assertEqual(state.advancements, {key_location, event_location, other_location, locked_location})
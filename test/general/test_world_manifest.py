@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from worlds import DataPackageStore, WorldManifest, WorldSource, world_sources
+
+
+class WorldSourceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.world_path = os.path.join(self.directory.name, "test_world")
+        os.mkdir(self.world_path)
+        with open(os.path.join(self.world_path, "__init__.py"), "w") as f:
+            f.write("")
+        self.source = WorldSource(self.world_path, relative=False)
+        self.manifest_path = os.path.join(self.directory.name, "world_manifest.json")
+        self.games = {"Test Game": {"world": "worlds.test_world.TestWorld", "settings_key": None}}
+
+    def change_source(self) -> None:
+        init_path = os.path.join(self.world_path, "__init__.py")
+        stat = os.stat(init_path)
+        os.utime(init_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestWorldManifest(WorldSourceTestCase):
+    def test_round_trip(self) -> None:
+        """Test that recorded games are read back from the saved manifest."""
+        manifest = WorldManifest(self.manifest_path)
+        self.assertIsNone(manifest.get_games(self.source))
+        manifest.record(self.source, self.games)
+        manifest.save()
+        self.assertFalse(manifest.changed)
+
+        manifest = WorldManifest(self.manifest_path)
+        self.assertEqual(manifest.get_games(self.source), self.games)
+        self.assertFalse(manifest.failed(self.source))
+
+    def test_changed_source(self) -> None:
+        """Test that a source is not indexed anymore once a file in it changes."""
+        manifest = WorldManifest(self.manifest_path)
+        manifest.record(self.source, self.games)
+        self.change_source()
+        self.assertIsNone(manifest.get_games(self.source))
+
+    def test_failed_source(self) -> None:
+        manifest = WorldManifest(self.manifest_path)
+        manifest.record(self.source, {}, failed=True)
+        manifest.save()
+        manifest = WorldManifest(self.manifest_path)
+        self.assertEqual(manifest.get_games(self.source), {})
+        self.assertTrue(manifest.failed(self.source))
+
+    def test_unusable_manifest(self) -> None:
+        with open(self.manifest_path, "w") as f:
+            f.write("{")
+        self.assertEqual(WorldManifest(self.manifest_path).sources, {})
+
+    def test_loaded_worlds_indexed(self) -> None:
+        """Test that with lazy loading, each loaded world source is indexed with the games registered from its module,
+        and that eager loading leaves the manifest alone."""
+        import worlds
+        from worlds import AutoWorldRegister, failed_world_loads
+
+        for lazy_loading in (False, True):
+            manifest = WorldManifest(self.manifest_path)
+            game_sources = {}
+            with mock.patch.object(worlds, "lazy_loading", lazy_loading), \
+                    mock.patch.object(worlds, "world_manifest", manifest), \
+                    mock.patch.object(worlds, "_game_sources", game_sources):
+                worlds._load_sources([WorldSource(source.path, source.is_zip, source.relative)
+                                      for source in world_sources if source.module_name == "clique"])
+            if not lazy_loading:
+                self.assertEqual(manifest.sources, {})
+                continue
+            for source in world_sources:
+                if not source.load_attempted or source.module_name in failed_world_loads:
+                    continue
+                with self.subTest(source=source):
+                    games = manifest.get_games(source)
+                    self.assertIsNotNone(games)
+                    for game, info in games.items():
+                        world = AutoWorldRegister.world_types[game]
+                        self.assertEqual(info["world"], f"{world.__module__}.{world.__name__}")
+            self.assertIn("Clique", manifest.get_games(game_sources["Clique"]))
+
+
+class TestDataPackageStore(WorldSourceTestCase):
+    game_data = {"Test Game": {"data_package": {"item_name_groups": {}, "item_name_to_id": {"Item": 1},
+                                                "location_name_groups": {}, "location_name_to_id": {"Location": 1},
+                                                "checksum": "0"},
+                               "hint_blacklist": ["Item"]}}
+
+    def test_round_trip(self) -> None:
+        folder = os.path.join(self.directory.name, "data_packages")
+        DataPackageStore(folder).store(self.source, self.game_data)
+        self.assertEqual(DataPackageStore(folder).get(self.source), self.game_data)
+
+    def test_changed_source(self) -> None:
+        """Test that a data package is not used anymore once a file of its world changes, including in subfolders."""
+        folder = os.path.join(self.directory.name, "data_packages")
+        DataPackageStore(folder).store(self.source, self.game_data)
+        os.mkdir(os.path.join(self.world_path, "data"))
+        with open(os.path.join(self.world_path, "data", "items.json"), "w") as f:
+            f.write("{}")
+        self.assertIsNone(DataPackageStore(folder).get(self.source))
+
+    def test_data_packages_stored(self) -> None:
+        """Test that the data packages of the loaded worlds have the checksums of their contents."""
+        from worlds import get_hint_blacklist, network_data_package
+        from worlds.AutoWorld import data_package_checksum
+        for game, game_package in network_data_package["games"].items():
+            with self.subTest(game=game):
+                game_package = dict(game_package)
+                checksum = game_package.pop("checksum")
+                self.assertEqual(data_package_checksum(game_package), checksum)
+                self.assertIsInstance(get_hint_blacklist(game), frozenset)
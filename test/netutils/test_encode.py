@@ -0,0 +1,55 @@
+# Tests for NetUtils.encode against the output of _scan_for_TypedTuples with json
+import typing
+import unittest
+from unittest import mock
+
+import NetUtils
+from NetUtils import (ClientStatus, HintStatus, NetworkItem, NetworkPlayer, NetworkSlot, SlotType, _encode,
+                      _scan_for_TypedTuples, decode, encode)
+
+sample_messages: typing.List[typing.Any] = [
+    [{"cmd": "ReceivedItems", "index": 0, "items": [NetworkItem(1, 2, 3, 4), NetworkItem(5, 6, 7)]}],
+    [{"cmd": "DataPackage", "data": {"games": {"Game": {"item_name_to_id": {"Item": 1, "Ítem \"2\"\n": 2},
+                                                          "location_name_to_id": {"Location": 1},
+                                                          "checksum": "abc"}}}}],
+    [{"cmd": "Connected", "team": 0, "slot": 1, "players": [NetworkPlayer(0, 1, "Alias", "Name")],
+      "missing_locations": [1, 2], "checked_locations": {3, 4}, "slot_data": {"ratio": 0.5, "tiny": 1e-05},
+      "slot_info": {1: NetworkSlot("Name", "Game", SlotType.player),
+                    2: NetworkSlot("Group", "Game", SlotType.group, [1])},
+      "hint_points": 0}],
+    [{"cmd": "RoomInfo", "time": 1700000000.123, "big": 1e+16, "hint_cost": 10, "tags": frozenset(("AP",))}],
+    [{"cmd": "PrintJSON", "data": [{"text": "x", "hint_status": HintStatus.HINT_FOUND}],
+      "status": ClientStatus.CLIENT_GOAL, "keys": {None: True, True: None, 2.5: False, SlotType.group: 1}}],
+    [{"cmd": "Bounced", "data": {"large": 2 ** 70, "surrogate": "\ud800", "nan": float("nan")}}],
+    [{"cmd": "Set", "nested": [[NetworkItem(1, 2, NetworkItem(3, 4, 5))], (NetworkPlayer(0, 1, "a", "b"),)]}],
+]
+
+
+class TestEncode(unittest.TestCase):
+    def test_same_as_json(self) -> None:
+        for message in sample_messages:
+            with self.subTest(message=message):
+                self.assertEqual(encode(message), _encode(_scan_for_TypedTuples(message)))
+
+    def test_same_without_orjson(self) -> None:
+        with mock.patch.object(NetUtils, "orjson", None):
+            for message in sample_messages:
+                with self.subTest(message=message):
+                    self.assertEqual(encode(message), _encode(_scan_for_TypedTuples(message)))
+
+    def test_round_trip(self) -> None:
+        items = [NetworkItem(1, 2, 3, 4), NetworkItem(5, 6, 7)]
+        self.assertEqual(decode(encode([{"cmd": "ReceivedItems", "items": items}])),
+                         [{"cmd": "ReceivedItems", "items": items}])
+        self.assertEqual(encode(items[0]), '{"item":1,"location":2,"player":3,"flags":4,"class":"NetworkItem"}')
+
+    def test_does_not_change_message(self) -> None:
+        message = {"items": [NetworkItem(1, 2, 3)], "locations": {1, 2}}
+        encode(message)
+        self.assertEqual(message, {"items": [NetworkItem(1, 2, 3)], "locations": {1, 2}})
+
+    def test_not_serializable(self) -> None:
+        with self.assertRaises(TypeError):
+            encode({"cmd": "Bounce", "data": object()})
+        with self.assertRaises(TypeError):
+            encode([NetworkItem({1}, 2, 3)])
@@ -170,6 +170,24 @@ class Base:
             locations.intersection_update(self.store[1])
             self.assertEqual(locations, {11, 12})
 
+        def test_get_sphere(self) -> None:
+            self.store.set_spheres([{1: {12, 13}}, {2: {21}, 3: {9}, 9999: {1}}, {1: {10}}])
+            self.assertEqual(self.store.get_sphere(1, 12), 0)
+            self.assertEqual(self.store.get_sphere(1, 13), 0)
+            self.assertEqual(self.store.get_sphere(2, 21), 1)
+            self.assertEqual(self.store.get_sphere(3, 9), 1)
+
+        def test_get_sphere_exception(self) -> None:
+            self.store.set_spheres([{1: {12, 13}}, {2: {21}, 3: {9}, 9999: {1}}, {1: {10}}])
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(1, 11)  # not in any sphere
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(1, 10)  # not a location of player 1
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(9999, 1)
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(0, 12)
+
     class TestLocationStoreConstructor(unittest.TestCase):
         """Test constructors for a given store type."""
         type: type
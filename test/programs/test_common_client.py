@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import NetUtils
+import Utils
 from CommonClient import CommonContext
 
 
@@ -93,3 +97,42 @@ class TestCommonContext(unittest.IsolatedAsyncioTestCase):
         assert self.ctx.item_names.lookup_in_slot(-1, 3) == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame1") == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame2") == "Nothing"
+
+    async def test_cached_data_package_lookups(self):
+        with tempfile.TemporaryDirectory() as folder:
+            cache = Utils.DataPackageCache(os.path.join(folder, "datapackages.bin"))
+            cache.store({"__TestGame3": {
+                "location_name_to_id": {"Test Location 4": 2 ** 54 + 4},
+                "item_name_to_id": {"Test Item 4": 2 ** 54 + 4},
+                "checksum": "test",
+            }})
+            cached_package = cache.get("__TestGame3", "test")
+            assert cached_package is not None
+            self.ctx.update_game_from_cache(cached_package)
+
+        assert self.ctx.checksums["__TestGame3"] == "test"
+        assert self.ctx.item_names.lookup_in_game(2 ** 54 + 4, "__TestGame3") == "Test Item 4"
+        assert self.ctx.item_names.lookup_in_game(2 ** 54 + 1, "__TestGame3") == f"Unknown item (ID: {2 ** 54 + 1})"
+        assert self.ctx.item_names.lookup_in_game(-1, "__TestGame3") == "Nothing"
+        assert self.ctx.location_names.lookup_in_game(2 ** 54 + 4, "__TestGame3") == "Test Location 4"
+        assert self.ctx.location_names.lookup_in_game(-1, "__TestGame3") == "Cheat Console"
+
+    async def test_legacy_data_packages_stored_once(self):
+        legacy_games = {
+            game: {
+                "location_name_to_id": {f"{game} Location": 2 ** 54 + 5},
+                "item_name_to_id": {f"{game} Item": 2 ** 54 + 5},
+                "checksum": f"{game} checksum",
+            } for game in ("__TestGame4", "__TestGame5")
+        }
+        with mock.patch.object(Utils, "load_cached_data_package", return_value=None), \
+                mock.patch.object(Utils, "load_data_package_for_checksum",
+                                  side_effect=lambda game, checksum: legacy_games[game]), \
+                mock.patch.object(Utils, "store_data_packages_for_checksums") as store, \
+                mock.patch.object(self.ctx, "send_msgs") as send_msgs:
+            await self.ctx.prepare_data_package(set(legacy_games), {
+                game: package["checksum"] for game, package in legacy_games.items()})
+
+        store.assert_called_once_with(legacy_games)
+        send_msgs.assert_not_called()
+        assert self.ctx.item_names.lookup_in_game(2 ** 54 + 5, "__TestGame5") == "__TestGame5 Item"
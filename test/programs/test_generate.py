@@ -72,6 +72,22 @@ class TestGenerateMain(unittest.TestCase):
 
         self.assertOutput(self.output_tempdir.name)
 
+    def test_invalid_multidata_compression(self):
+        from settings import get_settings
+        generator_settings = get_settings().generator
+        multidata_compression = generator_settings.multidata_compression
+        generator_settings.multidata_compression = generator_settings.MultidataCompression(10)
+        try:
+            sys.argv = [sys.argv[0], '--seed', '0',
+                        '--player_files_path', str(self.abs_input_dir),
+                        '--outputpath', self.output_tempdir.name]
+            with self.assertRaises(ValueError):
+                Main.main(*Generate.main())
+        finally:
+            generator_settings.multidata_compression = multidata_compression
+
+        self.assertEqual(list(Path(self.output_tempdir.name).glob('*')), [])
+
     def test_generate_yaml(self):
         # override host.yaml
         from settings import get_settings
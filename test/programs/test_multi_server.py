@@ -1,5 +1,13 @@
+import os
+import tempfile
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+import zlib
+from unittest import mock
+
+from MultiServer import Client, Context, DataPackageCache, SaveJournal, ServerCommandProcessor, send_items_to, \
+    send_new_items
+from NetUtils import Hint, HintStatus, NetworkItem, encode
+from Utils import restricted_loads
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +46,218 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class SaveContext(Context):
+    def _load_game_data(self) -> None:
+        pass  # saving does not need the data package, which can only be loaded into one Context
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.ctx = SaveContext("", 0, "", "", 0, 0, False)
+        self.ctx.saving = True
+        self.ctx.save_filename = os.path.join(directory.name, "test.apsave")
+        self.ctx.save_journal = SaveJournal(self.ctx.save_filename + ".journal")
+
+    def replay(self) -> Context:
+        self.ctx.save_journal.write_queued()
+        ctx = SaveContext("", 0, "", "", 0, 0, False)
+        ctx.apply_journal(SaveJournal(self.ctx.save_filename + ".journal").read())
+        return ctx
+
+    def test_replay(self) -> None:
+        """Tests that saving with a journal appends the changes, and that they can be replayed."""
+        ctx = self.ctx
+        ctx.location_checks[0, 1] |= {1, 2}
+        ctx.journal_checks(0, 1, {1, 2})
+        send_items_to(ctx, 0, 2, NetworkItem(10, 1, 1), NetworkItem(11, 2, 1))
+        ctx.stored_data["key"] = {"value": 1}
+        ctx.journal_change("stored_data", "key")
+        ctx.name_aliases[0, 1] = "alias"
+        ctx.journal_change("name_aliases", (0, 1))
+        self.assertTrue(ctx.save())
+        self.assertFalse(ctx.save_dirty, "a small journal should not need a snapshot")
+        self.assertFalse(os.path.exists(ctx.save_journal.filename), "the save thread should write the journal")
+
+        send_items_to(ctx, 0, 2, NetworkItem(12, 3, 1))
+        ctx.stored_data["key"] = {"value": 2}
+        ctx.journal_change("stored_data", "key")
+        del ctx.name_aliases[0, 1]
+        ctx.journal_change("name_aliases", (0, 1))
+        ctx.save()
+
+        replayed = self.replay()
+        self.assertEqual(replayed.location_checks[0, 1], {1, 2})
+        self.assertEqual(replayed.received_items, ctx.received_items)
+        self.assertEqual(replayed.stored_data, {"key": {"value": 2}})
+        self.assertEqual(replayed.name_aliases, {})
+
+    def test_connection_timers(self) -> None:
+        """Tests that connection timers are journaled, as they change on every connect and disconnect."""
+        import datetime
+        ctx = self.ctx
+        ctx.client_connection_timers[0, 1] = datetime.datetime.now(datetime.timezone.utc)
+        ctx.journal_change("client_connection_timers", (0, 1))
+        ctx.save()
+        self.assertEqual(self.replay().client_connection_timers[0, 1], ctx.client_connection_timers[0, 1])
+
+    def test_unjournaled_changes(self) -> None:
+        """Tests that changes to save data that is not journaled make the save thread write a snapshot."""
+        ctx = self.ctx
+        ServerCommandProcessor(ctx)("/option item_cheat true")
+        self.assertTrue(ctx.save_dirty)
+        self.assertTrue(ctx._save())
+        with open(ctx.save_filename, "rb") as f:
+            self.assertEqual(restricted_loads(zlib.decompress(f.read()))["game_options"]["item_cheat"], True)
+
+    def test_incomplete_record(self) -> None:
+        """Tests that a record cut short is dropped, and new records can be read after it."""
+        ctx = self.ctx
+        ctx.stored_data["key"] = 1
+        ctx.journal_change("stored_data", "key")
+        ctx.save()
+        ctx.save_journal.write_queued()
+        with open(ctx.save_journal.filename, "ab") as f:
+            f.write(SaveJournal.record_header.pack(100) + b"cut short")
+
+        journal = SaveJournal(ctx.save_journal.filename)
+        self.assertEqual(journal.read(), [("stored_data", "key", 1)])
+        journal.append([("stored_data", "key", 2)])
+        journal.write_queued()
+        self.assertEqual(SaveJournal(journal.filename).read(), [("stored_data", "key", 1), ("stored_data", "key", 2)])
+
+    def test_compaction(self) -> None:
+        """Tests that a snapshot empties the journal and contains its changes."""
+        ctx = self.ctx
+        ctx.save_journal.compaction_size = 0
+        ctx.stored_data["key"] = 1
+        ctx.journal_change("stored_data", "key")
+        ctx.save()
+        ctx.save_journal.write_queued()
+        ctx.save()
+        self.assertTrue(ctx.save_dirty, "a journal larger than its compaction size should need a snapshot")
+        self.assertTrue(ctx._save())
+        self.assertEqual(os.path.getsize(ctx.save_journal.filename), 0)
+        with open(ctx.save_filename, "rb") as f:
+            self.assertEqual(restricted_loads(zlib.decompress(f.read()))["stored_data"], {"key": 1})
+
+
+    def test_changes_during_snapshot(self) -> None:
+        """Tests that changes journaled while a snapshot is written are kept after it, and earlier ones are dropped."""
+        ctx = self.ctx
+        ctx.stored_data["key"] = 1
+        ctx.journal_change("stored_data", "key")
+        ctx.save()
+        get_save = ctx.get_save
+
+        def change_while_saving() -> dict:
+            save = get_save()
+            ctx.stored_data["key"] = 2
+            ctx.journal_change("stored_data", "key")
+            ctx.save()
+            # the save thread keeps writing the journal while a snapshot is written elsewhere
+            ctx.save_journal.write_queued()
+            self.assertEqual(os.path.getsize(ctx.save_journal.filename), ctx.save_journal.size)
+            return save
+
+        with mock.patch.object(ctx, "get_save", change_while_saving):
+            self.assertTrue(ctx._save())
+        ctx.save_journal.write_queued()
+        self.assertEqual(SaveJournal(ctx.save_journal.filename).read(), [("stored_data", "key", 2)])
+
+    def test_failed_snapshot(self) -> None:
+        """Tests that the journal keeps all changes if writing a snapshot fails."""
+        ctx = self.ctx
+        ctx.stored_data["key"] = 1
+        ctx.journal_change("stored_data", "key")
+        ctx.save()
+        with mock.patch.object(ctx, "get_save", side_effect=OSError):
+            self.assertFalse(ctx._save())
+        ctx.stored_data["key"] = 2
+        ctx.journal_change("stored_data", "key")
+        ctx.save()
+        self.assertEqual(self.replay().stored_data, {"key": 2})
+        self.assertEqual(SaveJournal(ctx.save_journal.filename).read(),
+                         [("stored_data", "key", 1), ("stored_data", "key", 2)])
+
+
+class TestSendNewItems(unittest.IsolatedAsyncioTestCase):
+    async def test_only_receivers(self) -> None:
+        """Tests that new items are sent to the clients of slots that received them only."""
+        ctx = SaveContext("", 0, "", "", 0, 0, False)
+        ctx.clients = {0: {}}
+        for slot in (1, 2):
+            client = Client(None, ctx)
+            client.team, client.slot = 0, slot
+            client.items_handling = 0b111
+            ctx.clients[0][slot] = [client]
+
+        send_items_to(ctx, 0, 2, NetworkItem(10, 1, 1))
+        self.assertEqual(ctx.new_item_receivers, {(0, 2)})
+        send_new_items(ctx)
+        self.assertEqual(ctx.new_item_receivers, set())
+        self.assertEqual(ctx.clients[0][1][0].send_index, 0)
+        self.assertEqual(ctx.clients[0][2][0].send_index, 1)
+
+
+class TestLocationHints(unittest.TestCase):
+    def test_recheck_location_hints(self) -> None:
+        """Tests that checking a location marks its hints found for the finding and receiving slot only."""
+        ctx = SaveContext("", 0, "", "", 0, 0, False)
+        hint = Hint(2, 1, 100, 10, False)
+        other_hint = Hint(2, 1, 101, 11, False)
+        ctx.hints[0, 1] |= {hint, other_hint}
+        ctx.hints[0, 2] |= {hint, other_hint}
+        ctx.index_hints()
+        self.assertEqual(ctx.get_hint(0, 1, 100), hint)
+
+        ctx.location_checks[0, 1].add(100)
+        changed = set()
+        ctx.recheck_location_hints(0, 1, {100}, changed)
+        found_hint = hint._replace(found=True, status=HintStatus.HINT_FOUND)
+        self.assertEqual(changed, {(0, 1), (0, 2)})
+        self.assertEqual(ctx.hints[0, 1], {found_hint, other_hint})
+        self.assertEqual(ctx.hints[0, 2], {found_hint, other_hint})
+        self.assertEqual(ctx.get_hint(0, 1, 100), found_hint)
+        self.assertEqual(ctx.get_hint(0, 1, 101), other_hint)
+
+
+class TestDataPackageCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = DataPackageCache()
+        patcher = mock.patch("MultiServer.data_package_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ctx = SaveContext("", 0, "", "", 0, 0, False)
+        self.ctx.gamespackage = {
+            "Game": {"item_name_to_id": {"Item": 1}, "location_name_to_id": {"Location": 1}, "checksum": "a"},
+            "Gäme 2": {"item_name_to_id": {"Ítem": 2}, "location_name_to_id": {}, "checksum": "b"},
+            "Old Game": {"item_name_to_id": {"Item": 3}, "location_name_to_id": {}},
+        }
+
+    def test_same_as_dumper(self) -> None:
+        """Tests that the encoded message is the same as encoding it as a whole, when encoding and from the cache."""
+        expected = encode([{"cmd": "DataPackage", "data": {"games": self.ctx.gamespackage}}])
+        self.assertEqual(self.ctx.encode_data_package(self.ctx.gamespackage), expected)
+        self.assertEqual(self.ctx.encode_data_package(self.ctx.gamespackage), expected)
+        self.assertEqual(self.ctx.encode_data_package({}), encode([{"cmd": "DataPackage", "data": {"games": {}}}]))
+
+    def test_counters(self) -> None:
+        """Tests that games are encoded once per checksum, and that reuse is counted."""
+        self.ctx.encode_data_package(self.ctx.gamespackage)
+        self.assertEqual((self.cache.hits, self.cache.misses, self.cache.bytes_saved), (0, 2, 0))
+        other_ctx = SaveContext("", 0, "", "", 0, 0, False)
+        other_ctx.encode_data_package({"Game": self.ctx.gamespackage["Game"]})
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertEqual(self.cache.bytes_saved, len(encode(self.ctx.gamespackage["Game"]).encode()))
+        self.assertEqual(set(self.cache.encoded), {"a", "b"})
+
+    def test_eviction(self) -> None:
+        """Tests that the least recently used games are dropped to stay within max_size."""
+        self.cache.max_size = len(encode(self.ctx.gamespackage["Game"]).encode()) + 1
+        self.ctx.encode_data_package(self.ctx.gamespackage)
+        self.assertEqual(list(self.cache.encoded), ["b"])
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
@@ -0,0 +1,80 @@
+import unittest
+from typing import Any, Dict, List
+
+from UIModels import HintRows, LogBuffer
+
+
+class TestLogBuffer(unittest.TestCase):
+    def test_flush(self) -> None:
+        """Tests that pending entries are added in order and that only the newest entries are kept."""
+        buffer = LogBuffer(5)
+        data: List[Dict[str, Any]] = []
+        self.assertFalse(buffer.flush_into(data))
+        for text in "abc":
+            buffer.append({"text": text})
+        self.assertTrue(buffer.flush_into(data))
+        self.assertEqual([entry["text"] for entry in data], ["a", "b", "c"])
+        self.assertEqual(len(buffer), 0)
+
+        for text in "def":
+            buffer.append({"text": text})
+        buffer.flush_into(data)
+        self.assertEqual([entry["text"] for entry in data], ["b", "c", "d", "e", "f"])
+
+        for number in range(100):
+            buffer.append({"text": str(number)})
+        self.assertEqual(len(buffer), 5)
+        buffer.flush_into(data)
+        self.assertEqual([entry["text"] for entry in data], ["95", "96", "97", "98", "99"])
+
+
+class TestHintRows(unittest.TestCase):
+    built: List[int]
+
+    def make_row(self, hint: Dict[str, Any]) -> Dict[str, Any]:
+        self.built.append(hint["location"])
+        return {"status": {"hint": hint}}
+
+    @staticmethod
+    def sorter(row: Dict[str, Any]) -> int:
+        return row["status"]["hint"]["status"]
+
+    @staticmethod
+    def locations(rows: HintRows) -> List[int]:
+        return [row["status"]["hint"]["location"] for row in rows]
+
+    def setUp(self) -> None:
+        self.built = []
+        self.hints = [{"finding_player": 1, "location": location, "status": status}
+                      for location, status in ((1, 0), (2, 30), (3, 0), (4, 10))]
+
+    def test_same_as_sorting(self) -> None:
+        """Tests that rows are in the order of a stable sort of all hints, in both directions."""
+        rows = HintRows(self.make_row)
+        for reverse in (True, False, True):
+            self.assertTrue(rows.update(self.hints, self.sorter, reverse))
+            self.assertEqual(self.locations(rows),
+                             [hint["location"] for hint in sorted(self.hints, key=lambda hint: hint["status"],
+                                                                  reverse=reverse)])
+        self.assertEqual(self.built, [1, 2, 3, 4])
+
+    def test_only_changes_built(self) -> None:
+        """Tests that only new and changed hints get their rows built and are moved to their place."""
+        rows = HintRows(self.make_row)
+        rows.update(self.hints, self.sorter, True)
+        self.built.clear()
+        self.assertFalse(rows.update([dict(hint) for hint in self.hints], self.sorter, True))
+        self.assertEqual(self.built, [])
+
+        self.hints[0]["status"] = 40
+        self.hints.append({"finding_player": 2, "location": 1, "status": 20})
+        self.assertTrue(rows.update(self.hints, self.sorter, True))
+        self.assertEqual(self.built, [1, 1])
+        self.assertEqual(self.locations(rows), [1, 2, 1, 4, 3])
+
+        self.assertTrue(rows.update(self.hints[1:], self.sorter, True))
+        self.assertEqual(self.locations(rows), [2, 1, 4, 3])
+
+        rows.clear()
+        self.assertTrue(rows.update([], self.sorter, True))
+        self.assertEqual(self.locations(rows), [])
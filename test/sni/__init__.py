@@ -0,0 +1,73 @@
+import asyncio
+import json
+from typing import Any
+
+from websockets.exceptions import ConnectionClosed
+from websockets.server import WebSocketServer, WebSocketServerProtocol, serve
+
+
+class FakeSNI:
+    """Stand-in for SNI with one attached device, answering GetAddress and PutAddress against in-memory SNES memory.
+
+    Like SNI, replies to GetAddress are sent as binary messages of at most `chunk_size` bytes."""
+    memory: bytearray
+    latency: float
+    chunk_size: int
+    requests: int
+    """GetAddress and PutAddress requests received"""
+    reads: int
+    """address ranges read by GetAddress"""
+    server: WebSocketServer | None
+
+    def __init__(self, latency: float = 0, chunk_size: int = 1024, memory_size: int = 0x1000000) -> None:
+        self.memory = bytearray(memory_size)
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.requests = 0
+        self.reads = 0
+        self.server = None
+
+    @property
+    def address(self) -> str:
+        assert self.server is not None, "not started"
+        host, port = next(iter(self.server.sockets)).getsockname()[:2]
+        return f"{host}:{port}"
+
+    async def start(self) -> None:
+        """Listens on a free local port, see address."""
+        self.server = await serve(self._serve, "127.0.0.1", 0, ping_interval=None)
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _serve(self, socket: WebSocketServerProtocol) -> None:
+        try:
+            async for message in socket:
+                request: dict[str, Any] = json.loads(message)
+                opcode = request["Opcode"]
+                operands: list[str] = request.get("Operands", [])
+                if opcode == "DeviceList":
+                    await socket.send(json.dumps({"Results": ["FakeDevice"]}))
+                elif opcode == "AppVersion":
+                    await socket.send(json.dumps({"Results": ["SNI fake"]}))
+                elif opcode == "GetAddress":
+                    self.requests += 1
+                    self.reads += len(operands) // 2
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    data = bytearray()
+                    for address, size in zip(operands[::2], operands[1::2]):
+                        data += self.memory[int(address, 16):int(address, 16) + int(size, 16)]
+                    for start in range(0, len(data), self.chunk_size):
+                        await socket.send(bytes(data[start:start + self.chunk_size]))
+                elif opcode == "PutAddress":
+                    self.requests += 1
+                    data = await socket.recv()
+                    address = int(operands[0], 16)
+                    self.memory[address:address + len(data)] = data
+                # Attach and everything else has no reply
+        except ConnectionClosed:
+            pass  # client went away
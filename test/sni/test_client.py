@@ -0,0 +1,69 @@
+import unittest
+
+from SNIClient import SNIContext, SNESMemorySnapshot, SNESState, merge_read_ranges, snes_connect, snes_disconnect, \
+    snes_get_address_max_ranges, snes_read, snes_read_ranges, snes_write
+
+from . import FakeSNI
+
+
+class TestReadRanges(unittest.TestCase):
+    def test_merge(self) -> None:
+        """Tests that overlapping and adjacent ranges are merged and sorted, and empty ones dropped."""
+        self.assertEqual(merge_read_ranges([(0x20, 4), (0x10, 4), (0x14, 2), (0x12, 1), (0x22, 8), (0x40, 0)]),
+                         [(0x10, 6), (0x20, 10)])
+
+    def test_snapshot(self) -> None:
+        """Tests that reads within a range are served from the snapshot and others are not."""
+        snapshot = SNESMemorySnapshot([(0x10, 4), (0x20, 2)], bytearray(b"abcdef"))
+        self.assertEqual(snapshot.read(0x11, 3), b"bcd")
+        self.assertEqual(snapshot.read(0x20, 2), b"ef")
+        self.assertIsNone(snapshot.read(0x0F, 2))
+        self.assertIsNone(snapshot.read(0x13, 2))
+        self.assertIsNone(snapshot.read(0x21, 2))
+
+
+class TestClient(unittest.IsolatedAsyncioTestCase):
+    sni: FakeSNI
+    ctx: SNIContext
+
+    async def asyncSetUp(self) -> None:
+        self.sni = FakeSNI(chunk_size=3)
+        self.sni.memory[:0x100] = bytes(range(0x100))
+        await self.sni.start()
+        self.addAsyncCleanup(self.sni.stop)
+        self.ctx = SNIContext(self.sni.address, None, None)
+        await snes_connect(self.ctx, self.sni.address)
+        self.assertEqual(self.ctx.snes_state, SNESState.SNES_ATTACHED)
+        self.addAsyncCleanup(self.disconnect)
+
+    async def disconnect(self) -> None:
+        self.ctx.snes_reconnect_address = None
+        await snes_disconnect(self.ctx)
+
+    async def test_read(self) -> None:
+        """Tests that a read is put together from several binary messages."""
+        self.assertEqual(await snes_read(self.ctx, 0x10, 8), bytes(range(0x10, 0x18)))
+        self.assertEqual(self.sni.requests, 1)
+
+    async def test_read_ranges(self) -> None:
+        """Tests that many ranges are read in as few requests as possible and then read from the snapshot."""
+        ranges = [(address, 2) for address in range(0, 0x80, 4)] + [(0x41, 2)]
+        snapshot = await snes_read_ranges(self.ctx, ranges)
+        assert snapshot is not None
+        self.assertEqual(self.sni.requests, -(-32 // snes_get_address_max_ranges))
+        self.assertEqual(self.sni.reads, 32)
+        for address, size in ranges:
+            self.assertEqual(snapshot.read(address, size), bytes(range(address, address + size)))
+
+        self.ctx.snes_memory_snapshot = snapshot
+        self.assertEqual(await snes_read(self.ctx, 0x40, 3), bytes(range(0x40, 0x43)))
+        self.assertEqual(self.sni.requests, 4)
+        self.assertEqual(await snes_read(self.ctx, 0x42, 4), bytes(range(0x42, 0x46)))
+        self.assertEqual(self.sni.requests, 5)
+
+    async def test_write_drops_snapshot(self) -> None:
+        """Tests that reads after a write see the written memory."""
+        self.ctx.snes_memory_snapshot = await snes_read_ranges(self.ctx, [(0x10, 4)])
+        self.assertTrue(await snes_write(self.ctx, [(0x10, b"\xff")]))
+        self.assertIsNone(self.ctx.snes_memory_snapshot)
+        self.assertEqual(await snes_read(self.ctx, 0x10, 2), b"\xff\x11")
@@ -0,0 +1,43 @@
+# Tests for the streaming zlib pickling in Utils.py
+
+import io
+import pickle
+import unittest
+import zlib
+
+from NetUtils import NetworkItem
+from Utils import ZlibReader, dump_compressed, load_compressed
+
+
+class TestCompressedPickle(unittest.TestCase):
+    data = {
+        "locations": {player: {address: NetworkItem(address, address + 1, player, 0) for address in range(2000)}
+                      for player in range(1, 4)},
+        "blob": bytes(range(256)) * 1000,
+        "names": [[f"Player{player}" for player in range(1, 100)]],
+    }
+
+    def test_same_as_zlib_compress(self) -> None:
+        """Tests that the stream can be read like the output of zlib.compress and the other way around."""
+        output = io.BytesIO()
+        dump_compressed(self.data, output, 6)
+        self.assertEqual(pickle.loads(zlib.decompress(output.getvalue())), self.data)
+        self.assertEqual(load_compressed(io.BytesIO(zlib.compress(pickle.dumps(self.data), 9))), self.data)
+
+    def test_followed_by_data(self) -> None:
+        """Tests that the file is left open and is not read beyond the stream more than one chunk."""
+        output = io.BytesIO()
+        output.write(b"\x03")
+        dump_compressed(self.data, output)
+        self.assertFalse(output.closed)
+        compressed_size = output.tell()
+        output.write(b"after")
+        output.seek(1)
+        self.assertEqual(load_compressed(output), self.data)
+        self.assertLessEqual(output.tell() - compressed_size, ZlibReader.chunk_size)
+
+    def test_truncated(self) -> None:
+        """Tests that a stream that was cut short is an error."""
+        data = zlib.compress(pickle.dumps(self.data))
+        with self.assertRaises(EOFError):
+            load_compressed(io.BytesIO(data[:len(data) // 2]))
@@ -0,0 +1,58 @@
+# Tests for the binary data package cache of clients in Utils.py
+
+import os
+import tempfile
+import unittest
+
+from Utils import DataPackageCache
+
+
+class TestDataPackageCache(unittest.TestCase):
+    data = {
+        "item_name_to_id": {"Sword": 1, "Épée": 2 ** 53, "Nothing": -1, "Duplicate": 1},
+        "location_name_to_id": {f"Location {code}": code for code in range(100, 0, -1)},
+        "item_name_groups": {"Weapons": ["Sword", "Épée"]},
+        "checksum": "0123abc",
+    }
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name, "datapackage", "datapackages.bin")
+
+    def test_round_trip(self) -> None:
+        """Tests that a stored data package is read back, also by another instance, and its names looked up."""
+        DataPackageCache(self.path).store({"Test Game": self.data})
+        cached = DataPackageCache(self.path).get("Test Game", "0123abc")
+        assert cached is not None
+        self.assertEqual(cached.item_names[2 ** 53], "Épée")
+        self.assertEqual(cached.item_names[1], "Duplicate")
+        self.assertNotIn(3, cached.item_names)
+        self.assertEqual(len(cached.location_names), 100)
+        self.assertEqual(cached.location_names[42], "Location 42")
+        self.assertEqual(list(cached.location_names), list(range(1, 101)))
+        # Sword has the same id as Duplicate, which is looked up
+        self.assertEqual(cached.to_dict(), dict(self.data, item_name_to_id={"Épée": 2 ** 53, "Nothing": -1,
+                                                                            "Duplicate": 1}))
+        self.assertIsNone(DataPackageCache(self.path).get("Test Game", "other"))
+
+    def test_checksums_per_game(self) -> None:
+        """Tests that storing keeps other games and drops the oldest checksums of a game."""
+        cache = DataPackageCache(self.path)
+        cache.store({"Other Game": self.data})
+        for version in range(DataPackageCache.max_checksums + 1):
+            cache.store({"Test Game": dict(self.data, checksum=f"v{version}")})
+        self.assertIsNotNone(cache.get("Other Game", "0123abc"))
+        self.assertIsNone(cache.get("Test Game", "v0"))
+        for version in range(1, DataPackageCache.max_checksums + 1):
+            self.assertIsNotNone(cache.get("Test Game", f"v{version}"))
+
+    def test_unreadable(self) -> None:
+        """Tests that a damaged file is treated as empty and replaced."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b"not a cache")
+        cache = DataPackageCache(self.path)
+        self.assertIsNone(cache.get("Test Game", "0123abc"))
+        cache.store({"Test Game": self.data})
+        self.assertIsNotNone(cache.get("Test Game", "0123abc"))
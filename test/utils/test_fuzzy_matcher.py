@@ -0,0 +1,36 @@
+# Tests for the indexed fuzzy name matching in Utils.py
+
+import random
+import unittest
+
+from Utils import FuzzyMatcher, _get_all_fuzzy_results, get_fuzzy_results, get_intended_text
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+    def test_same_as_all_results(self) -> None:
+        """Tests that the matcher finds the same names with the same scores in the same order as comparing against
+        every name, also for ties, duplicates and characters that combine into one."""
+        rng = random.Random(0)
+        alphabet = "abcAB İ̇́\r\nßʰ"
+        for _ in range(500):
+            words = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(rng.randint(1, 20))
+            ]
+            words.extend(rng.choices(words, k=2))
+            matcher = FuzzyMatcher(words)
+            input_word = rng.choice(words) if rng.random() < 0.3 else \
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+            for limit in (1, 2, 3, None):
+                with self.subTest(input_word=input_word, words=words, limit=limit):
+                    self.assertEqual(matcher.get_results(input_word, limit),
+                                     _get_all_fuzzy_results(input_word, words, limit))
+
+    def test_intended_text(self) -> None:
+        """Tests that names are looked up the same through a matcher as through the collection."""
+        names = {"Progressive Sword", "Progressive Shield", "Hookshot", "Hammer", "Bow", "Silver Arrows"}
+        matcher = FuzzyMatcher(names)
+        self.assertIs(matcher.names, names)
+        for input_text in ("progressive sword", "Progresive Shield", "hook", "Bow", "Arrows", "Progressive"):
+            with self.subTest(input_text=input_text):
+                self.assertEqual(get_intended_text(input_text, matcher), get_intended_text(input_text, names))
+                self.assertEqual(get_fuzzy_results(input_text, matcher, 2), get_fuzzy_results(input_text, names, 2))
@@ -0,0 +1,71 @@
+import typing
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from . import TestBase
+
+
+class FakeHoster:
+    def __init__(self) -> None:
+        self.started: typing.List[UUID] = []
+        self.shut_down: typing.List[UUID] = []
+
+    def start_room(self, room_id: UUID) -> None:
+        self.started.append(room_id)
+
+    def get_rooms_shut_down(self) -> typing.List[UUID]:
+        rooms, self.shut_down = self.shut_down, []
+        return rooms
+
+
+class TestRoomScheduler(TestBase):
+    def setUp(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import Room, Seed
+
+        super().setUp()
+        owner = uuid4()
+        with db_session:
+            seed = Seed(multidata=b"", owner=owner)
+            now = datetime.utcnow()
+            self.active_room = Room(seed=seed, owner=owner, last_activity=now).id
+            self.timed_out_room = Room(seed=seed, owner=owner, last_activity=now - timedelta(hours=3)).id
+            self.seed = seed.id
+
+    def tearDown(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import Seed
+
+        with db_session:
+            seed = Seed.get(id=self.seed)
+            for room in seed.rooms:
+                room.delete()
+            seed.delete()
+
+    def test_start_active_rooms_once(self) -> None:
+        """Verify that rooms get handed to a hoster once per activation, and again after shutting down if active."""
+        from pony.orm import db_session
+        from WebHostLib.autolauncher import RoomScheduler
+        from WebHostLib.models import Room
+
+        hoster = FakeHoster()
+        scheduler = RoomScheduler([hoster])  # type: ignore
+        scheduler.tick()
+        self.assertIn(self.active_room, hoster.started)
+        self.assertNotIn(self.timed_out_room, hoster.started)
+
+        hoster.started.clear()
+        scheduler.tick()
+        self.assertEqual(hoster.started, [])
+
+        with db_session:
+            Room.get(id=self.timed_out_room).last_activity = datetime.utcnow()
+        scheduler.tick()
+        self.assertEqual(hoster.started, [self.timed_out_room])
+
+        # a room that finished shutting down gets handed out again while it is still active
+        hoster.started.clear()
+        hoster.shut_down.append(self.active_room)
+        scheduler.tick()
+        self.assertEqual(hoster.started, [self.active_room])
+        self.assertEqual(scheduler.ticks, 4)
@@ -191,3 +191,41 @@ class TestHostFakeRoom(TestBase):
         with db_session:
             commands = select(command for command in Command if command.room.id == self.room_id)  # type: ignore
             self.assertNotIn("/help", (command.commandtext for command in commands))
+
+    def test_command_dispatcher(self) -> None:
+        """Verify queued commands get handed to the loop of their room, in order, and only once."""
+        import asyncio
+        import logging
+        from types import SimpleNamespace
+        from pony.orm import db_session, select
+        from WebHostLib.customserver import CommandDispatcher
+        from WebHostLib.models import Command, Room
+
+        class Loop:
+            def __init__(self) -> None:
+                self.calls = []
+
+            def call_soon_threadsafe(self, callback, *args) -> None:
+                self.calls.append(args)
+
+        ctx = SimpleNamespace(room_id=self.room_id, exit_event=asyncio.Event(), main_loop=Loop(),
+                              logger=logging.getLogger("Command Dispatcher"))
+        other_room_id = uuid4()
+        with db_session:
+            Command(room=Room.get(id=self.room_id), commandtext="/help")
+            Command(room=Room.get(id=self.room_id), commandtext="/players")
+            other_room = Room(seed=Room.get(id=self.room_id).seed, owner=uuid4(), id=other_room_id)
+            Command(room=other_room, commandtext="/exit")
+
+        dispatcher = CommandDispatcher()
+        dispatcher.register(ctx)  # type: ignore
+        self.assertEqual(dispatcher.dispatch(), 2)
+        self.assertEqual(ctx.main_loop.calls, [("/help",), ("/players",)])
+        self.assertEqual(dispatcher.dispatch(), 0)
+
+        with db_session:
+            commands = select(command for command in Command)  # type: ignore
+            self.assertEqual([command.commandtext for command in commands], ["/exit"])
+            for command in commands:
+                command.delete()
+            Room.get(id=other_room_id).delete()
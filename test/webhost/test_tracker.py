@@ -1,5 +1,6 @@
 import os
 import pickle
+import unittest
 from pathlib import Path
 from typing import ClassVar
 from uuid import UUID, uuid4
@@ -93,3 +94,64 @@ class TestTracker(TestBase):
                 headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00"},  # missing timezone
             )
             self.assertEqual(response.status_code, 400)
+
+
+class TestTrackerDataCache(TestBase):
+    def test_multisave_follows_saves(self) -> None:
+        """Verify that static data is reused between requests and the multisave is reloaded after every save, also
+        ones that leave last_activity as it was, like the save on room shutdown."""
+        import zlib
+        from pony.orm import db_session
+        from WebHostLib.models import GameDataPackage, Room, Seed
+        from WebHostLib.tracker import TrackerData
+
+        game_data = {"checksum": "tracker_cache_test", "item_name_to_id": {"Item": 1}, "location_name_to_id": {}}
+        multidata = {"seed_name": "0", "slot_info": {}, "datapackage": {"Game": {"checksum": game_data["checksum"]}}}
+        owner = uuid4()
+        with db_session:
+            if not GameDataPackage.get(checksum=game_data["checksum"]):
+                GameDataPackage(checksum=game_data["checksum"], data=pickle.dumps(game_data))
+            seed = Seed(multidata=bytes([3]) + zlib.compress(pickle.dumps(multidata)), owner=owner)
+            room = Room(seed=seed, owner=owner, multisave=pickle.dumps({"client_game_state": {(0, 1): 10}}))
+            room_id = room.id
+
+        with db_session:
+            first = TrackerData(Room.get(id=room_id))
+        with db_session:
+            second = TrackerData(Room.get(id=room_id))
+        self.assertIs(first._multidata, second._multidata)
+        self.assertIs(first._multisave, second._multisave)
+        self.assertIs(first.item_id_to_name["Game"], second.item_id_to_name["Game"])
+        self.assertEqual(second.item_id_to_name["Game"][1], "Item")
+
+        with db_session:
+            room = Room.get(id=room_id)
+            room.multisave = pickle.dumps({"client_game_state": {(0, 1): 30}})
+        with db_session:
+            third = TrackerData(Room.get(id=room_id))
+        self.assertIs(first._multidata, third._multidata)
+        self.assertEqual(third.get_player_client_status(0, 1), 30)
+
+        with db_session:
+            room = Room.get(id=room_id)
+            room.seed.delete()
+            room.delete()
+
+
+class TestTrackerCache(unittest.TestCase):
+    def test_cache_size(self) -> None:
+        """Verify that the least recently used entries are evicted once the entries are larger than the cache."""
+        from WebHostLib.tracker import _LRUCache
+
+        cache = _LRUCache(10)
+        cache.set("a", 1, 4)
+        cache.set("b", 2, 4)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3, 4)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c"), cache.size), (1, 3, 8))
+        cache.set("a", 4, 2)
+        self.assertEqual((cache.get("a"), cache.size), (4, 6))
+        cache.set("d", 5, 11)
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(len(cache), 2)
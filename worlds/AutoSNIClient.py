@@ -84,6 +84,12 @@ class SNIClient(abc.ABC, metaclass=AutoSNIClientRegister):
         """ TODO: interface documentation here """
         ...
 
+    def get_read_ranges(self, ctx: SNIContext) -> Iterable[Tuple[int, int]]:
+        """ override this with the (address, size) ranges that game_watcher reads every time it runs,
+        they are then read before it in as few requests as possible and snes_read answers from them until it ends
+        or writes """
+        return ()
+
     async def deathlink_kill_player(self, ctx: SNIContext) -> None:
         """ override this with implementation to kill player """
         pass
@@ -11,8 +11,9 @@ from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Ma
                     TYPE_CHECKING, Type, Union)
 
 from Options import item_and_loc_options, ItemsAccessibility, OptionGroup, PerGameCommonOptions
-from BaseClasses import CollectionState
+from BaseClasses import CollectionState, RuleDependencies
 from Utils import deprecate
+import Profiling
 
 if TYPE_CHECKING:
     from BaseClasses import MultiWorld, Item, Location, Tutorial, Region, Entrance
@@ -162,9 +163,18 @@ class WebWorldRegister(type):
 
 def _timed_call(method: Callable[..., Any], *args: Any,
                 multiworld: Optional["MultiWorld"] = None, player: Optional[int] = None) -> Any:
+    profile = Profiling.current
     start = time.perf_counter()
+    if profile:
+        start_cpu = time.thread_time()
     ret = method(*args)
     taken = time.perf_counter() - start
+    if profile:
+        if player and multiworld:
+            game = multiworld.game[player]
+        else:
+            game = getattr(method.__self__, "game", "")
+        profile.record_call(method.__name__, game, player, taken, time.thread_time() - start_cpu)
     if taken > 1.0:
         if player and multiworld:
             perf_logger.info(f"Took {taken:.4f} seconds in {method.__qualname__} for player {player}, "
@@ -329,6 +339,23 @@ class World(metaclass=AutoWorldRegister):
     If False, everything is rechecked at every step, which is slower computationally, 
     but may be desirable in complex/dynamic worlds."""
 
+    incremental_fill: bool = True
+    """If True, fill keeps its assumed state up to date by removing this world's items from it with remove().
+    This requires remove() to exactly undo collect(), including any caches the world keeps on CollectionState.
+    If False, that state is rebuilt from scratch whenever an item of this world has to be removed from it."""
+
+    track_rule_dependencies: bool = False
+    """If True, CollectionState records which item names and regions the access rules of this world's entrances and
+    locations read. After collecting items, update_reachable_regions only rechecks the blocked entrances and
+    sweep_for_advancements only the remaining locations that read a changed item name or a newly reachable region.
+    This requires these rules to only depend on this player's prog_items, read by item name through state.has() and
+    friends, prog_items[player][name], .get(name) or `name in`, and on the reachability of this player's regions.
+    Reads by iterating prog_items, such as .items() or .total(), and reads of other players are not recorded.
+    Indirect conditions are not needed then."""
+
+    rule_dependencies: Optional[RuleDependencies] = None
+    """autoset on creation if track_rule_dependencies is True."""
+
     multiworld: "MultiWorld"
     """autoset on creation. The MultiWorld object for the currently generating multiworld."""
     player: int
@@ -363,6 +390,8 @@ class World(metaclass=AutoWorldRegister):
         self.player = player
         self.random = Random(multiworld.random.getrandbits(64))
         multiworld.per_slot_randoms[player] = self.random
+        if self.track_rule_dependencies:
+            self.rule_dependencies = RuleDependencies()
 
     def __getattr__(self, item: str) -> Any:
         if item == "settings":
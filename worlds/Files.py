@@ -5,6 +5,7 @@ import json
 import zipfile
 from enum import IntEnum
 import os
+import struct
 import threading
 from io import BytesIO
 
@@ -326,6 +327,13 @@ class APTokenTypes(IntEnum):
     XOR_8 = 5
 
 
+_token_count = struct.Struct("<I")
+_token_header = struct.Struct("<BII")
+"""token type, offset and size of the token's data"""
+_token_range = struct.Struct("<II")
+"""length and source offset or value of a COPY or RLE token"""
+
+
 class APTokenMixin:
     """
     A class that defines functions for generating a token binary, for use in patches.
@@ -418,33 +426,34 @@ class APPatchExtension(metaclass=AutoPatchExtensionRegister):
     @staticmethod
     def apply_tokens(caller: APProcedurePatch, rom: bytes, token_file: str) -> bytes:
         """Applies the given token file from the patch onto the current file."""
-        token_data = caller.get_file(token_file)
+        token_data = memoryview(caller.get_file(token_file))
         rom_data = bytearray(rom)
-        token_count = int.from_bytes(token_data[0:4], "little")
+        read_header = _token_header.unpack_from
+        read_range = _token_range.unpack_from
+        write, copy = APTokenTypes.WRITE.value, APTokenTypes.COPY.value
+        and_8, or_8, xor_8 = APTokenTypes.AND_8.value, APTokenTypes.OR_8.value, APTokenTypes.XOR_8.value
+        token_count, = _token_count.unpack_from(token_data)
         bpr = 4
         for _ in range(token_count):
-            token_type = token_data[bpr:bpr + 1][0]
-            offset = int.from_bytes(token_data[bpr + 1:bpr + 5], "little")
-            size = int.from_bytes(token_data[bpr + 5:bpr + 9], "little")
-            data = token_data[bpr + 9:bpr + 9 + size]
-            if token_type in [APTokenTypes.AND_8, APTokenTypes.OR_8, APTokenTypes.XOR_8]:
-                arg = data[0]
-                if token_type == APTokenTypes.AND_8:
-                    rom_data[offset] = rom_data[offset] & arg
-                elif token_type == APTokenTypes.OR_8:
-                    rom_data[offset] = rom_data[offset] | arg
+            token_type, offset, size = read_header(token_data, bpr)
+            bpr += 9
+            if token_type == write or token_type > xor_8:
+                data = token_data[bpr:bpr + size]
+                rom_data[offset:offset + len(data)] = data
+            elif token_type >= and_8:
+                if token_type == and_8:
+                    rom_data[offset] &= token_data[bpr]
+                elif token_type == or_8:
+                    rom_data[offset] |= token_data[bpr]
                 else:
-                    rom_data[offset] = rom_data[offset] ^ arg
-            elif token_type in [APTokenTypes.COPY, APTokenTypes.RLE]:
-                length = int.from_bytes(data[:4], "little")
-                value = int.from_bytes(data[4:], "little")
-                if token_type == APTokenTypes.COPY:
+                    rom_data[offset] ^= token_data[bpr]
+            else:
+                length, value = read_range(token_data, bpr)
+                if token_type == copy:
                     rom_data[offset: offset + length] = rom_data[value: value + length]
                 else:
-                    rom_data[offset: offset + length] = bytes([value] * length)
-            else:
-                rom_data[offset:offset + len(data)] = data
-            bpr += 9 + size
+                    rom_data[offset: offset + length] = bytes((value,)) * length
+            bpr += size
         return bytes(rom_data)
 
     @staticmethod
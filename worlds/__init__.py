@@ -1,15 +1,19 @@
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import sys
+import threading
 import warnings
 import zipimport
 import time
 import dataclasses
-from typing import Dict, List, TypedDict
+import hashlib
+import pickle
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Type, TypedDict
 
-from Utils import local_path, user_path
+from Utils import __version__, cache_path, local_path, user_path
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -27,11 +31,22 @@ __all__ = {
     "GamesPackage",
     "DataPackage",
     "failed_world_loads",
+    "lazy_loading",
+    "load_all_worlds",
+    "loaded_world_types",
+    "get_hint_blacklist",
 }
 
 
 failed_world_loads: List[str] = []
 
+lazy_loading: bool = os.environ.get("MULTIWORLDGG_LAZY_WORLDS", "0") == "1"
+"""
+Import a world only once its game is looked up in AutoWorldRegister.world_types or network_data_package, and all of
+them once either of them is iterated over. Enabled by setting the environment variable MULTIWORLDGG_LAZY_WORLDS to 1
+before importing worlds, which Generate and MultiServer do unless it is set to 0.
+"""
+
 
 class GamesPackage(TypedDict, total=False):
     item_name_groups: Dict[str, List[str]]
@@ -51,6 +66,7 @@ class WorldSource:
     is_zip: bool = False
     relative: bool = True  # relative to regular world import folder
     time_taken: float = -1.0
+    load_attempted: bool = dataclasses.field(default=False, compare=False)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path}, is_zip={self.is_zip}, relative={self.relative})"
@@ -61,7 +77,27 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @property
+    def module_name(self) -> str:
+        return os.path.basename(self.path).rsplit(".", 1)[0]
+
+    def get_fingerprint(self) -> List[int]:
+        """Modification times and sizes that change along with the world, to tell if data cached for it is current."""
+        path = self.resolved_path
+        stat = os.stat(path)
+        if self.is_zip:
+            return [stat.st_mtime_ns, stat.st_size]
+        # editing a file does not change the modification time of its folder, and data files may be in subfolders
+        newest = files_count = 0
+        for folder, folder_names, file_names in os.walk(path):
+            folder_names[:] = [name for name in folder_names if name != "__pycache__"]
+            for name in file_names:
+                newest = max(newest, os.stat(os.path.join(folder, name)).st_mtime_ns)
+            files_count += len(file_names)
+        return [stat.st_mtime_ns, newest, files_count]
+
     def load(self) -> bool:
+        self.load_attempted = True
         try:
             start = time.perf_counter()
             if self.is_zip:
@@ -93,10 +129,131 @@ class WorldSource:
             traceback.print_exc(file=file_like)
             file_like.seek(0)
             logging.exception(file_like.read())
-            failed_world_loads.append(os.path.basename(self.path).rsplit(".", 1)[0])
+            failed_world_loads.append(self.module_name)
             return False
 
 
+class WorldManifest:
+    """
+    Index of the games each world source registers, cached on disk and keyed on the sources' modification times, so
+    that lazy loading only has to import the world of a game that is looked up.
+    """
+    version = 1
+
+    path: str
+    sources: Dict[str, Dict[str, Any]]
+    """
+    {"fingerprint": WorldSource.get_fingerprint(), "games": {game: {"world": "module.WorldClass", "settings_key": str}}}
+    by resolved path of the world source, where settings_key is None for worlds without settings, and with
+    "failed": True for sources that could not be loaded, so lazy loading only retries them once their files change
+    """
+    changed: bool
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sources = {}
+        self.changed = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] == self.version:
+                self.sources = data["sources"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # missing or unusable, gets rebuilt while loading worlds
+
+    def get_games(self, source: WorldSource) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+        """Returns the games of source, or None if it is not indexed for its current files."""
+        entry = self.sources.get(source.resolved_path, None)
+        if entry is None or entry["fingerprint"] != source.get_fingerprint():
+            return None
+        return entry["games"]
+
+    def failed(self, source: WorldSource) -> bool:
+        """Returns if source could not be loaded, for the files it is indexed for."""
+        return self.sources.get(source.resolved_path, {}).get("failed", False)
+
+    def record(self, source: WorldSource, games: Dict[str, Dict[str, Optional[str]]], failed: bool = False) -> None:
+        entry: Dict[str, Any] = {"fingerprint": source.get_fingerprint(), "games": games}
+        if failed:
+            entry["failed"] = True
+        if self.sources.get(source.resolved_path, None) != entry:
+            self.sources[source.resolved_path] = entry
+            self.changed = True
+
+    def save(self) -> None:
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "sources": self.sources}, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logging.debug(f"Could not write world manifest: {e}")
+        else:
+            self.changed = False
+
+
+class DataPackageStore:
+    """
+    Data packages, with their checksums, and hint blacklists of the games of each world source, pickled to disk and
+    keyed on the sources' files and the program version, so that processes with lazy loading can get them without
+    importing the worlds.
+    """
+    version = 1
+
+    folder: str
+    sources: Dict[str, Optional[Dict[str, Dict[str, Any]]]]
+    """
+    {game: {"data_package": GamesPackage, "hint_blacklist": [name, ...]}} by resolved path of the world source,
+    None if it is not stored for its current files
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.sources = {}
+
+    def _get_prefix(self, source: WorldSource) -> str:
+        return f"{source.module_name}_{hashlib.sha1(source.resolved_path.encode()).hexdigest()[:8]}_"
+
+    def _get_path(self, source: WorldSource) -> str:
+        # the file name changes along with the source, so a stale file does not have to be read to be skipped
+        key = json.dumps([self.version, __version__, source.get_fingerprint()])
+        return os.path.join(self.folder, f"{self._get_prefix(source)}{hashlib.sha1(key.encode()).hexdigest()}.pickle")
+
+    def is_stored(self, source: WorldSource) -> bool:
+        return self.sources.get(source.resolved_path, None) is not None or os.path.isfile(self._get_path(source))
+
+    def get(self, source: WorldSource) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Returns the game data of source, or None if it is not stored for its current files."""
+        if self.sources.get(source.resolved_path, None) is None:
+            try:
+                with open(self._get_path(source), "rb") as f:
+                    self.sources[source.resolved_path] = pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:  # unusable, gets rebuilt from the world
+                logging.debug(f"Could not read stored data packages of {source}: {e}")
+        return self.sources.get(source.resolved_path, None)
+
+    def store(self, source: WorldSource, games: Dict[str, Dict[str, Any]]) -> None:
+        self.sources[source.resolved_path] = games
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            path = self._get_path(source)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(games, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            prefix = self._get_prefix(source)
+            for entry in os.scandir(self.folder):
+                if entry.name.startswith(prefix) and entry.path != path and entry.name.endswith(".pickle"):
+                    os.remove(entry.path)
+        except OSError as e:
+            logging.debug(f"Could not store data packages of {source}: {e}")
+
+
 # find potential world containers, currently folders and zip-importable .apworld's
 world_sources: List[WorldSource] = []
 for folder in (folder for folder in (user_folder, local_folder) if folder):
@@ -115,15 +272,244 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
-# import all submodules to trigger AutoWorldRegister
 world_sources.sort()
-for world_source in world_sources:
-    world_source.load()
 
-# Build the data package for each game.
-from .AutoWorld import AutoWorldRegister
+from .AutoWorld import AutoWorldRegister, World
 
-network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
-}
+world_manifest = WorldManifest(cache_path("world_manifest.json"))
+data_package_store = DataPackageStore(cache_path("world_data_packages"))
+_game_sources: Dict[str, WorldSource] = {}
+"""world source by game, for the sources that are indexed in the manifest for their current files"""
+_unindexed_sources: List[WorldSource] = []
+_manifest_settings_names: Dict[str, str] = {}
+"""settings_key to "module.WorldClass" of worlds with settings, for the sources that are indexed in the manifest"""
+_load_lock = threading.RLock()
+_loading = False
+
+
+def _get_game_info(world: Type[World]) -> Dict[str, Optional[str]]:
+    annotation = world.__annotations__.get("settings", None)
+    has_settings = annotation is not None and annotation != "ClassVar[Optional['Group']]"
+    return {"world": f"{world.__module__}.{world.__name__}", "settings_key": world.settings_key if has_settings else None}
+
+
+def _load_sources(sources: Iterable[WorldSource]) -> None:
+    """Import sources that were not attempted yet, and with lazy loading index the games they register in the
+    manifest."""
+    global _loading
+    with _load_lock:
+        sources = [source for source in sources if not source.load_attempted]
+        if not sources:
+            return
+        _loading = True
+        try:
+            for source in sources:
+                source.load()
+        finally:
+            _loading = False
+        if not lazy_loading:
+            # only read with lazy loading, so other processes do not walk the world folders to index them
+            return
+
+        sources_by_module: Dict[str, WorldSource] = {}
+        for source in world_sources:
+            if source.load_attempted and source.module_name not in failed_world_loads:
+                sources_by_module.setdefault(source.module_name, source)
+        games: Dict[str, Dict[str, Dict[str, Optional[str]]]] = {}
+        for game, world in dict.items(AutoWorldRegister.world_types):
+            module_path = world.__module__.split(".")
+            if len(module_path) > 1 and module_path[0] == "worlds" and module_path[1] in sources_by_module:
+                games.setdefault(module_path[1], {})[game] = _get_game_info(world)
+        for source in sources:
+            if source.module_name in failed_world_loads:
+                world_manifest.record(source, {}, failed=True)
+        for module_name, source in sources_by_module.items():
+            source_games = games.get(module_name, {})
+            # worlds can also get imported by other worlds, after their source was indexed
+            if source in sources or world_manifest.sources.get(source.resolved_path, {}).get("games") != source_games:
+                world_manifest.record(source, source_games)
+            for game in source_games:
+                _game_sources.setdefault(game, source)
+        world_manifest.save()
+
+
+def _load_world(game: str) -> bool:
+    """Import the world of game if it exists and was not imported yet. Returns if the game is registered."""
+    with _load_lock:
+        if _loading or dict.__contains__(AutoWorldRegister.world_types, game):
+            return dict.__contains__(AutoWorldRegister.world_types, game)
+        if game in _game_sources:
+            _load_sources((_game_sources[game],))
+        if not dict.__contains__(AutoWorldRegister.world_types, game):
+            # it may be in a world that is new or changed since the manifest was written
+            _load_sources(_unindexed_sources)
+        return dict.__contains__(AutoWorldRegister.world_types, game)
+
+
+def load_all_worlds() -> None:
+    """Import all worlds that were not imported yet."""
+    _load_sources(world_sources)
+
+
+def load_world_module(module_name: str) -> None:
+    """Import the world of a module like worlds.alttp.Options, which for .apworld files only works through their
+    world source."""
+    module_path = module_name.split(".")
+    for source in world_sources:
+        if module_path[:2] == ["worlds", source.module_name]:
+            _load_sources((source,))
+            return
+
+
+def loaded_world_types() -> Dict[str, Type[World]]:
+    """Returns the world types that are registered so far, without importing any more worlds."""
+    return dict(dict.items(AutoWorldRegister.world_types))
+
+
+def get_world_settings_names() -> Dict[str, str]:
+    """Returns settings_key to "module.WorldClass" for all worlds that have settings. With lazy loading, only the worlds
+    that are not indexed in the manifest get imported for this."""
+    if lazy_loading:
+        _load_sources(_unindexed_sources)
+        settings_names = _manifest_settings_names.copy()
+        for source in _unindexed_sources:
+            for info in world_manifest.sources.get(source.resolved_path, {}).get("games", {}).values():
+                if info["settings_key"]:
+                    settings_names[info["settings_key"]] = info["world"]
+        return settings_names
+    load_all_worlds()
+    return {info["settings_key"]: info["world"]
+            for info in map(_get_game_info, AutoWorldRegister.world_types.values()) if info["settings_key"]}
+
+
+def _get_world_game_data(world: Type[World]) -> Dict[str, Any]:
+    return {"data_package": world.get_data_package_data(), "hint_blacklist": list(world.hint_blacklist)}
+
+
+def _get_game_data(game: str) -> Optional[Dict[str, Any]]:
+    """Returns the data package and hint blacklist of game from its world if it is imported, or else from the data
+    package store if possible. Returns None if there is no such game."""
+    source = _game_sources.get(game, None)
+    if source is not None and not dict.__contains__(AutoWorldRegister.world_types, game):
+        games = data_package_store.get(source)
+        if games is not None and game in games:
+            return games[game]
+    if game not in AutoWorldRegister.world_types:
+        return None
+    # some worlds build their data package in a different order in each process, so an imported world is preferred
+    game_data = _get_world_game_data(AutoWorldRegister.world_types[game])
+    source = _game_sources.get(game, None)
+    if source is not None and not data_package_store.is_stored(source):
+        data_package_store.store(source, {
+            source_game: game_data if source_game == game else
+            _get_world_game_data(dict.__getitem__(AutoWorldRegister.world_types, source_game))
+            for source_game, game_source in _game_sources.items()
+            if game_source is source and dict.__contains__(AutoWorldRegister.world_types, source_game)
+        })
+    return game_data
+
+
+def get_hint_blacklist(game: str) -> FrozenSet[str]:
+    """Returns the names that can't be hinted for in game, without importing its world if its data is stored."""
+    if dict.__contains__(AutoWorldRegister.world_types, game):
+        return frozenset(dict.__getitem__(AutoWorldRegister.world_types, game).hint_blacklist)
+    game_data = _get_game_data(game)
+    if game_data is None:
+        raise KeyError(game)
+    return frozenset(game_data["hint_blacklist"])
+
+
+class _LazyDict(dict):
+    """dict that loads missing keys when they are looked up, and all keys before it is iterated over"""
+    _all_loaded: bool = False
+
+    def _load_key(self, key: Any) -> bool:
+        """Load key if it exists, returns if it is in the dict now."""
+        raise NotImplementedError
+
+    def _load_all(self) -> None:
+        raise NotImplementedError
+
+    def _ensure_all_loaded(self) -> None:
+        if not self._all_loaded:
+            self._load_all()
+            self._all_loaded = True
+
+    def __missing__(self, key: Any) -> Any:
+        if self._load_key(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or self._load_key(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        self._ensure_all_loaded()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._ensure_all_loaded()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._ensure_all_loaded()
+        return dict.keys(self)
+
+    def values(self):
+        self._ensure_all_loaded()
+        return dict.values(self)
+
+    def items(self):
+        self._ensure_all_loaded()
+        return dict.items(self)
+
+
+class _LazyWorldTypes(_LazyDict):
+    def _load_key(self, key: Any) -> bool:
+        return isinstance(key, str) and _load_world(key)
+
+    def _load_all(self) -> None:
+        load_all_worlds()
+
+
+class _LazyGamesPackage(_LazyDict):
+    def _load_key(self, key: Any) -> bool:
+        game_data = _get_game_data(key) if isinstance(key, str) else None
+        if game_data is None:
+            return False
+        dict.__setitem__(self, key, game_data["data_package"])
+        return True
+
+    def _load_all(self) -> None:
+        for world_name in AutoWorldRegister.world_types:
+            if not dict.__contains__(self, world_name):
+                dict.__setitem__(self, world_name, _get_game_data(world_name)["data_package"])
+
+
+network_data_package: DataPackage
+if lazy_loading:
+    for world_source in world_sources:
+        games = world_manifest.get_games(world_source)
+        if games is None:
+            _unindexed_sources.append(world_source)
+        elif world_manifest.failed(world_source):
+            failed_world_loads.append(world_source.module_name)
+        else:
+            for game, info in games.items():
+                _game_sources.setdefault(game, world_source)
+                if info["settings_key"]:
+                    _manifest_settings_names[info["settings_key"]] = info["world"]
+    AutoWorldRegister.world_types = _LazyWorldTypes(AutoWorldRegister.world_types)
+    network_data_package = {"games": _LazyGamesPackage()}
+else:
+    # import all submodules to trigger AutoWorldRegister
+    load_all_worlds()
 
+    # Build the data package for each game.
+    network_data_package = {
+        "games": {world_name: world.get_data_package_data()
+                  for world_name, world in AutoWorldRegister.world_types.items()},
+    }
@@ -15,6 +15,9 @@ from typing import Any, Sequence
 
 BIZHAWK_SOCKET_PORT_RANGE_START = 43055
 BIZHAWK_SOCKET_PORT_RANGE_SIZE = 5
+PIPELINED_SCRIPT_VERSION = 2
+"""The first connector script version that tags request lists with an id, answers every request list that arrived in a
+frame and can send read results as raw bytes"""
 
 
 class ConnectionStatus(enum.IntEnum):
@@ -46,14 +49,42 @@ class SyncError(Exception):
 class BizHawkContext:
     streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None
     connection_status: ConnectionStatus
+    script_version: int | None
+    """The version of the connected connector script, set by `get_script_version`"""
+    binary_reads: bool
+    """Whether connector scripts that support it should send read results as raw bytes instead of base64"""
     _lock: asyncio.Lock
     _port: int | None
+    _pending: dict[int, asyncio.Future[list[dict[str, Any]]]]
+    _next_request_id: int
+    _receive_task: asyncio.Task[None] | None
 
     def __init__(self) -> None:
         self.streams = None
         self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self.script_version = None
+        self.binary_reads = True
         self._lock = asyncio.Lock()
         self._port = None
+        self._pending = {}
+        self._next_request_id = 0
+        self._receive_task = None
+
+    def _close(self, reason: str = "Connection closed") -> None:
+        """Closes the connection and fails any requests still waiting for a response."""
+        if self.streams is not None:
+            self.streams[1].close()
+            self.streams = None
+        self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self.script_version = None
+
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            self._receive_task = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RequestFailedError(reason))
+        self._pending.clear()
 
     async def _send_message(self, message: str):
         async with self._lock:
@@ -68,9 +99,7 @@ class BizHawkContext:
                 res = await asyncio.wait_for(reader.readline(), timeout=5)
 
                 if res == b"":
-                    writer.close()
-                    self.streams = None
-                    self.connection_status = ConnectionStatus.NOT_CONNECTED
+                    self._close()
                     raise RequestFailedError("Connection closed")
 
                 if self.connection_status == ConnectionStatus.TENTATIVE:
@@ -78,16 +107,80 @@ class BizHawkContext:
 
                 return res.decode("utf-8")
             except asyncio.TimeoutError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
+                self._close("Connection timed out")
                 raise RequestFailedError("Connection timed out") from exc
             except ConnectionResetError as exc:
-                writer.close()
-                self.streams = None
-                self.connection_status = ConnectionStatus.NOT_CONNECTED
+                self._close("Connection reset")
                 raise RequestFailedError("Connection reset") from exc
 
+    async def _send_request_list(self, req_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Sends a list of requests and waits for its responses.
+
+        Connector scripts older than `PIPELINED_SCRIPT_VERSION` get one request list at a time. Newer ones get an id
+        with each list so that any number of lists can be waiting for their responses at once."""
+        if self.script_version is None or self.script_version < PIPELINED_SCRIPT_VERSION:
+            return json.loads(await self._send_message(json.dumps(req_list)))
+
+        if self.streams is None:
+            raise NotConnectedError("You tried to send a request before a connection to BizHawk was made")
+
+        reader, writer = self.streams
+        if self._receive_task is None:
+            self._receive_task = asyncio.create_task(self._receive_responses(reader), name="BizHawkReceive")
+
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            message = {"id": request_id, "binary": self.binary_reads, "requests": req_list}
+            writer.write(json.dumps(message).encode("utf-8") + b"\n")
+            async with self._lock:
+                await asyncio.wait_for(writer.drain(), timeout=5)
+
+            return await asyncio.wait_for(future, timeout=5)
+        except asyncio.TimeoutError as exc:
+            self._close("Connection timed out")
+            raise RequestFailedError("Connection timed out") from exc
+        except ConnectionResetError as exc:
+            self._close("Connection reset")
+            raise RequestFailedError("Connection reset") from exc
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _receive_responses(self, reader: asyncio.StreamReader) -> None:
+        """Hands each response list from the connector script to the request list with the same id."""
+        try:
+            while True:
+                line = await reader.readline()
+                if line == b"":
+                    break
+
+                message = json.loads(line)
+                responses: list[dict[str, Any]] = message["responses"]
+                # raw read results follow the line in the order of their responses
+                for response in responses:
+                    if response["type"] == "READ_RESPONSE" and "size" in response:
+                        response["value"] = await reader.readexactly(response.pop("size"))
+
+                if self.connection_status == ConnectionStatus.TENTATIVE:
+                    self.connection_status = ConnectionStatus.CONNECTED
+
+                future = self._pending.get(message["id"])
+                if future is not None and not future.done():
+                    future.set_result(responses)
+        except asyncio.IncompleteReadError:
+            reason = "Connection closed"
+        except ConnectionResetError:
+            reason = "Connection reset"
+        except (KeyError, ValueError):
+            reason = "Received an invalid response"
+        else:
+            reason = "Connection closed"
+        if self._receive_task is asyncio.current_task():
+            self._receive_task = None
+            self._close(reason)
+
 
 async def connect(ctx: BizHawkContext) -> bool:
     """Attempts to establish a connection with a connector script. Returns True if successful."""
@@ -99,6 +192,7 @@ async def connect(ctx: BizHawkContext) -> bool:
         try:
             ctx.streams = await asyncio.open_connection("127.0.0.1", port)
             ctx.connection_status = ConnectionStatus.TENTATIVE
+            ctx.script_version = None
             ctx._port = port
             return True
         except (TimeoutError, ConnectionRefusedError):
@@ -112,21 +206,23 @@ async def connect(ctx: BizHawkContext) -> bool:
 
 def disconnect(ctx: BizHawkContext) -> None:
     """Closes the connection to the connector script."""
-    if ctx.streams is not None:
-        ctx.streams[1].close()
-        ctx.streams = None
-    ctx.connection_status = ConnectionStatus.NOT_CONNECTED
+    ctx._close()
 
 
 async def get_script_version(ctx: BizHawkContext) -> int:
-    return int(await ctx._send_message("VERSION"))
+    """Gets the version of the connector script. Requests sent afterward use every feature that version supports, so
+    this should be called once, right after connecting."""
+    ctx.script_version = int(await ctx._send_message("VERSION"))
+    return ctx.script_version
 
 
 async def send_requests(ctx: BizHawkContext, req_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Sends a list of requests to the BizHawk connector and returns their responses.
 
+    Request lists sent concurrently are in flight at the same time if the connector script supports it.
+
     It's likely you want to use the wrapper functions instead of this."""
-    responses = json.loads(await ctx._send_message(json.dumps(req_list)))
+    responses = await ctx._send_request_list(req_list)
     errors: list[ConnectorError] = []
 
     for response in responses:
@@ -271,7 +367,8 @@ async def guarded_read(ctx: BizHawkContext, read_list: Sequence[tuple[int, int,
             if item["type"] != "READ_RESPONSE":
                 raise SyncError(f"Expected response of type READ_RESPONSE or GUARD_RESPONSE but got {item['type']}")
 
-            ret.append(base64.b64decode(item["value"]))
+            value = item["value"]
+            ret.append(value if isinstance(value, bytes) else base64.b64decode(value))
 
     return ret
 
@@ -18,7 +18,10 @@ from . import BizHawkContext, ConnectionStatus, NotConnectedError, RequestFailed
 from .client import BizHawkClient, AutoBizHawkClientRegister
 
 
-EXPECTED_SCRIPT_VERSION = 1
+EXPECTED_SCRIPT_VERSION = 2
+MINIMUM_SCRIPT_VERSION = 1
+"""Connector scripts older than `EXPECTED_SCRIPT_VERSION`, like the mGBA connector, can still be used without pipelined
+requests"""
 
 
 class AuthStatus(enum.IntEnum):
@@ -147,7 +150,7 @@ async def _game_watcher(ctx: BizHawkClientContext):
 
                 script_version = await get_script_version(ctx.bizhawk_ctx)
 
-                if script_version != EXPECTED_SCRIPT_VERSION:
+                if not MINIMUM_SCRIPT_VERSION <= script_version <= EXPECTED_SCRIPT_VERSION:
                     logger.info(f"Connector script is incompatible. Expected version {EXPECTED_SCRIPT_VERSION} but "
                                 f"got {script_version}. Disconnecting.")
                     disconnect(ctx.bizhawk_ctx)
@@ -45,10 +45,9 @@ class ManualClientCommandProcessor(ClientCommandProcessor):
     @mark_raw
     def _cmd_send(self, location_name: str) -> bool:
         """Send a check"""
-        names = self.ctx.location_names_to_id.keys()
         location_name, usable, response = Utils.get_intended_text(
             location_name,
-            names
+            self.ctx.get_name_matcher(self.ctx.location_names_to_id)
         )
         if usable:
             location_id = self.ctx.location_names_to_id[location_name]
@@ -516,6 +516,10 @@ class ALTTPSNIClient(SNIClient):
 
         return True
 
+    def get_read_ranges(self, ctx):
+        # the save data holds the receive queue, the shop and all the location flags read by track_locations
+        return ((WRAM_START + 0x10, 1), (SAVEDATA_START, SAVEDATA_SIZE))
+
     async def game_watcher(self, ctx):
         from SNIClient import snes_read, snes_buffered_write, snes_flush_writes
         gamemode = await snes_read(ctx, WRAM_START + 0x10, 1)
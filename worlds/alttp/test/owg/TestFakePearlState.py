@@ -0,0 +1,18 @@
+from BaseClasses import CollectionState
+from worlds.alttp.UnderworldGlitchRules import fake_pearl_state
+
+from worlds.alttp.test import LTTPTestBase
+
+
+class TestFakePearlState(LTTPTestBase):
+    def setUp(self):
+        self.world_setup()
+
+    def test_state_keeps_pearl_out(self):
+        """Tests that faking the Moon Pearl for a clip doesn't give it to the state the rule was evaluated with."""
+        state = CollectionState(self.multiworld)
+        copy = state.copy()
+        fake_state = fake_pearl_state(copy, 1)
+        self.assertTrue(fake_state.has("Moon Pearl", 1))
+        self.assertFalse(copy.has("Moon Pearl", 1))
+        self.assertFalse(state.has("Moon Pearl", 1))
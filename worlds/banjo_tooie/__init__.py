@@ -61,6 +61,7 @@ class BanjoTooieWorld(World):
     web = BanjoTooieWeb()
     author: str = "jjjj12212"
     topology_present = True
+    track_rule_dependencies = True
     # item_name_to_id = {name: data.btid for name, data in all_item_table.items()}
     item_name_to_id = {}
 
@@ -43,6 +43,7 @@ class BlasphemousWorld(World):
     options: BlasphemousOptions
 
     required_client_version = (0, 4, 7)
+    track_rule_dependencies = True
 
 
     def __init__(self, multiworld, player):
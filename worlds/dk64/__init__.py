@@ -218,6 +218,7 @@ if baseclasses_loaded:
         options_dataclass = DK64Options
         options: DK64Options
         topology_present = False
+        incremental_fill = False  # logic_holder follows collect(), but not remove()
 
         item_name_to_id = {name: data.code for name, data in full_item_table.items()}
         location_name_to_id = all_locations
@@ -135,6 +135,7 @@ class JakAndDaxterWorld(World):
     game = jak1_name
     author: str = "massimilianodelliubaldini"
     required_client_version = (0, 5, 0)
+    incremental_fill = False  # the Reachable Orbs cache depends on the order items were collected in
 
     # Options
     settings: ClassVar[JakAndDaxterSettings]
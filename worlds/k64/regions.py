@@ -15,6 +15,7 @@ class K64Region(Region):
     game = "Kirby 64 - The Crystal Shards"
 
     def copy_ability_sweep(self, state: "CollectionState"):
+        state.unshare(self.player)
         for ability, regions in zip(["Burning Ability", "Stone Ability", "Ice Ability",
                                     "Needle Ability", "Bomb Ability", "Spark Ability", "Cutter Ability"],
                                     [burn_levels, stone_levels, ice_levels,
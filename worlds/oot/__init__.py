@@ -145,6 +145,7 @@ class OOTWorld(World):
     options: OoTOptions
     settings: typing.ClassVar[OOTSettings]
     topology_present: bool = True
+    incremental_fill = False  # age reachability caches are not reset by remove()
     item_name_to_id = {item_name: oot_data_to_ap_id(data, False) for item_name, data in item_table.items() if
                        data[2] is not None and item_name not in {
                         'Keaton Mask', 'Skull Mask', 'Spooky Mask', 'Bunny Hood',
@@ -85,6 +85,7 @@ class PaperMarioWorld(World):
     author: str = "JKB"
     web = PaperMarioWeb()
     topology_present = True
+    incremental_fill = False  # collect() counts Star Pieces that remove() doesn't take back
 
     options_dataclass = PaperMarioOptions
     options: PaperMarioOptions
@@ -621,7 +622,7 @@ class PaperMarioWorld(World):
         def prefill_state(base_state):
             state = base_state.copy()
             for item in self.get_pre_fill_items():
-                self.collect(state, item)
+                state.collect(item, True)
             state.sweep_for_advancements(locations=self.get_locations())
             return state
 
@@ -87,6 +87,11 @@ class SMSNIClient(SNIClient):
         return True
 
 
+    def get_read_ranges(self, ctx):
+        if ctx.server is None or ctx.slot is None:
+            return ()
+        return ((WRAM_START + 0x0998, 1), (SM_SEND_QUEUE_RCOUNT, 4), (SM_RECV_QUEUE_WCOUNT, 2))
+
     async def game_watcher(self, ctx):
         from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
         if ctx.server is None or ctx.slot is None:
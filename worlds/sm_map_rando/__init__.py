@@ -952,6 +952,7 @@ class SMMRRegion(Region):
         if state.stale[self.player]:
             local_world = self.multiworld.worlds[self.player]
             defeated_mother_brain_flag_id = local_world.item_name_to_id["f_DefeatedMotherBrain"] - items_start_id - len(local_world.gamedata.item_isv)
+            state.unshare(self.player)
             rrp = state.reachable_regions[self.player]
             state.stale[self.player] = False
             (bi_reachability, f_reachability, r_reachability, f_traverse, r_traverse) = local_world.map_rando.update_reachability(state.smmrcs[self.player].randomization_state, local_world.debug)